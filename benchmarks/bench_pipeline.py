@@ -0,0 +1,230 @@
+"""Benchmark pipeline data -> indikator -> skor -> IDR -> grafik -> tabel (offline).
+
+Contoh (dari root repo):
+
+    python -m benchmarks.bench_pipeline --save benchmarks/baseline.json
+    python -m benchmarks.bench_pipeline --compare benchmarks/baseline.json --tolerance 0.25
+
+Skenario bawaan: 1 ticker dengan 1k..1M bar, dan 1..1.000 ticker dengan 1k
+bar. Setiap tahap diukur waktunya (terbaik dari beberapa ulangan) lalu
+sekali lagi di bawah tracemalloc untuk puncak memori. Dengan --compare,
+proses keluar dengan kode 1 jika ada tahap yang lebih lambat atau lebih boros
+memori daripada baseline melebihi toleransi.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from gss_quant.fx import convert_price_to_idr
+from gss_quant.incremental import IndicatorState
+from gss_quant.scoring import score_history
+from gss_quant.synthetic import synthetic_universe
+
+USD_IDR = 16000.0
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'EMA_20', 'EMA_50', 'EMA_200', 'BB_UPPER', 'BB_MIDDLE', 'BB_LOWER', 'ATR']
+
+DEFAULT_BAR_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_TICKER_COUNTS = [1, 10, 100, 1_000]
+
+
+# --- TAHAP PIPELINE ---
+# Setiap tahap menerima dict ticker -> DataFrame dan mengembalikan dict untuk tahap berikutnya.
+
+def stage_indicators_batch(frames):
+    from gss_quant.indicators import add_indicators
+    return {t: add_indicators(df.copy()) for t, df in frames.items()}
+
+
+def stage_indicators_universe(frames):
+    from gss_quant.kernels import universe_indicators
+    indicators = universe_indicators(frames)
+    return {t: df.join(indicators[t]) for t, df in frames.items()}
+
+
+def stage_indicators_incremental(frames):
+    return {t: df.join(IndicatorState.from_history(df)[1]) for t, df in frames.items()}
+
+
+def stage_scoring(enriched):
+    return {t: score_history(df, False, USD_IDR) for t, df in enriched.items()}
+
+
+def stage_scoring_rules(enriched):
+    from gss_quant.params import StrategyParams
+    from gss_quant.rules import DEFAULT_RULES, Profile, score_universe
+    profiles = (
+        Profile('default'),
+        Profile('rsi_heavy', DEFAULT_RULES.with_points('rsi_heavy', rsi__oversold=45, rsi__overbought=-35)),
+        Profile('tight', params=StrategyParams(rsi_oversold=25, rsi_overbought=75, adx_trend=30)),
+    )
+    return score_universe(enriched, profiles)
+
+
+def stage_idr(enriched):
+    return {t: convert_price_to_idr(df[PRICE_COLUMNS], False, USD_IDR) for t, df in enriched.items()}
+
+
+def stage_figure(enriched):
+    from gss_quant.views import price_figure
+    return {t: price_figure(df, t) for t, df in enriched.items()}
+
+
+def stage_table(enriched):
+    from gss_quant.views import latest_data_table
+    return {t: latest_data_table(df, False, USD_IDR) for t, df in enriched.items()}
+
+
+# nama -> (fungsi, input, batas total bar; None = tanpa batas)
+STAGES = {
+    'indicators_batch': (stage_indicators_batch, 'raw', None),
+    'indicators_universe': (stage_indicators_universe, 'raw', None),
+    'indicators_incremental': (stage_indicators_incremental, 'raw', 200_000),
+    'scoring': (stage_scoring, 'enriched', None),
+    'scoring_rules': (stage_scoring_rules, 'enriched', None),
+    'idr_conversion': (stage_idr, 'enriched', None),
+    'figure': (stage_figure, 'enriched', 2_000_000),
+    'table': (stage_table, 'enriched', None),
+}
+
+
+def _available(stage):
+    if stage == 'figure':
+        try:
+            import plotly  # noqa: F401
+        except ImportError:
+            return False
+    return True
+
+
+def _freq_for(n_bars):
+    # Bar harian untuk seri pendek; bar per jam agar 1M bar tetap dalam rentang tanggal pandas
+    return 'B' if n_bars <= 50_000 else 'h'
+
+
+def measure(fn, data, repeat):
+    """(detik terbaik, puncak memori MB, hasil) untuk `fn(data)`."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(data)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 2 ** 20, result
+
+
+def run_scenario(n_bars, n_tickers, stages, repeat, seed=0):
+    frames = synthetic_universe(n_tickers, n_bars, seed=seed, freq=_freq_for(n_bars))
+    total_bars = n_bars * n_tickers
+    enriched = None
+    rows = []
+    for stage in STAGES:
+        if stage not in stages:
+            continue
+        fn, source, limit = STAGES[stage]
+        row = {'stage': stage, 'bars': n_bars, 'tickers': n_tickers}
+        if not _available(stage):
+            rows.append({**row, 'skipped': 'dependensi tidak terpasang'})
+            continue
+        if limit is not None and total_bars > limit:
+            rows.append({**row, 'skipped': f'total bar > {limit:,}'})
+            continue
+        if source == 'enriched' and enriched is None:
+            # Tahap hilir butuh kolom indikator walaupun tahap indikator tidak diukur
+            enriched = stage_indicators_universe(frames)
+        seconds, peak_mb, result = measure(fn, frames if source == 'raw' else enriched, repeat)
+        if source == 'raw':
+            enriched = result
+        rows.append({**row, 'seconds': seconds, 'bars_per_sec': total_bars / seconds if seconds else float('inf'),
+                     'peak_mem_mb': peak_mb})
+        print(f"{stage:<24} bars={n_bars:>9,} tickers={n_tickers:>5,}  {seconds * 1000:10.1f} ms"
+              f"  {total_bars / seconds:14,.0f} bar/s  {peak_mb:9.1f} MB", flush=True)
+    return rows
+
+
+def environment():
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Daftar pesan regresi (waktu atau memori) dibanding baseline."""
+    base = {(r['stage'], r['bars'], r['tickers']): r for r in baseline['results'] if 'seconds' in r}
+    regressions = []
+    for r in results:
+        ref = base.get((r['stage'], r['bars'], r['tickers']))
+        if ref is None or 'seconds' not in r:
+            continue
+        for metric in ('seconds', 'peak_mem_mb'):
+            if r[metric] > ref[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{r['stage']} bars={r['bars']} tickers={r['tickers']}: {metric} "
+                    f"{ref[metric]:.4g} -> {r[metric]:.4g} (+{(r[metric] / ref[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def _int_list(text):
+    return [int(float(x)) for x in text.split(',') if x]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bars', type=_int_list, default=DEFAULT_BAR_SIZES, help="ukuran riwayat untuk 1 ticker, mis. 1000,10000")
+    parser.add_argument('--tickers', type=_int_list, default=DEFAULT_TICKER_COUNTS, help="jumlah ticker (masing-masing --universe-bars bar)")
+    parser.add_argument('--universe-bars', type=int, default=1_000)
+    parser.add_argument('--stages', default=','.join(STAGES), help="tahap yang diukur, dipisah koma")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', help="simpan hasil sebagai baseline JSON")
+    parser.add_argument('--compare', help="baseline JSON untuk pengecekan regresi")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="toleransi regresi relatif (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    stages = [s for s in args.stages.split(',') if s]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"tahap tidak dikenal: {', '.join(sorted(unknown))}")
+
+    scenarios = [(n, 1) for n in args.bars] + [(args.universe_bars, n) for n in args.tickers if n != 1]
+    results = []
+    for n_bars, n_tickers in scenarios:
+        results.extend(run_scenario(n_bars, n_tickers, stages, args.repeat))
+
+    report = {'environment': environment(), 'results': results}
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline disimpan ke {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("REGRESI:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"Tidak ada regresi dibanding {args.compare} (toleransi {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
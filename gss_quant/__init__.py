@@ -0,0 +1,49 @@
+"""GSS Quantum Analytics - engine analitik tanpa ketergantungan UI.
+
+Nama publik di bawah di-import saat pertama kali diakses, sehingga
+`import gss_quant` tidak ikut memuat pandas, pyarrow atau yfinance.
+"""
+import importlib
+
+_EXPORTS = {
+    'AlertDaemon': 'gss_quant.alerts',
+    'SignalServer': 'gss_quant.api',
+    'SnapshotBook': 'gss_quant.api',
+    'analyze_signal': 'gss_quant.analysis',
+    'analyze_ticker': 'gss_quant.analysis',
+    'load_market_data': 'gss_quant.analysis',
+    'RollingCorrelation': 'gss_quant.correlation',
+    'convert_price_to_idr': 'gss_quant.fx',
+    'fetch_usd_idr_rate': 'gss_quant.fx',
+    'load_usd_idr_history': 'gss_quant.fx',
+    'usd_idr_at': 'gss_quant.fx',
+    'compute_indicators': 'gss_quant.kernels',
+    'universe_indicators': 'gss_quant.kernels',
+    'DEFAULT_PARAMS': 'gss_quant.params',
+    'StrategyParams': 'gss_quant.params',
+    'LocalFileProvider': 'gss_quant.providers',
+    'YahooProvider': 'gss_quant.providers',
+    'portfolio_risk': 'gss_quant.risk',
+    'Profile': 'gss_quant.rules',
+    'RuleSet': 'gss_quant.rules',
+    'score_profiles': 'gss_quant.rules',
+    'quantum_score': 'gss_quant.scoring',
+    'score_history': 'gss_quant.scoring',
+    'OHLCVStore': 'gss_quant.store',
+    'SharedFrameCache': 'gss_quant.frame_cache',
+    'SignalDatabase': 'gss_quant.signal_db',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'gss_quant' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,5 @@
+import sys
+
+from gss_quant.cli import main
+
+sys.exit(main())
@@ -0,0 +1,181 @@
+"""Kernel indikator Numba (satu lintasan per ticker); di-import oleh `gss_quant.kernels` bila numba tersedia.
+
+Rekursinya identik dengan kelas state di `gss_quant.incremental`, hanya saja
+state disimpan di array kecil agar bisa dikompilasi. Layout parameter `p`:
+ema_fast, ema_mid, ema_long, rsi, macd_fast, macd_slow, macd_signal,
+bb_length, bb_std, adx, atr, volatility_window. Baris `out` mengikuti
+`INDICATOR_COLUMNS`.
+"""
+import math
+import sys
+
+import numba
+import numpy as np
+
+_EPSILON = sys.float_info.epsilon
+_jit = numba.njit(cache=True, nogil=True)
+_inline = numba.njit(cache=True, nogil=True, inline='always')
+
+
+@_inline
+def _ewm_step(st, alpha, x):
+    # st[0] = nilai tertimbang, st[1] = bobot lama (rekursi ewm(adjust=False) pandas)
+    w = st[0]
+    if w == w:
+        st[1] *= 1.0 - alpha
+        if x == x:
+            if w != x:
+                st[0] = (st[1] * w + alpha * x) / (st[1] + alpha)
+            st[1] = 1.0
+    elif x == x:
+        st[0] = x
+    return st[0]
+
+
+@_inline
+def _seeded_step(st, length, alpha, x):
+    # st[2] = jumlah bar seed yang sudah dilihat, st[3] / st[4] = jumlah dan cacah nilai valid seed
+    if st[2] < length:
+        st[2] += 1
+        if x == x:
+            st[3] += x
+            st[4] += 1
+        if st[2] < length:
+            return np.nan
+        x = st[3] / st[4] if st[4] > 0 else np.nan
+    return _ewm_step(st, alpha, x)
+
+
+@_inline
+def _rolling_step(st, buf, x):
+    # st = [cacah valid, mean, M2, terisi, posisi tulis]; Welford geser seperti RollingStats
+    window = buf.shape[0]
+    pos = int(st[4])
+    if st[3] == window:
+        old = buf[pos]
+        if old == old:
+            st[0] -= 1
+            if st[0] == 0:
+                st[1] = 0.0
+                st[2] = 0.0
+            else:
+                delta = old - st[1]
+                st[1] -= delta / st[0]
+                st[2] -= delta * (old - st[1])
+    else:
+        st[3] += 1
+    buf[pos] = x
+    st[4] = (pos + 1) % window
+    if x == x:
+        st[0] += 1
+        delta = x - st[1]
+        st[1] += delta / st[0]
+        st[2] += delta * (x - st[1])
+
+
+@_inline
+def _rolling_mean(st, window):
+    return st[1] if st[0] >= window else np.nan
+
+
+@_inline
+def _rolling_std(st, window):
+    if st[0] < window or st[0] <= 1:
+        return np.nan
+    return math.sqrt(max(st[2], 0.0) / (st[0] - 1))
+
+
+@_inline
+def _new_state():
+    st = np.zeros(5)
+    st[0] = np.nan
+    st[1] = 1.0
+    return st
+
+
+@_jit
+def fused_row(high, low, close, p, out):
+    """Semua indikator dashboard untuk satu ticker dalam satu lintasan; hasil ditulis ke `out` (12, n)."""
+    ema_fast, ema_mid, ema_long = int(p[0]), int(p[1]), int(p[2])
+    rsi_len, macd_fast, macd_slow, macd_sig = int(p[3]), int(p[4]), int(p[5]), int(p[6])
+    bb_len, bb_std, adx_len, atr_len, vol_len = int(p[7]), p[8], int(p[9]), int(p[10]), int(p[11])
+
+    s_ema_fast, s_ema_mid, s_ema_long = _new_state(), _new_state(), _new_state()
+    s_rsi_pos, s_rsi_neg = _new_state(), _new_state()
+    s_macd_fast, s_macd_slow, s_macd_sig = _new_state(), _new_state(), _new_state()
+    s_atr, s_adx_atr = _new_state(), _new_state()
+    s_dm_pos, s_dm_neg, s_adx = _new_state(), _new_state(), _new_state()
+    s_bb, s_vol = np.zeros(5), np.zeros(5)
+    buf_bb, buf_vol = np.empty(bb_len), np.empty(vol_len)
+
+    prev_close = prev_high = prev_low = np.nan
+    for t in range(close.shape[0]):
+        h, l, c = high[t], low[t], close[t]
+
+        out[0, t] = _seeded_step(s_ema_fast, ema_fast, 2.0 / (ema_fast + 1), c)
+        out[1, t] = _seeded_step(s_ema_mid, ema_mid, 2.0 / (ema_mid + 1), c)
+        out[2, t] = _seeded_step(s_ema_long, ema_long, 2.0 / (ema_long + 1), c)
+
+        change = c - prev_close
+        pos = (change if change > 0.0 else 0.0) if change == change else np.nan
+        neg = (change if change < 0.0 else 0.0) if change == change else np.nan
+        pos_avg = _ewm_step(s_rsi_pos, 1.0 / rsi_len, pos)
+        neg_avg = _ewm_step(s_rsi_neg, 1.0 / rsi_len, neg)
+        denom = pos_avg + abs(neg_avg)
+        out[3, t] = 100 * pos_avg / denom if denom != 0 else np.nan
+
+        macd = _seeded_step(s_macd_fast, macd_fast, 2.0 / (macd_fast + 1), c) \
+            - _seeded_step(s_macd_slow, macd_slow, 2.0 / (macd_slow + 1), c)
+        out[4, t] = macd
+        if macd == macd or s_macd_sig[2] > 0:
+            out[5, t] = _seeded_step(s_macd_sig, macd_sig, 2.0 / (macd_sig + 1), macd)
+        else:
+            out[5, t] = np.nan
+
+        _rolling_step(s_bb, buf_bb, c)
+        mid = _rolling_mean(s_bb, bb_len)
+        deviation = _rolling_std(s_bb, bb_len)
+        out[6, t] = mid + bb_std * deviation
+        out[7, t] = mid
+        out[8, t] = mid - bb_std * deviation
+
+        _rolling_step(s_vol, buf_vol, c)
+        out[10, t] = _rolling_std(s_vol, vol_len)
+
+        # True Range: bar pertama memakai High-Low (ATR) atau NaN (ATR internal ADX)
+        if prev_close == prev_close:
+            true_range = abs(h - l)
+            if abs(h - prev_close) > true_range:
+                true_range = abs(h - prev_close)
+            if abs(prev_close - l) > true_range:
+                true_range = abs(prev_close - l)
+        else:
+            true_range = np.nan
+        out[11, t] = _seeded_step(s_atr, atr_len, 1.0 / atr_len, abs(h - l) if true_range != true_range else true_range)
+
+        adx_atr = _seeded_step(s_adx_atr, adx_len, 1.0 / adx_len, true_range)
+        up = h - prev_high
+        dn = prev_low - l
+        if up == up and dn == dn:
+            pos_dm = up if (up > dn and up > 0) else 0.0
+            neg_dm = dn if (dn > up and dn > 0) else 0.0
+            if abs(pos_dm) < _EPSILON:
+                pos_dm = 0.0
+            if abs(neg_dm) < _EPSILON:
+                neg_dm = 0.0
+        else:
+            pos_dm = neg_dm = np.nan
+        k = 100 / adx_atr if (adx_atr == adx_atr and adx_atr != 0) else np.nan
+        dmp = k * _ewm_step(s_dm_pos, 1.0 / adx_len, pos_dm)
+        dmn = k * _ewm_step(s_dm_neg, 1.0 / adx_len, neg_dm)
+        dx = 100 * abs(dmp - dmn) / (dmp + dmn) if (dmp + dmn) != 0 else np.nan
+        out[9, t] = _ewm_step(s_adx, 1.0 / adx_len, dx)
+
+        prev_close, prev_high, prev_low = c, h, l
+
+
+@numba.njit(cache=True, nogil=True, parallel=True)
+def fused_panel(high, low, close, p, out):
+    """`fused_row` untuk setiap baris (ticker) array 2-D, paralel antar ticker; `out` berbentuk (12, tickers, bars)."""
+    for i in numba.prange(close.shape[0]):
+        fused_row(high[i], low[i], close[i], p, out[:, i, :])
@@ -0,0 +1,310 @@
+"""Daemon alert tanpa UI: scan universe terjadwal, riwayat sinyal di SQLite, alert lewat sink.
+
+Satu siklus (`AlertDaemon.run_cycle`):
+
+1. Bar baru diunduh per batch multi-ticker (satu permintaan per `batch_size`
+   ticker) dan digabung ke store; ticker yang belum punya data diisi
+   sepanjang `seed_period`.
+2. Begitu batch tiba, `analyze_ticker` dijalankan per ticker di pool worker
+   memakai data tersimpan (indikator diperbarui inkremental).
+3. Semua hasil dan alert baru ditulis ke SQLite dalam satu transaksi.
+4. Alert yang belum terkirim diteruskan ke setiap sink, lalu ditandai terkirim.
+
+Siklus dibatasi `budget` detik: ticker yang belum selesai saat anggaran habis
+dilaporkan sebagai `timeout` dan dicoba lagi di siklus berikutnya. Hasil scan
+dibandingkan dengan baris terakhir yang tercatat untuk ticker itu, termasuk
+scan sebelumnya atas bar yang masih berjalan. Karena baris sinyal unik per
+(ticker, bar) dan alert unik per (ticker, bar, jenis, scan pembanding),
+menjalankan ulang siklus tidak menggandakan riwayat maupun alert.
+"""
+import json
+import logging
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from gss_quant import telemetry
+from gss_quant.analysis import analyze_ticker
+from gss_quant.fx import FALLBACK_USD_IDR, load_usd_idr_history
+from gss_quant.market_hours import infer_asset_type, is_market_open
+from gss_quant.params import DEFAULT_PARAMS
+from gss_quant.retry import call_with_retry
+from gss_quant.signal_db import SignalDatabase
+
+logger = logging.getLogger(__name__)
+
+SIGNAL_CHANGE = 'signal'
+CONFIDENCE_CHANGE = 'confidence'
+CONFIDENCE_NAMES = {1: "Rendah", 2: "Sedang", 3: "Tinggi"}
+
+
+def detect_alerts(previous, current):
+    """Alert untuk satu ticker dari baris sinyal sebelumnya ke baris saat ini.
+
+    Label sinyal yang berubah berarti skor melewati salah satu ambang
+    (`StrategyParams`). Ticker tanpa riwayat tidak menghasilkan alert.
+    `previous_scan` (waktu scan `previous`) membedakan transisi berulang
+    dalam satu bar yang masih berjalan.
+    """
+    if previous is None:
+        return []
+    alerts = []
+    base = {'ticker': current['ticker'], 'bar_time': current['bar_time'], 'previous_scan': previous.get('scanned_at', '')}
+    if previous['signal'] != current['signal']:
+        alerts.append({
+            **base, 'kind': SIGNAL_CHANGE, 'previous': previous['signal'], 'current': current['signal'],
+            'message': f"{current['ticker']}: sinyal {previous['signal']} -> {current['signal']} "
+                       f"(skor {previous['score']} -> {current['score']})",
+        })
+    if previous['confidence'] != current['confidence']:
+        before = CONFIDENCE_NAMES.get(previous['confidence'], previous['confidence'])
+        after = CONFIDENCE_NAMES.get(current['confidence'], current['confidence'])
+        alerts.append({
+            **base, 'kind': CONFIDENCE_CHANGE, 'previous': str(previous['confidence']),
+            'current': str(current['confidence']),
+            'message': f"{current['ticker']}: kepercayaan {before} -> {after} ({current['signal']}, skor {current['score']})",
+        })
+    return alerts
+
+
+# --- SINK ALERT ---
+
+class AlertSink:
+    """Tujuan pengiriman alert. `send` menerima list dict alert dan melempar exception jika gagal."""
+    name = "base"
+
+    def send(self, alerts):
+        raise NotImplementedError
+
+
+class StdoutSink(AlertSink):
+    """Satu baris teks per alert ke stdout."""
+    name = "stdout"
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def send(self, alerts):
+        for alert in alerts:
+            self.stream.write(f"[{alert['bar_time']}] {alert['message']}\n")
+        self.stream.flush()
+
+
+class FileSink(AlertSink):
+    """Tambahkan alert sebagai JSON Lines ke `path`."""
+    name = "file"
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def send(self, alerts):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open('a', encoding='utf-8') as f:
+            for alert in alerts:
+                f.write(json.dumps(alert, ensure_ascii=False) + "\n")
+
+
+class WebhookSink(AlertSink):
+    """POST `{"alerts": [...]}` sebagai JSON ke `url` (mis. penerima webhook lokal)."""
+    name = "webhook"
+
+    def __init__(self, url, timeout=5.0):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, alerts):
+        body = json.dumps({'alerts': alerts}, ensure_ascii=False).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body, headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+def build_sink(spec):
+    """Sink dari teks: "stdout", "file:<path>" atau URL http(s)."""
+    if spec == 'stdout':
+        return StdoutSink()
+    if spec.startswith('file:'):
+        return FileSink(spec[len('file:'):])
+    if spec.startswith(('http://', 'https://')):
+        return WebhookSink(spec)
+    raise ValueError(f"Sink tidak dikenal: {spec!r} (pakai stdout, file:<path> atau URL http)")
+
+
+# --- SCAN ---
+
+def sync_batch(store, tickers, interval="1d", update_period="5d", seed_period="2y"):
+    """Perbarui store untuk satu batch ticker dengan paling banyak dua permintaan multi-ticker.
+
+    Ticker yang sudah tersimpan hanya mengambil `update_period` terakhir; jika
+    hasilnya tidak menyambung ke bar tersimpan (daemon lama mati), ticker itu
+    diperbarui sendiri lewat `store.refresh`.
+    """
+    last_bars = {}
+    for ticker in tickers:
+        stored = store.load(ticker, interval)
+        last_bars[ticker] = None if stored.empty else stored.index[-1]
+    seeded = [t for t in tickers if last_bars[t] is not None]
+    unseeded = [t for t in tickers if last_bars[t] is None]
+
+    for group, period in ((seeded, update_period), (unseeded, seed_period)):
+        if not group:
+            continue
+        frames = call_with_retry(store.provider.fetch_many, group, interval=interval, period=period)
+        for ticker in group:
+            bars = frames.get(ticker)
+            if bars is None or bars.empty:
+                continue
+            last = last_bars[ticker]
+            if last is not None and bars.index[0] > last:
+                store.refresh(ticker, interval)
+            else:
+                store.append(ticker, bars, interval)
+
+
+class AlertDaemon:
+    """Scan `tickers` berkala, simpan riwayat ke `db` dan kirim alert ke `sinks`.
+
+    `store` adalah `OHLCVStore` (sebaiknya dengan `ThrottledProvider`);
+    `gold_tickers` dikonversi ke IDR per gram. Ticker yang pasarnya tutup dan
+    sudah punya riwayat dilewati.
+    """
+
+    def __init__(self, store, db, tickers, sinks=(), gold_tickers=frozenset(), interval="1d", period="1y",
+                 budget=240.0, workers=8, batch_size=50, params=DEFAULT_PARAMS, close_grace=timedelta(minutes=20)):
+        self.store = store
+        self.db = db if isinstance(db, SignalDatabase) else SignalDatabase(db)
+        self.tickers = list(dict.fromkeys(tickers))
+        self.sinks = list(sinks)
+        self.gold_tickers = frozenset(gold_tickers)
+        self.interval = interval
+        self.period = period
+        self.budget = budget
+        self.batch_size = batch_size
+        self.params = params
+        self.close_grace = close_grace
+        # Satu pool untuk seluruh umur daemon: pekerjaan yang melewati anggaran
+        # tidak menumpuk thread baru di siklus berikutnya
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='gss-alerts')
+        self._stop = threading.Event()
+
+    def _usd_idr(self):
+        try:
+            return load_usd_idr_history(self.store)
+        except Exception:
+            logger.warning("Kurs USD/IDR tidak tersedia, memakai kurs cadangan", exc_info=True)
+            return FALLBACK_USD_IDR
+
+    def _due(self, known):
+        now = datetime.now(timezone.utc)
+        return [t for t in self.tickers
+                if t not in known or is_market_open(infer_asset_type(t), now, self.close_grace)]
+
+    def analyze(self, ticker, usd_idr_rate):
+        """Ringkasan sinyal satu ticker dari data tersimpan (dijalankan di pool worker)."""
+        return analyze_ticker(self.store, ticker, usd_idr_rate, is_gold=ticker in self.gold_tickers,
+                              period=self.period, interval=self.interval, params=self.params, fetch=False)
+
+    def publish(self, rows):
+        """Dipanggil dengan baris sinyal siklus ini setelah tersimpan; subclass dapat meneruskannya."""
+
+    def scan(self, tickers, usd_idr_rate, deadline):
+        """Hasil `analyze` per ticker (dict) dan dict ticker -> pesan galat, dibatasi `deadline`."""
+        results, errors = [], {}
+        batches = [tickers[i:i + self.batch_size] for i in range(0, len(tickers), self.batch_size)]
+        pending = {
+            self._pool.submit(sync_batch, self.store, batch, self.interval): ('sync', batch)
+            for batch in batches
+        }
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop.is_set():
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, payload = pending.pop(future)
+                if kind == 'sync':
+                    if future.exception() is not None:
+                        # Data tersimpan tetap dianalisis; baris yang sama ditimpa, bukan digandakan
+                        logger.warning("Gagal memperbarui batch %s..%s: %s", payload[0], payload[-1], future.exception())
+                    for ticker in payload:
+                        pending[self._pool.submit(self.analyze, ticker, usd_idr_rate)] = ('analyze', ticker)
+                    continue
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    errors[payload] = str(e)
+
+        for future, (kind, payload) in pending.items():
+            future.cancel()
+            for ticker in (payload if kind == 'sync' else [payload]):
+                errors[ticker] = 'timeout'
+        return results, errors
+
+    def deliver(self):
+        """Kirim alert yang belum terkirim ke setiap sink; kembalikan jumlah yang terkirim."""
+        alerts = self.db.pending_alerts()
+        if not alerts or not self.sinks:
+            return 0
+        payload = [{k: a[k] for k in ('ticker', 'bar_time', 'kind', 'previous', 'current', 'message')} for a in alerts]
+        for sink in self.sinks:
+            try:
+                sink.send(payload)
+            except Exception:
+                # Tetap tertunda: dikirim ulang (ke semua sink) di siklus berikutnya
+                logger.warning("Sink %s gagal mengirim %d alert", sink.name, len(payload), exc_info=True)
+                return 0
+        self.db.mark_delivered(alerts)
+        return len(alerts)
+
+    def run_cycle(self):
+        """Jalankan satu siklus lengkap dan kembalikan ringkasannya (dict)."""
+        started = time.monotonic()
+        deadline = started + self.budget
+        known = self.db.latest_signals()
+        due = self._due(known)
+        usd_idr = self._usd_idr()
+        with telemetry.span('alert_scan', tickers=len(due)):
+            results, errors = self.scan(due, usd_idr, deadline)
+
+        rows = [{**r, 'bar_time': r['last_bar']} for r in results]
+        # Dibandingkan dengan keadaan terakhir yang tercatat (bisa bar yang sama bila
+        # bar masih berjalan), sehingga setiap ambang yang dilewati memicu alert
+        alerts = [alert for row in rows for alert in detect_alerts(known.get(row['ticker']), row)]
+        new_alerts = self.db.record_cycle(rows, alerts)
+        self.publish(rows)
+        delivered = self.deliver()
+
+        summary = {
+            'scanned': len(due),
+            'skipped_closed': len(self.tickers) - len(due),
+            'recorded': len(rows),
+            'errors': sum(1 for e in errors.values() if e != 'timeout'),
+            'timeouts': sum(1 for e in errors.values() if e == 'timeout'),
+            'new_alerts': new_alerts,
+            'delivered': delivered,
+            'seconds': round(time.monotonic() - started, 2),
+        }
+        logger.info("Siklus alert: %s", summary)
+        return summary
+
+    def run_forever(self, every=300.0):
+        """Jalankan siklus setiap `every` detik (dihitung dari awal siklus) sampai `stop`."""
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.run_cycle()
+            except Exception:
+                logger.exception("Siklus alert gagal")
+            self._stop.wait(max(0.0, every - (time.monotonic() - started)))
+
+    def stop(self):
+        self._stop.set()
+
+    def close(self):
+        self.stop()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.db.close()
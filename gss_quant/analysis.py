@@ -0,0 +1,245 @@
+"""Analisis sinyal satu aset tanpa ketergantungan UI (dipakai dashboard dan CLI)."""
+import math
+
+import pandas as pd
+
+from gss_quant import telemetry
+from gss_quant.fx import convert_price_to_idr, usd_idr_at
+from gss_quant.incremental import refresh_indicators
+from gss_quant.params import DEFAULT_PARAMS
+from gss_quant.providers import slice_period
+from gss_quant.scoring import score_history, signal_labels
+
+
+def load_market_data(store, ticker, period="1y", interval="1d", params=DEFAULT_PARAMS, fetch=True):
+    """OHLCV + indikator teknikal (basis USD) sepanjang `period`, atau None jika kosong.
+
+    Riwayat penuh dan state indikator disimpan di `store`; hanya bar baru yang
+    diunduh dan dihitung. Dengan `fetch=False` hanya data tersimpan yang dipakai.
+    """
+    history = refresh_indicators(store, ticker, interval, params, fetch=fetch)
+    df = slice_period(history, period).copy()
+    if df.empty:
+        return None
+    telemetry.record_frame_memory(ticker, df)
+    return df
+
+
+def analyze_signal(df, asset_is_gold, usd_idr_rate, params=DEFAULT_PARAMS):
+    """Analisis Sinyal Dinamis dengan integrasi nilai IDR dan Confidence Level.
+
+    `usd_idr_rate` boleh skalar atau seri kurs historis; nilai IDR memakai kurs
+    pada bar yang bersangkutan.
+    """
+    if df is None: return 50, ["Data tidak tersedia"], 0.0, 0.0, 0
+
+    last = df.iloc[-1]
+    prev = df.iloc[-2]
+
+    score = 0
+    reasons = []
+    confidence_points = 0 # Tambahkan variabel untuk menghitung kepercayaan
+
+    volatility = last['VOLATILITY_30D'] if pd.notna(last['VOLATILITY_30D']) else 0.0
+    adx_value = last['ADX'] if pd.notna(last['ADX']) else 0.0
+    atr_value = last['ATR'] if pd.notna(last['ATR']) else 0.0
+
+    # Konversi harga dan indikator ke IDR untuk digunakan dalam logika dan alasan
+    prev_rate, usd_idr_rate = usd_idr_at(df.index[-2:], usd_idr_rate)
+    price_now_idr = convert_price_to_idr(last['Close'], asset_is_gold, usd_idr_rate)
+    ema200_idr = convert_price_to_idr(last['EMA_200'], asset_is_gold, usd_idr_rate)
+    bb_upper_idr = convert_price_to_idr(last['BB_UPPER'], asset_is_gold, usd_idr_rate) if pd.notna(last['BB_UPPER']) else 0
+    bb_lower_idr = convert_price_to_idr(last['BB_LOWER'], asset_is_gold, usd_idr_rate) if pd.notna(last['BB_LOWER']) else 0
+    atr_value_idr = convert_price_to_idr(atr_value, asset_is_gold, usd_idr_rate)
+    volatility_idr = convert_price_to_idr(volatility, asset_is_gold, usd_idr_rate)
+
+    # 1. ANALISIS TREN (EMA)
+    price_now = last['Close']
+    ema200 = last['EMA_200']
+
+    if pd.isna(ema200):
+        reasons.append("Data EMA 200 belum cukup.")
+    else:
+        if price_now > ema200:
+            gap = ((price_now - ema200) / ema200) * 100
+            score += 25
+            reasons.append(f"Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}) berada {gap:.1f}% DI ATAS garis tren jangka panjang (EMA 200: ${ema200:.2f} / Rp {ema200_idr:,.0f}). Pasar Bullish.")
+            if last['EMA_50'] > ema200: # Konfirmasi tren menengah
+                confidence_points += 1
+                reasons.append("  -> EMA 50 > EMA 200, konfirmasi tren menengah naik.")
+        else:
+            gap = ((ema200 - price_now) / ema200) * 100
+            score -= 25
+            reasons.append(f"Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}) berada {gap:.1f}% DI BAWAH garis tren jangka panjang (EMA 200: ${ema200:.2f} / Rp {ema200_idr:,.0f}). Pasar Bearish.")
+            if last['EMA_50'] < ema200: # Konfirmasi tren menengah
+                confidence_points += 1
+                reasons.append("  -> EMA 50 < EMA 200, konfirmasi tren menengah turun.")
+
+    # Golden Cross / Death Cross (telah dihitung dalam EMA)
+    if pd.notna(last['EMA_50']) and pd.notna(last['EMA_200']):
+        if last['EMA_50'] > last['EMA_200']:
+            score += 15
+        elif last['EMA_50'] < last['EMA_200']:
+            score -= 10
+
+    # 2. ANALISIS MOMENTUM (RSI)
+    rsi = last['RSI']
+    if pd.isna(rsi):
+        reasons.append("Data RSI tidak tersedia.")
+    else:
+        if rsi < params.rsi_oversold:
+            score += 35
+            reasons.append(f"RSI Sangat Murah (Oversold) di level {rsi:.1f}. Potensi pantulan harga tinggi! Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
+            confidence_points += 1 # Oversold adalah sinyal kuat
+        elif rsi > params.rsi_overbought:
+            score -= 25
+            reasons.append(f"RSI Sangat Mahal (Overbought) di level {rsi:.1f}. Hati-hati koreksi. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
+            confidence_points += 1 # Overbought adalah sinyal kuat
+        elif params.rsi_oversold <= rsi <= 50:
+            score += 10
+            reasons.append(f"RSI di level {rsi:.1f} (Zona Akumulasi). Masih aman untuk masuk. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
+        else: # 50-70
+            score += 5
+            reasons.append(f"RSI di level {rsi:.1f} (Zona Pertumbuhan). Momentum positif. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
+
+    # 3. MACD Dynamic
+    macd_val = last['MACD']
+    macd_sig = last['MACD_SIGNAL']
+    if pd.isna(macd_val) or pd.isna(macd_sig):
+         reasons.append("Data MACD tidak tersedia.")
+    else:
+        if macd_val > macd_sig:
+            score += 20
+            reasons.append(f"MACD Line ({macd_val:.2f}) di atas Signal ({macd_sig:.2f}). Momentum beli aktif. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
+            confidence_points += 1 # MACD crossover adalah sinyal kuat
+        else:
+            score -= 20
+            reasons.append(f"MACD Line ({macd_val:.2f}) di bawah Signal ({macd_sig:.2f}). Tekanan jual masih ada. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
+            confidence_points += 1 # MACD crossover adalah sinyal kuat
+
+    # --- INOVASI SEBELUMNYA: Logika dari Indikator Baru ---
+    # 4. Bollinger Bands
+    if pd.notna(last['BB_UPPER']) and pd.notna(last['BB_LOWER']):
+        if price_now > last['BB_UPPER']:
+            score -= 30
+            reasons.append(f"Harga MENEMBUS Band Atas (${last['BB_UPPER']:.2f} / Rp {bb_upper_idr:,.0f}). Potensi overbought, koreksi mungkin terjadi.")
+            confidence_points += 1 # Breakout atas adalah sinyal kuat
+        elif price_now < last['BB_LOWER']:
+            score += 30
+            reasons.append(f"Harga MENEMBUS Band Bawah (${last['BB_LOWER']:.2f} / Rp {bb_lower_idr:,.0f}). Potensi oversold, bounce mungkin terjadi.")
+            confidence_points += 1 # Breakout bawah adalah sinyal kuat
+        else:
+            reasons.append(f"Harga berada di dalam Bollinger Bands. Rentang normal (${last['BB_LOWER']:.2f} - ${last['BB_UPPER']:.2f} / Rp {bb_lower_idr:,.0f} - Rp {bb_upper_idr:,.0f}).")
+
+    # 5. ADX (Kekuatan Tren)
+    if adx_value > params.adx_trend:
+        if abs(score) > 20: # Jika skor sudah menunjukkan arah jelas
+            score = int(max(0, min(100, (50 + score) * 1.1))) # Perkuat sinyal karena tren kuat
+            reasons.append(f"ADX menunjukkan tren sangat kuat (>{adx_value:.1f}). Sinyal dipertegas.")
+            confidence_points += 1 # Tren kuat meningkatkan kepercayaan
+        else:
+            reasons.append(f"ADX menunjukkan tren sedang ({adx_value:.1f}). Harap konfirmasi sinyal lain.")
+    else:
+        reasons.append(f"ADX menunjukkan tren lemah ({adx_value:.1f}). Sinyal bisa jadi tidak akurat.")
+        # Tidak menambah confidence_points karena tren lemah
+
+
+    # --- INOVASI: Logika berdasarkan ATR ---
+    # 6. ATR (Average True Range / Volatilitas)
+    if atr_value > 0:
+        prev_close_idr = convert_price_to_idr(prev['Close'], asset_is_gold, prev_rate)
+        price_change_abs = abs(price_now - prev['Close'])
+        price_change_abs_idr = abs(price_now_idr - prev_close_idr)
+        if price_change_abs > atr_value:
+            reasons.append(f"Pergerakan harga (${price_change_abs:.2f} / Rp {price_change_abs_idr:,.0f}) MELEBIHI ATR (${atr_value:.2f} / Rp {atr_value_idr:.0f}), menunjukkan aktivitas tinggi.")
+        elif price_change_abs < atr_value * 0.5:
+            reasons.append(f"Pergerakan harga (${price_change_abs:.2f} / Rp {price_change_abs_idr:,.0f}) di bawah separuh ATR, menunjukkan konsolidasi.")
+        reasons.append(f"Level volatilitas saat ini (ATR 14d): ${atr_value:.2f} / Rp {atr_value_idr:.0f}. Ini penting untuk manajemen risiko (Stop-Loss).")
+
+
+    # Normalisasi Score 0-100 (akhir setelah semua modifikasi)
+    final_score = max(0, min(100, 50 + score))
+
+    # --- INOVASI: Hitung Tingkat Kepercayaan ---
+    # Misalnya, 0-2 poin = Rendah, 3-4 = Sedang, 5+ = Tinggi
+    if confidence_points >= 5:
+        confidence_level = 3 # Tinggi
+    elif confidence_points >= 3:
+        confidence_level = 2 # Sedang
+    else:
+        confidence_level = 1 # Rendah
+
+    return final_score, reasons, volatility_idr, atr_value_idr, confidence_level
+
+
+def _json_number(value):
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def summarize_signal(df, ticker, usd_idr_rate, is_gold=False, params=DEFAULT_PARAMS):
+    """Ringkasan sinyal bar terakhir `df` (OHLCV + indikator) sebagai dict yang bisa langsung di-dump ke JSON."""
+    score, reasons, volatility_idr, atr_idr, confidence_level = analyze_signal(df, is_gold, usd_idr_rate, params)
+    risk = score_history(df.tail(1), is_gold, usd_idr_rate, params)['RISK'].iloc[-1]
+    last_close, prev_close = df['Close'].iloc[-1], df['Close'].iloc[-2]
+    last_rate = usd_idr_at(df.index[-1:], usd_idr_rate)[0]
+    return {
+        'ticker': ticker,
+        'last_bar': df.index[-1].isoformat(),
+        'score': int(score),
+        'signal': str(signal_labels([score], params)[0]),
+        'confidence': int(confidence_level),
+        'risk': str(risk),
+        'close_usd': _json_number(last_close),
+        'close_idr': _json_number(convert_price_to_idr(last_close, is_gold, last_rate)),
+        'change_pct': _json_number((last_close - prev_close) / prev_close * 100),
+        'usd_idr': float(last_rate),
+        'rsi': _json_number(df['RSI'].iloc[-1]),
+        'adx': _json_number(df['ADX'].iloc[-1]),
+        'volatility_idr': _json_number(volatility_idr),
+        'atr_idr': _json_number(atr_idr),
+        'reasons': reasons,
+    }
+
+
+def analyze_ticker(store, ticker, usd_idr_rate, is_gold=False, period="1y", interval="1d",
+                   params=DEFAULT_PARAMS, fetch=True):
+    """Ringkasan sinyal bar terakhir `ticker` sebagai dict yang bisa langsung di-dump ke JSON."""
+    df = load_market_data(store, ticker, period, interval, params, fetch=fetch)
+    if df is None or len(df) < 2:
+        raise ValueError(f"Data kosong untuk {ticker}")
+    return summarize_signal(df, ticker, usd_idr_rate, is_gold, params)
+
+
+# Kolom bar terakhir di snapshot: harga dalam USD dan IDR, osilator apa adanya
+SNAPSHOT_PRICE_COLUMNS = ['Close', 'EMA_20', 'EMA_50', 'EMA_200', 'BB_UPPER', 'BB_MIDDLE', 'BB_LOWER', 'ATR', 'VOLATILITY_30D']
+SNAPSHOT_PLAIN_COLUMNS = ['RSI', 'MACD', 'MACD_SIGNAL', 'ADX']
+
+
+def signal_snapshot(df, ticker, usd_idr_rate, is_gold=False, params=DEFAULT_PARAMS, history_bars=250):
+    """`summarize_signal` ditambah indikator bar terakhir (USD & IDR) dan riwayat skor.
+
+    `history` berisi `history_bars` bar terakhir, terbaru lebih dulu; harga IDR
+    memakai kurs pada tanggal bar masing-masing.
+    """
+    snapshot = summarize_signal(df, ticker, usd_idr_rate, is_gold, params)
+    last = df.iloc[-1]
+    rate = snapshot['usd_idr']
+    snapshot['indicators'] = {
+        'usd': {c.lower(): _json_number(last[c]) for c in SNAPSHOT_PRICE_COLUMNS + SNAPSHOT_PLAIN_COLUMNS},
+        'idr': {c.lower(): _json_number(convert_price_to_idr(last[c], is_gold, rate)) for c in SNAPSHOT_PRICE_COLUMNS},
+    }
+
+    # Skor dihitung per baris dan warm-up indikator sudah ada di kolomnya, jadi cukup bar yang dilaporkan
+    recent = df.tail(history_bars)
+    history = score_history(recent, is_gold, usd_idr_rate, params)
+    close = recent['Close'].to_numpy(dtype=float)
+    close_idr = convert_price_to_idr(close, is_gold, usd_idr_at(history.index, usd_idr_rate))
+    labels = signal_labels(history['SCORE'].to_numpy(), params)
+    rows = zip(history.index, history['SCORE'], labels, history['CONFIDENCE'], history['RISK'], close, close_idr)
+    snapshot['history'] = [
+        {'bar_time': t.isoformat(), 'score': int(score), 'signal': str(label), 'confidence': int(confidence),
+         'risk': str(risk), 'close_usd': _json_number(usd), 'close_idr': _json_number(idr)}
+        for t, score, label, confidence, risk, usd, idr in rows
+    ][::-1]
+    return snapshot
@@ -0,0 +1,291 @@
+"""API JSON read-only untuk sinyal, dilayani dari snapshot yang sudah dihitung.
+
+Jalur permintaan tidak pernah memanggil `analyze_signal` maupun provider data:
+
+- `SnapshotDaemon` (turunan `AlertDaemon`) memperbarui store dan menghitung
+  snapshot per ticker di thread latar. Siklus pertama mencakup semua ticker;
+  sesudahnya hanya ticker yang pasarnya buka atau baru tutup, sehingga
+  snapshot bar terakhir difinalkan saat bar ditutup lalu tidak dihitung ulang.
+- `SnapshotBook` menyimpan body JSON yang sudah di-encode beserta ETag-nya
+  dan diganti utuh setiap publikasi (copy-on-write); pembaca tidak memakai lock.
+- `SignalServer` adalah server HTTP/1.1 asyncio minimal (keep-alive,
+  pipelining, GET/HEAD) yang hanya menyalin byte dari snapshot.
+
+Rute:
+
+    GET /signal/<ticker>            ringkasan, alasan dan indikator USD/IDR bar terakhir
+    GET /signal?tickers=A,B,C       banyak ticker sekaligus: {"signals": [...], "missing": [...]}
+    GET /screener                   ringkasan semua ticker, skor tertinggi lebih dulu
+    GET /history/<ticker>?limit=N   riwayat skor per bar, terbaru lebih dulu
+    GET /health
+
+Respons 200 membawa ETag; `If-None-Match` yang cocok dijawab 304 tanpa body.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import namedtuple
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from gss_quant import telemetry
+from gss_quant.alerts import AlertDaemon
+from gss_quant.analysis import load_market_data, signal_snapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+HISTORY_BARS = 250
+MAX_BATCH = 500
+MAX_HEADER_BYTES = 16 * 1024
+SCREENER_FIELDS = ['ticker', 'last_bar', 'score', 'signal', 'confidence', 'risk', 'close_usd', 'close_idr', 'change_pct']
+
+_REASONS = {
+    200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    431: 'Request Header Fields Too Large', 503: 'Service Unavailable',
+}
+
+Encoded = namedtuple('Encoded', 'body etag')
+_State = namedtuple('_State', 'signals histories screener updated_at')
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), allow_nan=False).encode('utf-8')
+
+
+def _etag(*parts):
+    digest = hashlib.blake2b(digest_size=10)
+    for part in parts:
+        digest.update(part)
+    return f'"{digest.hexdigest()}"'
+
+
+def _encode(value):
+    body = _dumps(value)
+    return Encoded(body, _etag(body))
+
+
+def _error(message):
+    return _dumps({'error': message})
+
+
+def _matches(if_none_match, etag):
+    """True jika header If-None-Match (daftar ETag, boleh W/ atau *) mencakup `etag`."""
+    if if_none_match.strip() == '*':
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(','))
+    return any((tag[2:] if tag.startswith('W/') else tag) == etag for tag in tags)
+
+
+class SnapshotBook:
+    """Snapshot JSON siap kirim per ticker, riwayat per ticker dan screener.
+
+    Hanya `publish` yang menulis (dijaga lock); pembaca mengambil `state`
+    sekali per permintaan dan selalu melihat satu versi yang utuh.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._summaries = {}
+        self.state = _State({}, {}, _encode({'updated_at': None, 'signals': []}), None)
+
+    def __len__(self):
+        return len(self.state.signals)
+
+    def __contains__(self, ticker):
+        return ticker in self.state.signals
+
+    def publish(self, snapshots):
+        """Terbitkan snapshot (dict dari `signal_snapshot`); kembalikan jumlah ticker yang berubah."""
+        with self._lock:
+            signals, histories = dict(self.state.signals), dict(self.state.histories)
+            changed = 0
+            for snapshot in snapshots:
+                ticker = snapshot['ticker']
+                try:
+                    encoded = _encode({k: v for k, v in snapshot.items() if k != 'history'})
+                    rows = tuple(_dumps(row) for row in snapshot.get('history', ()))
+                except ValueError:
+                    logger.warning("Snapshot %s berisi angka tak hingga, dilewati", ticker)
+                    continue
+                history_etag = _etag(*rows)
+                if ticker in signals and signals[ticker].etag == encoded.etag and histories[ticker][1] == history_etag:
+                    continue
+                signals[ticker] = encoded
+                histories[ticker] = (rows, history_etag)
+                self._summaries[ticker] = {f: snapshot.get(f) for f in SCREENER_FIELDS}
+                changed += 1
+            if changed:
+                updated_at = datetime.now(timezone.utc).isoformat()
+                ranked = sorted(self._summaries.values(), key=lambda s: (-s['score'], s['ticker']))
+                screener = _encode({'updated_at': updated_at, 'signals': ranked})
+                self.state = _State(signals, histories, screener, updated_at)
+        return changed
+
+
+class SnapshotDaemon(AlertDaemon):
+    """`AlertDaemon` yang juga menerbitkan snapshot API ke `book` setiap siklus.
+
+    Riwayat sinyal dan alert tetap ditulis ke SQLite seperti daemon alert;
+    tanpa `sinks`, alert hanya tercatat (dikirim oleh daemon alert bila berbagi DB).
+    """
+
+    def __init__(self, store, db, tickers, book, history_bars=HISTORY_BARS, **kwargs):
+        super().__init__(store, db, tickers, **kwargs)
+        self.book = book
+        self.history_bars = history_bars
+
+    def _due(self, known):
+        # Ticker tanpa snapshot (mis. setelah restart) dihitung walau pasarnya tutup
+        due = set(super()._due(known))
+        return [t for t in self.tickers if t in due or t not in self.book]
+
+    def analyze(self, ticker, usd_idr_rate):
+        df = load_market_data(self.store, ticker, self.period, self.interval, self.params, fetch=False)
+        if df is None or len(df) < 2:
+            raise ValueError(f"Data kosong untuk {ticker}")
+        return signal_snapshot(df, ticker, usd_idr_rate, ticker in self.gold_tickers, self.params, self.history_bars)
+
+    def publish(self, rows):
+        changed = self.book.publish([{k: v for k, v in row.items() if k != 'bar_time'} for row in rows])
+        logger.info("Snapshot API: %d dari %d ticker berubah", changed, len(rows))
+
+
+class SignalServer:
+    """Server HTTP asyncio yang melayani `book`; jalankan dengan `asyncio.run(server.serve())`."""
+
+    def __init__(self, book, host="127.0.0.1", port=DEFAULT_PORT):
+        self.book = book
+        self.host = host
+        self.port = port
+
+    def _lookup(self, mapping, ticker):
+        """(ticker kanonik, nilai) dari `mapping`, dengan fallback huruf besar; (ticker, None) jika tidak ada."""
+        for key in (ticker, ticker.upper()):
+            if key in mapping:
+                return key, mapping[key]
+        return ticker, None
+
+    def _missing(self, state, route):
+        # Sebelum publikasi pertama semua ticker belum tersedia: minta klien mencoba lagi
+        if not state.signals:
+            return 503, route, _error("Snapshot belum tersedia, coba lagi sebentar"), None
+        return 404, route, _error("Ticker tidak ada di universe API"), None
+
+    def route(self, target):
+        """(status, nama rute, body, etag) untuk GET `target`; hanya membaca snapshot."""
+        state = self.book.state
+        url = urlsplit(target)
+        parts = [unquote(p) for p in url.path.split('/') if p]
+        query = parse_qs(url.query)
+
+        if parts == ['health']:
+            return 200, 'health', _dumps({'tickers': len(state.signals), 'updated_at': state.updated_at}), None
+        if parts == ['screener']:
+            return 200, 'screener', state.screener.body, state.screener.etag
+        if parts == ['signal']:
+            tickers = list(dict.fromkeys(t.strip() for v in query.get('tickers', []) for t in v.split(',') if t.strip()))
+            if not tickers:
+                return 400, 'signal_batch', _error("Parameter tickers wajib diisi (dipisah koma)"), None
+            if len(tickers) > MAX_BATCH:
+                return 400, 'signal_batch', _error(f"Paling banyak {MAX_BATCH} ticker per permintaan"), None
+            found, missing = {}, []
+            for requested in tickers:
+                ticker, entry = self._lookup(state.signals, requested)
+                if entry is None:
+                    missing.append(requested)
+                else:
+                    found.setdefault(ticker, entry)
+            entries = list(found.values())
+            missing = _dumps(missing)
+            body = b'{"signals":[' + b','.join(e.body for e in entries) + b'],"missing":' + missing + b'}'
+            return 200, 'signal_batch', body, _etag(*(e.etag.encode() for e in entries), missing)
+        if len(parts) == 2 and parts[0] == 'signal':
+            _, entry = self._lookup(state.signals, parts[1])
+            if entry is None:
+                return self._missing(state, 'signal')
+            return 200, 'signal', entry.body, entry.etag
+        if len(parts) == 2 and parts[0] == 'history':
+            ticker, history = self._lookup(state.histories, parts[1])
+            if history is None:
+                return self._missing(state, 'history')
+            try:
+                limit = max(1, int(query.get('limit', [HISTORY_BARS])[0]))
+            except ValueError:
+                return 400, 'history', _error("limit harus bilangan bulat"), None
+            rows, etag = history
+            rows = rows[:limit]
+            body = b'{"ticker":' + _dumps(ticker) + b',"history":[' + b','.join(rows) + b']}'
+            return 200, 'history', body, f'{etag[:-1]}-{len(rows)}"'
+        return 404, 'unknown', _error("Rute tidak dikenal"), None
+
+    def respond(self, method, target, if_none_match=None):
+        """(status, body, etag) untuk satu permintaan, termasuk 304 untuk ETag yang cocok."""
+        if method not in ('GET', 'HEAD'):
+            status, route, body, etag = 405, 'unknown', _error("Hanya GET dan HEAD yang didukung"), None
+        else:
+            status, route, body, etag = self.route(target)
+        if status == 200 and etag and if_none_match and _matches(if_none_match, etag):
+            status, body = 304, b''
+        telemetry.record_request(route, status)
+        return status, body, etag
+
+    @staticmethod
+    def _response(status, body, etag=None, head_only=False, keep_alive=True):
+        lines = [
+            f"HTTP/1.1 {status} {_REASONS[status]}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            "Cache-Control: no-cache",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if etag:
+            lines.append(f"ETag: {etag}")
+        if status == 405:
+            lines.append("Allow: GET, HEAD")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+        return head if head_only else head + body
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.LimitOverrunError:
+                    writer.write(self._response(431, _error("Header permintaan terlalu besar"), keep_alive=False))
+                    break
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                lines = head[:-4].decode('latin-1').split('\r\n')
+                request = lines[0].split(' ')
+                if len(request) != 3 or not request[2].startswith('HTTP/1.'):
+                    writer.write(self._response(400, _error("Permintaan HTTP tidak valid"), keep_alive=False))
+                    break
+                method, target, version = request
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(':')
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                if headers.get('content-length', '0') != '0' or 'transfer-encoding' in headers:
+                    # Body permintaan tidak dibaca; koneksi ditutup agar stream tidak rancu
+                    keep_alive = False
+                status, body, etag = self.respond(method, target, headers.get('if-none-match'))
+                writer.write(self._response(status, body, etag, method == 'HEAD', keep_alive))
+                if not keep_alive:
+                    break
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self):
+        server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_HEADER_BYTES, backlog=1024)
+        logger.info("API sinyal di http://%s:%d", self.host, self.port)
+        async with server:
+            await server.serve_forever()
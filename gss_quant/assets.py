@@ -0,0 +1,13 @@
+"""Daftar aset GSS yang ditampilkan di dashboard."""
+
+# --- DAFTAR ASET GSS ---
+ASSETS = {
+    "EMAS PLUANG (Gram)": {"ticker": "GC=F", "type": "Commodity", "is_gold": True},
+    "PAX GOLD (PAXG)": {"ticker": "PAXG-USD", "type": "Crypto", "is_gold": False},
+    "S&P 500 (SPY)": {"ticker": "SPY", "type": "ETF", "is_gold": False},
+    "NVIDIA (NVDA)": {"ticker": "NVDA", "type": "Stock", "is_gold": False},
+    "BITCOIN (BTC)": {"ticker": "BTC-USD", "type": "Crypto", "is_gold": False}
+}
+
+# Ticker yang harganya dikonversi per gram (1 troy ounce = 31.1035 gram)
+GOLD_TICKERS = frozenset(info["ticker"] for info in ASSETS.values() if info["is_gold"])
@@ -0,0 +1,188 @@
+"""Backtest pemetaan skor -> sinyal dan sweep parameter paralel.
+
+Aturan posisi (long-only, seperti cara anggota GSS memakai dashboard):
+BUY / STRONG BUY membuka posisi, STRONG SELL menutupnya, NEUTRAL menahan
+posisi yang sedang berjalan. Eksekusi terjadi di harga Close bar sinyal.
+"""
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+
+import numpy as np
+import pandas as pd
+
+from gss_quant.fx import usd_idr_at
+from gss_quant.indicators import compute_spec, scoring_frame, scoring_specs
+from gss_quant.params import DEFAULT_PARAMS
+from gss_quant.scoring import quantum_score
+
+
+@dataclass
+class BacktestResult:
+    """Hasil satu backtest: daftar trade, kurva ekuitas (USD) dan ringkasan."""
+    trades: pd.DataFrame
+    equity: pd.Series
+    summary: dict
+
+
+def signal_positions(score, params=DEFAULT_PARAMS):
+    """Posisi (0/1) setelah menutup bar, hasil replay sinyal dari skor."""
+    score = np.asarray(score)
+    state = np.full(len(score), np.nan)
+    state[score >= params.buy] = 1.0
+    state[score <= params.strong_sell] = 0.0
+    return pd.Series(state).ffill().fillna(0.0).to_numpy()
+
+
+def _trades(close, position, index, capital_per_trade, fee):
+    """Susun daftar trade dari perubahan posisi; trade terbuka dinilai di Close terakhir."""
+    change = np.diff(np.r_[0.0, position])
+    entries = np.flatnonzero(change > 0)
+    exits = np.flatnonzero(change < 0)
+    if len(exits) < len(entries):
+        exits = np.r_[exits, len(close) - 1]
+    entry_price = close[entries]
+    exit_price = close[exits]
+    is_open = np.zeros(len(entries), dtype=bool)
+    if len(entries) and position[-1] > 0:
+        is_open[-1] = True
+    # Trade terbuka belum membayar biaya keluar
+    ret = (exit_price / entry_price) * (1 - fee) ** np.where(is_open, 1, 2) - 1
+    return pd.DataFrame({
+        'entry_time': index[entries],
+        'exit_time': index[exits],
+        'entry_price': entry_price,
+        'exit_price': exit_price,
+        'return_pct': ret * 100,
+        'pnl_usd': ret * capital_per_trade[entries],
+        'open': is_open,
+    })
+
+
+def run_backtest(df, usd_idr_rate, params=DEFAULT_PARAMS, initial_capital_usd=10_000.0, fee_bps=0.0):
+    """Replay Quantum Score pada `df` (kolom indikator standar) dan hitung kinerja.
+
+    Seluruh modal diputar ulang (compounding). PnL IDR memakai `usd_idr_rate`
+    (skalar, atau seri kurs historis: PnL tiap bar dikonversi dengan kurs bar itu).
+    """
+    close = df['Close'].to_numpy(dtype=float)
+    score, _ = quantum_score(df, params)
+    position = signal_positions(score, params)
+    fee = fee_bps / 10_000
+
+    # Return bar t diperoleh dari posisi yang dipegang sejak penutupan bar t-1
+    bar_ret = np.r_[0.0, close[1:] / close[:-1] - 1]
+    held = np.r_[0.0, position[:-1]]
+    turnover = np.abs(np.diff(np.r_[0.0, position]))
+    equity = initial_capital_usd * np.cumprod((1 + held * bar_ret) * (1 - fee) ** turnover)
+
+    capital_before = np.r_[initial_capital_usd, equity[:-1]]
+    trades = _trades(close, position, df.index, capital_before, fee)
+    rate = usd_idr_at(df.index, usd_idr_rate)
+    trades['pnl_idr'] = trades['pnl_usd'].to_numpy() * rate[df.index.get_indexer(trades['exit_time'])]
+    pnl_idr = float(np.sum(np.diff(np.r_[initial_capital_usd, equity]) * rate))
+
+    peak = np.maximum.accumulate(equity) if len(equity) else equity
+    drawdown = equity / peak - 1 if len(equity) else equity
+    pnl_usd = (equity[-1] if len(equity) else initial_capital_usd) - initial_capital_usd
+    closed = trades.loc[~trades['open'], 'return_pct']
+
+    summary = {
+        'trades': int(len(trades)),
+        'hit_rate': float((closed > 0).mean()) if len(closed) else float('nan'),
+        'pnl_usd': float(pnl_usd),
+        'pnl_idr': pnl_idr,
+        'total_return_pct': float(pnl_usd / initial_capital_usd * 100),
+        'max_drawdown_pct': float(drawdown.min() * 100) if len(drawdown) else 0.0,
+        'exposure_pct': float(held.mean() * 100) if len(held) else 0.0,
+    }
+    return BacktestResult(trades=trades, equity=pd.Series(equity, index=df.index, name='EQUITY_USD'), summary=summary)
+
+
+# --- SWEEP PARAMETER ---
+
+def grid_params(space, base=DEFAULT_PARAMS):
+    """Semua kombinasi valid dari `space` ({nama_field: [nilai, ...]})."""
+    keys = list(space)
+    combos = (replace(base, **dict(zip(keys, values))) for values in itertools.product(*space.values()))
+    return [p for p in combos if p.is_valid()]
+
+
+def random_params(space, n, seed=None, base=DEFAULT_PARAMS):
+    """`n` kombinasi valid yang diambil acak (tanpa duplikat) dari `space`."""
+    rng = random.Random(seed)
+    total = int(np.prod([len(v) for v in space.values()]))
+    seen = set()
+    for _ in range(max(100, n * 50)):
+        if len(seen) >= min(n, total):
+            break
+        p = replace(base, **{k: rng.choice(list(v)) for k, v in space.items()})
+        if p.is_valid():
+            seen.add(p)
+    return sorted(seen, key=lambda p: tuple(asdict(p).values()))
+
+
+# State per proses worker (diisi oleh initializer agar data dikirim sekali saja)
+_WORKER_DATA = {}
+
+
+def _init_worker(data):
+    _WORKER_DATA.clear()
+    _WORKER_DATA.update(data)
+
+
+def _compute_spec_task(ticker, spec):
+    return ticker, compute_spec(_WORKER_DATA[ticker], spec)
+
+
+def _backtest_chunk_task(ticker, param_chunk, usd_idr_rate, backtest_kwargs):
+    panel = _WORKER_DATA[ticker]
+    rows = []
+    for params in param_chunk:
+        result = run_backtest(scoring_frame(panel, params), usd_idr_rate, params, **backtest_kwargs)
+        rows.append({'ticker': ticker, **asdict(params), **result.summary})
+    return rows
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def run_sweep(frames, param_sets, usd_idr_rate, max_workers=None, **backtest_kwargs):
+    """Backtest setiap kombinasi `param_sets` untuk setiap ticker di `frames`.
+
+    `frames` adalah dict ticker -> DataFrame OHLCV mentah. Tahap 1 menghitung
+    setiap kolom indikator unik sekali per ticker; tahap 2 membagi kombinasi
+    parameter ke semua core. Mengembalikan DataFrame satu baris per
+    (ticker, parameter), diurutkan dari PnL terbesar.
+    """
+    param_sets = list(dict.fromkeys(param_sets))
+    max_workers = max_workers or os.cpu_count() or 1
+    specs = list(dict.fromkeys(spec for p in param_sets for spec in scoring_specs(p)))
+
+    # Tahap 1: kolom indikator bersama, satu kali per (ticker, spec)
+    panels = {ticker: df[['Close']].copy() for ticker, df in frames.items()}
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(frames,)) as pool:
+        futures = [pool.submit(_compute_spec_task, ticker, spec) for ticker in frames for spec in specs]
+        for future in futures:
+            ticker, columns = future.result()
+            for name, values in columns.items():
+                panels[ticker][name] = values
+
+    # Tahap 2: skor + backtest per potongan parameter
+    chunk_size = max(1, len(param_sets) // (max_workers * 4))
+    rows = []
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(panels,)) as pool:
+        futures = [
+            pool.submit(_backtest_chunk_task, ticker, chunk, usd_idr_rate, backtest_kwargs)
+            for ticker in panels for chunk in _chunks(param_sets, chunk_size)
+        ]
+        for future in futures:
+            rows.extend(future.result())
+
+    result = pd.DataFrame(rows)
+    if result.empty:
+        return result
+    return result.sort_values('pnl_usd', ascending=False, ignore_index=True)
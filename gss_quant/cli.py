@@ -0,0 +1,195 @@
+"""Antarmuka baris perintah `gss-quant` untuk skrip dan cron.
+
+Contoh:
+
+    gss-quant score GC=F BTC-USD
+    gss-quant score SPY --usd-idr 16250 --offline --compact
+    gss-quant alerts --watchlist universe.txt --sink stdout --sink file:alerts.jsonl
+    gss-quant serve --watchlist universe.txt --port 8765
+
+Modul berat (pandas, pyarrow, yfinance) baru di-import saat perintah
+dijalankan, sehingga `gss-quant --help` tetap instan.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def _build_store(args):
+    from gss_quant.providers import LocalFileProvider, YahooProvider
+    from gss_quant.store import DEFAULT_STORE_DIR, OHLCVStore
+
+    provider = LocalFileProvider(args.source_dir) if args.source_dir else YahooProvider()
+    root = Path(args.data_dir) / "ohlcv" if args.data_dir else DEFAULT_STORE_DIR
+    return OHLCVStore(provider, root)
+
+
+def cmd_score(args):
+    """Cetak ringkasan sinyal setiap ticker sebagai JSON; kode keluar 1 jika ada yang gagal."""
+    from gss_quant.analysis import analyze_ticker
+    from gss_quant.assets import GOLD_TICKERS
+
+    store = _build_store(args)
+    if args.usd_idr is not None:
+        usd_idr = args.usd_idr
+    elif args.offline:
+        from gss_quant.fx import FALLBACK_USD_IDR
+        usd_idr = FALLBACK_USD_IDR
+    else:
+        from gss_quant.fx import fetch_usd_idr_rate
+        usd_idr = fetch_usd_idr_rate()
+
+    results = []
+    for ticker in args.tickers:
+        is_gold = args.gold or ticker in GOLD_TICKERS
+        try:
+            result = analyze_ticker(store, ticker, usd_idr, is_gold=is_gold, period=args.period,
+                                    interval=args.interval, fetch=not args.offline)
+        except Exception as e:
+            result = {'ticker': ticker, 'error': str(e)}
+        else:
+            if not args.reasons:
+                del result['reasons']
+        results.append(result)
+
+    json.dump(results, sys.stdout, indent=None if args.compact else 2, ensure_ascii=False)
+    sys.stdout.write("\n")
+    return 1 if any('error' in r for r in results) else 0
+
+
+def cmd_alerts(args):
+    """Daemon alert: scan universe berkala, riwayat sinyal ke SQLite, alert ke sink."""
+    import logging
+
+    from gss_quant import telemetry
+    from gss_quant.alerts import AlertDaemon, build_sink
+    from gss_quant.assets import ASSETS, GOLD_TICKERS
+    from gss_quant.fetch import ThrottledProvider
+    from gss_quant.screener import parse_watchlist
+    from gss_quant.store import DEFAULT_STORE_DIR
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    telemetry.configure_from_env()
+    tickers = list(args.tickers)
+    if args.watchlist:
+        tickers += parse_watchlist(Path(args.watchlist).read_text(encoding="utf-8"))
+    if not tickers:
+        tickers = [info["ticker"] for info in ASSETS.values()]
+
+    store = _build_store(args)
+    store.provider = ThrottledProvider(store.provider)
+    db_path = args.db or (Path(args.data_dir) if args.data_dir else DEFAULT_STORE_DIR.parent) / "signals.db"
+    daemon = AlertDaemon(store, db_path, tickers, sinks=[build_sink(s) for s in args.sink or ["stdout"]],
+                         gold_tickers=GOLD_TICKERS, interval=args.interval, period=args.period,
+                         budget=args.budget, workers=args.workers, batch_size=args.batch_size)
+    try:
+        if args.once:
+            summary = daemon.run_cycle()
+            return 1 if summary["errors"] or summary["timeouts"] else 0
+        daemon.run_forever(args.every)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+    return 0
+
+
+def cmd_serve(args):
+    """API JSON read-only dari snapshot yang diperbarui daemon latar."""
+    import asyncio
+    import logging
+    import threading
+
+    from gss_quant import telemetry
+    from gss_quant.api import SignalServer, SnapshotBook, SnapshotDaemon
+    from gss_quant.assets import ASSETS, GOLD_TICKERS
+    from gss_quant.fetch import ThrottledProvider
+    from gss_quant.screener import parse_watchlist
+    from gss_quant.store import DEFAULT_STORE_DIR
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    telemetry.configure_from_env()
+    tickers = list(args.tickers)
+    if args.watchlist:
+        tickers += parse_watchlist(Path(args.watchlist).read_text(encoding="utf-8"))
+    if not tickers:
+        tickers = [info["ticker"] for info in ASSETS.values()]
+
+    store = _build_store(args)
+    store.provider = ThrottledProvider(store.provider)
+    db_path = args.db or (Path(args.data_dir) if args.data_dir else DEFAULT_STORE_DIR.parent) / "signals.db"
+    book = SnapshotBook()
+    daemon = SnapshotDaemon(store, db_path, tickers, book, history_bars=args.history_bars, gold_tickers=GOLD_TICKERS,
+                            interval=args.interval, period=args.period, budget=args.budget, workers=args.workers,
+                            batch_size=args.batch_size)
+    threading.Thread(target=daemon.run_forever, args=(args.every,), name="gss-api-refresh", daemon=True).start()
+    try:
+        asyncio.run(SignalServer(book, args.host, args.port).serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="gss-quant", description="GSS Quantum Analytics tanpa UI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score = commands.add_parser("score", help="Quantum Score bar terakhir untuk satu atau lebih ticker (JSON)")
+    score.add_argument("tickers", nargs="+", metavar="TICKER")
+    score.add_argument("--period", default="1y", help="jendela data gaya yfinance (bawaan: 1y)")
+    score.add_argument("--interval", default="1d")
+    score.add_argument("--usd-idr", type=float, help="kurs USD/IDR tetap (lewati pengambilan kurs)")
+    score.add_argument("--gold", action="store_true", help="konversi IDR per gram untuk semua ticker")
+    score.add_argument("--offline", action="store_true", help="hanya data tersimpan, tanpa akses jaringan")
+    score.add_argument("--data-dir", help="direktori data (bawaan: $GSS_DATA_DIR atau ~/.gss_quant)")
+    score.add_argument("--source-dir", help="ambil OHLCV dari file lokal <ticker>_<interval>.parquet/.csv")
+    score.add_argument("--no-reasons", dest="reasons", action="store_false", help="tanpa daftar alasan")
+    score.add_argument("--compact", action="store_true", help="JSON satu baris")
+    score.set_defaults(handler=cmd_score)
+
+    alerts = commands.add_parser("alerts", help="daemon: scan universe terjadwal, riwayat ke SQLite, kirim alert")
+    alerts.add_argument("tickers", nargs="*", metavar="TICKER", help="bawaan: aset dashboard jika tanpa --watchlist")
+    alerts.add_argument("--watchlist", help="file ticker (dipisah koma, spasi atau baris baru)")
+    alerts.add_argument("--db", help="file SQLite (bawaan: <data-dir>/signals.db)")
+    alerts.add_argument("--sink", action="append", metavar="SINK",
+                        help="stdout, file:<path> atau URL webhook http; boleh berulang (bawaan: stdout)")
+    alerts.add_argument("--every", type=float, default=300.0, help="jeda antar awal siklus dalam detik (bawaan: 300)")
+    alerts.add_argument("--budget", type=float, default=240.0, help="batas waktu satu siklus dalam detik (bawaan: 240)")
+    alerts.add_argument("--workers", type=int, default=8)
+    alerts.add_argument("--batch-size", type=int, default=50, help="ticker per permintaan multi-ticker")
+    alerts.add_argument("--period", default="1y")
+    alerts.add_argument("--interval", default="1d")
+    alerts.add_argument("--once", action="store_true", help="jalankan satu siklus lalu keluar (untuk cron)")
+    alerts.add_argument("--data-dir", help="direktori data (bawaan: $GSS_DATA_DIR atau ~/.gss_quant)")
+    alerts.add_argument("--source-dir", help="ambil OHLCV dari file lokal <ticker>_<interval>.parquet/.csv")
+    alerts.set_defaults(handler=cmd_alerts)
+
+    serve = commands.add_parser("serve", help="API JSON read-only: /signal, /screener, /history dari snapshot")
+    serve.add_argument("tickers", nargs="*", metavar="TICKER", help="bawaan: aset dashboard jika tanpa --watchlist")
+    serve.add_argument("--watchlist", help="file ticker (dipisah koma, spasi atau baris baru)")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--db", help="file SQLite riwayat sinyal (bawaan: <data-dir>/signals.db)")
+    serve.add_argument("--every", type=float, default=60.0, help="jeda antar pembaruan snapshot dalam detik (bawaan: 60)")
+    serve.add_argument("--budget", type=float, default=50.0, help="batas waktu satu pembaruan dalam detik (bawaan: 50)")
+    serve.add_argument("--workers", type=int, default=8)
+    serve.add_argument("--batch-size", type=int, default=50, help="ticker per permintaan multi-ticker")
+    serve.add_argument("--history-bars", type=int, default=250, help="bar riwayat skor per ticker di /history")
+    serve.add_argument("--period", default="1y")
+    serve.add_argument("--interval", default="1d")
+    serve.add_argument("--data-dir", help="direktori data (bawaan: $GSS_DATA_DIR atau ~/.gss_quant)")
+    serve.add_argument("--source-dir", help="ambil OHLCV dari file lokal <ticker>_<interval>.parquet/.csv")
+    serve.set_defaults(handler=cmd_serve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""Matriks korelasi dan beta lintas aset dengan jendela bergulir yang diperbarui inkremental.
+
+Return log harian setiap aset disejajarkan ke kalender gabungan; hari tanpa
+bar (mis. akhir pekan untuk saham) bernilai NaN. Statistik dihitung
+pairwise-complete: setiap pasangan hanya memakai bar yang ada di keduanya.
+
+`RollingCorrelation` menyimpan `window` baris terakhir dan empat matriks
+N x N berisi jumlah (Σx_i·x_j, Σx_i, Σx_i², jumlah bar bersama). Bar baru
+cukup satu pembaruan rank-1 O(N²): baris baru ditambahkan dan baris yang
+keluar jendela dikurangkan, tanpa menghitung ulang kubus N x N x T.
+Inisialisasi memakai empat perkalian matriks.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_WINDOW = 60
+
+
+def aligned_returns(closes):
+    """DataFrame return log harian (kolom = ticker) dari dict ticker -> seri harga penutupan.
+
+    Return setiap aset dihitung dari bar miliknya sendiri, sehingga return
+    Senin saham mencakup akhir pekan; tanggal diambil dari waktu lokal bar.
+    """
+    columns = {}
+    for ticker, close in closes.items():
+        close = close[close > 0].dropna()
+        index = close.index.tz_localize(None) if close.index.tz is not None else close.index
+        log_close = pd.Series(np.log(close.to_numpy(dtype=np.float64)), index=index.normalize())
+        columns[ticker] = log_close[~log_close.index.duplicated(keep='last')].diff()
+    return pd.DataFrame(columns).sort_index()
+
+
+class RollingCorrelation:
+    """Kovarians, korelasi dan beta pairwise-complete atas `window` baris return terakhir.
+
+    Tidak thread-safe; lindungi dengan lock bila dipakai bersama.
+    """
+
+    def __init__(self, tickers, window=DEFAULT_WINDOW, min_periods=20):
+        self.tickers = list(tickers)
+        self.window = window
+        self.min_periods = min_periods
+        n = len(self.tickers)
+        self._x = np.zeros((window, n))
+        self._m = np.zeros((window, n))
+        self._times = np.empty(window, dtype=object)
+        self._pos = 0
+        self._count = 0
+        self._updates = 0
+        self._products = np.zeros((n, n))
+        self._sums = np.zeros((n, n))
+        self._squares = np.zeros((n, n))
+        self._pairs = np.zeros((n, n))
+
+    @classmethod
+    def from_returns(cls, returns, window=DEFAULT_WINDOW, min_periods=20):
+        """State dari DataFrame return (kolom = ticker) memakai `window` baris terakhir."""
+        state = cls(returns.columns, window, min_periods)
+        state._load(returns)
+        return state
+
+    @property
+    def last_timestamp(self):
+        return self._times[(self._pos - 1) % self.window] if self._count else None
+
+    def _order(self):
+        """Slot buffer dari yang terlama ke terbaru."""
+        return (np.arange(self._count) + self._pos - self._count) % self.window
+
+    def _recompute(self):
+        x, m = self._x, self._m
+        self._products = x.T @ x
+        self._sums = x.T @ m
+        self._squares = (x * x).T @ m
+        self._pairs = m.T @ m
+        self._updates = 0
+
+    def _load(self, returns):
+        tail = returns.reindex(columns=self.tickers).tail(self.window)
+        values = tail.to_numpy(dtype=np.float64)
+        k = len(values)
+        self._x[:] = 0.0
+        self._m[:] = 0.0
+        self._times[:] = None
+        valid = np.isfinite(values)
+        self._x[:k] = np.where(valid, values, 0.0)
+        self._m[:k] = valid
+        self._times[:k] = list(tail.index)
+        self._count, self._pos = k, k % self.window
+        self._recompute()
+
+    def _apply(self, slot, sign):
+        x, m = self._x[slot], self._m[slot]
+        self._products += sign * np.outer(x, x)
+        self._sums += sign * np.outer(x, m)
+        self._squares += sign * np.outer(x * x, m)
+        self._pairs += sign * np.outer(m, m)
+
+    def update(self, timestamp, returns):
+        """Masukkan satu baris return (urutan `tickers`); timestamp yang sama dengan bar terakhir merevisinya."""
+        values = np.asarray(returns, dtype=np.float64)
+        last = self.last_timestamp
+        if last is not None and timestamp == last:
+            slot = (self._pos - 1) % self.window
+            self._apply(slot, -1.0)
+        else:
+            if last is not None and timestamp < last:
+                raise ValueError(f"Bar {timestamp} lebih lama dari bar terakhir {last}")
+            slot = self._pos
+            if self._count == self.window:
+                self._apply(slot, -1.0)
+            else:
+                self._count += 1
+            self._pos = (self._pos + 1) % self.window
+        valid = np.isfinite(values)
+        self._x[slot] = np.where(valid, values, 0.0)
+        self._m[slot] = valid
+        self._times[slot] = timestamp
+        self._apply(slot, 1.0)
+
+        # Jumlah berjalan diakumulasi ulang dari buffer sekali per `window` pembaruan
+        # agar galat pembulatan tidak menumpuk (biaya teramortisasi tetap O(N²))
+        self._updates += 1
+        if self._updates >= self.window:
+            self._recompute()
+
+    def sync(self, returns):
+        """Samakan state dengan DataFrame return terbaru; hanya bar sejak bar terakhir yang diproses.
+
+        Jika baris lama di dalam jendela berubah (riwayat direvisi) atau
+        kolomnya berbeda, state dibangun ulang dari `returns`.
+        """
+        if list(returns.columns) != self.tickers:
+            raise ValueError("Kolom return tidak sama dengan ticker state; buat state baru")
+        last = self.last_timestamp
+        if last is None:
+            self._load(returns)
+            return self
+        order = self._order()[:-1]
+        known = returns[returns.index < last].tail(len(order))
+        values = known.to_numpy(dtype=np.float64)
+        unchanged = (
+            len(known) == len(order)
+            and list(known.index) == list(self._times[order])
+            and np.array_equal(np.isfinite(values), self._m[order] == 1.0)
+            and np.array_equal(np.nan_to_num(values), self._x[order])
+        )
+        fresh = returns[returns.index >= last]
+        if not unchanged or fresh.empty or fresh.index[0] != last:
+            self._load(returns)
+            return self
+        for timestamp, row in zip(fresh.index, fresh.to_numpy(dtype=np.float64)):
+            self.update(timestamp, row)
+        return self
+
+    def _moments(self):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n = self._pairs
+            covariance = (self._products - self._sums * self._sums.T / n) / (n - 1)
+            # variance[i, j]: varians aset i atas bar yang juga dimiliki aset j
+            variance = (self._squares - self._sums ** 2 / n) / (n - 1)
+        insufficient = n < max(self.min_periods, 2)
+        covariance[insufficient] = np.nan
+        variance[insufficient] = np.nan
+        return covariance, variance
+
+    def _frame(self, values):
+        return pd.DataFrame(values, index=self.tickers, columns=self.tickers)
+
+    def covariance(self):
+        return self._frame(self._moments()[0])
+
+    def correlation(self):
+        covariance, variance = self._moments()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = covariance / np.sqrt(variance * variance.T)
+        return self._frame(np.clip(correlation, -1.0, 1.0))
+
+    def beta(self):
+        """Beta baris terhadap kolom: cov(i, j) / var(j), keduanya atas bar bersama."""
+        covariance, variance = self._moments()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self._frame(covariance / variance.T)
+
+
+def rolling_pair(returns, ticker, benchmark, window=DEFAULT_WINDOW, min_periods=20):
+    """Seri korelasi dan beta bergulir `ticker` terhadap `benchmark` (bar bersama saja)."""
+    pair = returns[[ticker, benchmark]].dropna()
+    asset = pair[ticker].rolling(window, min_periods=min_periods)
+    return pd.DataFrame({
+        'CORRELATION': asset.corr(pair[benchmark]),
+        'BETA': asset.cov(pair[benchmark]) / pair[benchmark].rolling(window, min_periods=min_periods).var(),
+    })
+
+
+def cluster_order(correlation):
+    """Urutan ticker untuk heatmap berkluster (hierarchical clustering average linkage).
+
+    Jarak = sqrt((1 - korelasi) / 2); korelasi NaN dianggap 0. Urutan daun
+    dendrogram dikembalikan sebagai list label.
+    """
+    labels = list(correlation.index)
+    n = len(labels)
+    if n <= 2:
+        return labels
+    values = np.nan_to_num(correlation.to_numpy(dtype=np.float64), nan=0.0)
+    distance = np.sqrt(np.clip((1.0 - values) / 2.0, 0.0, None))
+    np.fill_diagonal(distance, np.inf)
+    sizes = np.ones(n)
+    members = [[i] for i in range(n)]
+    for _ in range(n - 1):
+        a, b = divmod(int(np.argmin(distance)), n)
+        # Lance-Williams untuk average linkage; kluster b dilebur ke a
+        merged = (sizes[a] * distance[a] + sizes[b] * distance[b]) / (sizes[a] + sizes[b])
+        distance[a, :] = merged
+        distance[:, a] = merged
+        distance[a, a] = np.inf
+        distance[b, :] = np.inf
+        distance[:, b] = np.inf
+        members[a] += members[b]
+        sizes[a] += sizes[b]
+    return [labels[i] for i in members[a]]
@@ -0,0 +1,102 @@
+"""Decimasi sisi server untuk grafik riwayat panjang.
+
+Jumlah titik yang dikirim ke browser dibatasi oleh anggaran piksel, bukan
+panjang riwayat:
+
+* candle digabung per ember dengan tetap menjaga OHLC (open pertama, high
+  maksimum, low minimum, close terakhir);
+* garis overlay (EMA, Bollinger Bands, skor) memakai Largest-Triangle-Three-
+  Buckets (LTTB) yang mempertahankan bentuk visual garis.
+
+Dashboard memuat riwayat harian 1y (~250 bar), di bawah `CHART_MAX_CANDLES`,
+sehingga candle baru didecimasi untuk riwayat yang lebih panjang atau rapat.
+"""
+import numpy as np
+import pandas as pd
+
+# Anggaran piksel bawaan: ~2 px per candle dan ~1 px per titik garis pada grafik selebar ~1.200 px
+CHART_MAX_CANDLES = 600
+CHART_MAX_POINTS = 1_500
+
+
+def _bucket_starts(n, n_buckets):
+    """Posisi awal setiap ember untuk membagi `n` bar menjadi `n_buckets` ember yang hampir sama besar."""
+    return np.linspace(0, n, n_buckets + 1).astype(np.int64)[:-1]
+
+
+def _x_values(index):
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype(np.float64)
+    return np.arange(len(index), dtype=np.float64)
+
+
+def ohlc_decimate(df, max_bars=CHART_MAX_CANDLES):
+    """Gabungkan DataFrame OHLC menjadi paling banyak `max_bars` candle.
+
+    Setiap candle hasil diberi timestamp bar pertama di embernya. Jika `df`
+    sudah cukup pendek, kolom OHLC dikembalikan apa adanya.
+    """
+    ohlc = df[['Open', 'High', 'Low', 'Close']]
+    n = len(ohlc)
+    if n <= max_bars:
+        return ohlc
+    starts = _bucket_starts(n, max_bars)
+    ends = np.append(starts[1:], n) - 1
+    return pd.DataFrame({
+        'Open': ohlc['Open'].to_numpy(dtype=np.float64)[starts],
+        'High': np.fmax.reduceat(ohlc['High'].to_numpy(dtype=np.float64), starts),
+        'Low': np.fmin.reduceat(ohlc['Low'].to_numpy(dtype=np.float64), starts),
+        'Close': ohlc['Close'].to_numpy(dtype=np.float64)[ends],
+    }, index=ohlc.index[starts])
+
+
+def lttb_indices(x, y, max_points):
+    """Posisi titik yang dipilih LTTB dari (x, y); titik NaN di `y` diabaikan.
+
+    Titik valid pertama dan terakhir selalu ikut. Mengembalikan array posisi
+    terurut ke array asal.
+    """
+    if max_points < 3:
+        raise ValueError(f"max_points minimal 3, bukan {max_points}")
+    valid = np.flatnonzero(~np.isnan(y))
+    n = len(valid)
+    if n <= max_points:
+        return valid
+    xv, yv = x[valid], y[valid]
+
+    # Titik pertama dan terakhir tetap; sisanya dibagi ke max_points - 2 ember
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = xv[hi:edges[i + 2]].mean(), yv[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = xv[-1], yv[-1]
+        # Luas segitiga (titik terpilih sebelumnya, kandidat, rata-rata ember berikutnya); faktor 1/2 tidak perlu
+        area = np.abs((xv[a] - next_x) * (yv[lo:hi] - yv[a]) - (xv[a] - xv[lo:hi]) * (next_y - yv[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return valid[selected]
+
+
+def lttb_decimate(series, max_points=CHART_MAX_POINTS):
+    """Subset Series (index sama dengan aslinya) berisi paling banyak `max_points` titik hasil LTTB."""
+    positions = lttb_indices(_x_values(series.index), series.to_numpy(dtype=np.float64), max_points)
+    return series.iloc[positions]
+
+
+def slice_range(df, start=None, end=None):
+    """Baris `df` dengan index di [start, end] (inklusif); batas None berarti terbuka.
+
+    `start` / `end` boleh tanpa zona waktu walaupun index-nya memiliki zona
+    waktu (seperti nilai dari widget tanggal Streamlit).
+    """
+    index = df.index
+    if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+        index = index.tz_localize(None)
+    lo = 0 if start is None else index.searchsorted(pd.Timestamp(start), side='left')
+    hi = len(index) if end is None else index.searchsorted(pd.Timestamp(end), side='right')
+    return df.iloc[lo:hi]
@@ -0,0 +1,191 @@
+"""Lapisan fetch single-flight + stale-while-revalidate untuk data pasar dan kurs.
+
+* Permintaan bersamaan untuk kunci yang sama digabung menjadi satu panggilan
+  ke hulu; semua pemanggil menunggu hasil yang sama.
+* Nilai yang sudah lewat TTL langsung dikembalikan sementara pembaruan
+  berjalan di thread latar, sehingga UI tidak menunggu jaringan.
+* Setiap provider punya batas konkurensi dan jarak minimum antar permintaan
+  (`ProviderLimiter`), dipakai bersama oleh semua sesi dalam satu proses.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from gss_quant import telemetry
+from gss_quant.providers import MarketDataProvider
+
+logger = logging.getLogger(__name__)
+
+FRESH = 'fresh'
+REFRESHING = 'refreshing'
+STALE = 'stale'
+
+
+class ProviderLimiter:
+    """Batas konkurensi dan laju untuk satu provider (context manager)."""
+
+    def __init__(self, max_concurrent=4, min_interval=0.2):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._pace = threading.Lock()
+        self._next_start = 0.0
+
+    def __enter__(self):
+        self._slots.acquire()
+        # Permintaan berikutnya paling cepat `min_interval` detik setelah yang sebelumnya dimulai
+        with self._pace:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+        return self
+
+    def __exit__(self, *exc):
+        self._slots.release()
+        return False
+
+
+_limiters = {}
+_limiters_guard = threading.Lock()
+
+
+def provider_limiter(name, max_concurrent=4, min_interval=0.2):
+    """Limiter bersama (satu per proses) untuk provider `name`; argumen hanya dipakai saat pertama dibuat."""
+    with _limiters_guard:
+        if name not in _limiters:
+            _limiters[name] = ProviderLimiter(max_concurrent, min_interval)
+        return _limiters[name]
+
+
+class ThrottledProvider(MarketDataProvider):
+    """Bungkus provider sehingga setiap permintaan melewati limiter bersama provider tersebut."""
+
+    def __init__(self, provider, limiter=None):
+        self.provider = provider
+        self.name = provider.name
+        self.limiter = limiter or provider_limiter(provider.name)
+
+    def fetch(self, ticker, interval="1d", start=None, period="max"):
+        with self.limiter, telemetry.upstream(self.name, ticker=ticker, interval=interval):
+            return self.provider.fetch(ticker, interval, start=start, period=period)
+
+    def fetch_many(self, tickers, interval="1d", period="1y"):
+        with self.limiter, telemetry.upstream(self.name, tickers=len(tickers), interval=interval):
+            return self.provider.fetch_many(tickers, interval=interval, period=period)
+
+
+@dataclass(frozen=True)
+class Fetched:
+    """Nilai dari `SingleFlightCache` beserta status kesegarannya."""
+    value: Any
+    state: str
+    age: float
+    error: Optional[str] = None
+
+    def describe(self):
+        """Keterangan singkat status cache untuk ditampilkan di UI."""
+        age = f"{self.age:.0f} dtk lalu"
+        if self.state == FRESH:
+            return f"🟢 Segar (diperbarui {age})"
+        if self.state == REFRESHING:
+            return f"🟡 Memperbarui di latar (data {age})"
+        return f"🟠 Data lama ({age}); pembaruan gagal: {self.error}"
+
+
+def _cache_name(key):
+    # Kunci berbentuk tuple (nama, ...) dikelompokkan per nama agar label metrik tetap sedikit
+    return str(key[0]) if isinstance(key, tuple) and key else str(key)
+
+
+class _Entry:
+    __slots__ = ('value', 'has_value', 'fetched_at', 'error', 'failed_at', 'future')
+
+    def __init__(self):
+        self.value = None
+        self.has_value = False
+        self.fetched_at = 0.0
+        self.error = None
+        self.failed_at = None
+        self.future = None
+
+
+class SingleFlightCache:
+    """Cache in-memory dengan fetch single-flight dan stale-while-revalidate.
+
+    `error_backoff` adalah jeda (detik) sebelum pembaruan yang gagal dicoba
+    lagi; selama itu nilai lama dikembalikan dengan status "stale".
+    """
+
+    def __init__(self, max_workers=4, error_backoff=30.0):
+        self.error_backoff = error_backoff
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='gss-fetch')
+
+    def _load(self, key, entry, loader):
+        try:
+            value = loader()
+        except Exception as e:
+            logger.warning("Gagal memperbarui %r", key, exc_info=True)
+            with self._lock:
+                entry.error = str(e) or type(e).__name__
+                entry.failed_at = time.monotonic()
+                entry.future = None
+            raise
+        with self._lock:
+            entry.value, entry.has_value = value, True
+            entry.fetched_at = time.monotonic()
+            entry.error = entry.failed_at = None
+            entry.future = None
+        return value
+
+    def _ensure_refresh(self, key, entry, loader):
+        """Future pembaruan yang sedang berjalan, atau yang baru dimulai (dipanggil dengan lock)."""
+        if entry.future is None:
+            entry.future = self._executor.submit(self._load, key, entry, loader)
+        return entry.future
+
+    def get(self, key, loader, ttl):
+        """`Fetched` untuk `key`; `loader()` dipanggil paling banyak sekali secara bersamaan per kunci.
+
+        Tanpa nilai tersimpan, pemanggil menunggu hasil (dan menerima
+        exception jika gagal). Dengan nilai yang lewat `ttl` detik, nilai itu
+        langsung dikembalikan dan pembaruan berjalan di latar.
+        """
+        with self._lock:
+            entry = self._entries.setdefault(key, _Entry())
+            now = time.monotonic()
+            if entry.has_value:
+                age = now - entry.fetched_at
+                if age < ttl:
+                    result = Fetched(entry.value, FRESH, age)
+                elif entry.future is None and entry.failed_at is not None and now - entry.failed_at < self.error_backoff:
+                    result = Fetched(entry.value, STALE, age, entry.error)
+                else:
+                    self._ensure_refresh(key, entry, loader)
+                    result = Fetched(entry.value, REFRESHING, age)
+                telemetry.record_cache(_cache_name(key), result.state)
+                return result
+            future = self._ensure_refresh(key, entry, loader)
+        telemetry.record_cache(_cache_name(key), 'miss')
+        value = future.result()
+        return Fetched(value, FRESH, 0.0)
+
+    def refresh(self, key, loader):
+        """Perbarui `key` sekarang dan tunggu hasilnya (bergabung dengan pembaruan yang sedang berjalan)."""
+        with self._lock:
+            future = self._ensure_refresh(key, self._entries.setdefault(key, _Entry()), loader)
+        return future.result()
+
+    def invalidate(self, key=None):
+        """Lupakan satu kunci (atau semua); pembaruan yang sedang berjalan tetap selesai."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
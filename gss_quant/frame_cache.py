@@ -0,0 +1,252 @@
+"""Cache DataFrame bersama antar sesi dan proses (Arrow IPC di memori bersama).
+
+Setiap entri disimpan sekali sebagai file Arrow IPC di `/dev/shm` (atau
+direktori cache biasa jika tidak ada) lalu di-memory-map oleh pembaca, sehingga
+kolom numerik hasil `get` adalah view read-only tanpa salinan.
+
+Referensi dihitung lewat `flock` bersama pada file: selama DataFrame hasil
+`get` masih hidup, entrinya tidak akan dibuang. Eviksi LRU (waktu akses =
+mtime file) berjalan saat total ukuran melewati anggaran memori dan hanya
+membuang entri tanpa pembaca. File yang di-unlink tetap valid bagi proses yang
+sudah me-mmap-nya.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from gss_quant import telemetry
+
+try:
+    import fcntl
+except ImportError:  # Windows: file yang sedang di-mmap memang tidak bisa dihapus
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_SHM_ROOT = Path("/dev/shm")
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    "GSS_CACHE_DIR",
+    _SHM_ROOT / "gss_quant" if _SHM_ROOT.is_dir() else Path.home() / ".gss_quant" / "cache",
+))
+DEFAULT_BUDGET_BYTES = int(float(os.environ.get("GSS_CACHE_BUDGET_MB", 512)) * 1024 * 1024)
+
+_INDEX_COLUMN = '__index__'
+_SUFFIX = '.arrow'
+_FD_DIR = Path("/proc/self/fd")
+
+
+def _frame_to_table(df, created):
+    """Tabel Arrow dari `df`; NaN pada kolom numerik tetap NaN (bukan null) agar pembacaan bisa zero-copy."""
+    arrays, names = [pa.array(df.index)], [_INDEX_COLUMN]
+    for name in df.columns:
+        column = df[name]
+        if pd.api.types.is_numeric_dtype(column.dtype):
+            arrays.append(pa.array(column.to_numpy(), from_pandas=False))
+        else:
+            arrays.append(pa.array(column))
+        names.append(str(name))
+    metadata = {'gss_index_name': json.dumps(df.index.name), 'gss_created': repr(created)}
+    return pa.Table.from_arrays(arrays, names=names, metadata=metadata)
+
+
+def _table_to_frame(table):
+    metadata = table.schema.metadata
+    index = pd.Index(table.column(_INDEX_COLUMN).to_pandas(), name=json.loads(metadata[b'gss_index_name']))
+    # split_blocks: setiap kolom jadi blok sendiri sehingga float64 tanpa null tidak disalin
+    df = table.select(table.column_names[1:]).to_pandas(split_blocks=True)
+    df.index = index
+    return df
+
+
+class _Lease:
+    """Kunci `flock` bersama pada satu file cache selama DataFrame pembacanya hidup."""
+
+    def __init__(self, cache, path):
+        self._cache = cache
+        self._key_name = path.stem
+        self._fd = os.open(path, os.O_RDONLY)
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_SH)
+            except BaseException:
+                os.close(self._fd)
+                raise
+        # Path untuk di-mmap: file yang sama dengan fd yang dikunci, walau `path` sudah diganti `put`
+        self.source = str(_FD_DIR / str(self._fd)) if _FD_DIR.is_dir() else str(path)
+        cache._acquired(self._key_name)
+
+    def release(self):
+        if self._fd is None:
+            return
+        os.close(self._fd)  # melepas flock
+        self._fd = None
+        self._cache._released(self._key_name)
+
+
+class SharedFrameCache:
+    """Cache DataFrame Arrow IPC yang di-memory-map, dengan hitungan referensi dan eviksi LRU.
+
+    Aman dipakai dari banyak thread dan proses yang menunjuk ke `root` yang
+    sama. `budget_bytes` adalah batas total ukuran file cache.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.root = Path(root)
+        self.budget_bytes = budget_bytes
+        self._refs = Counter()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def key_name(key):
+        """Nama file stabil untuk `key` (tuple atau string apa pun yang repr-nya deterministik)."""
+        return hashlib.sha1(repr(key).encode()).hexdigest()
+
+    def path(self, key):
+        return self.root / f"{self.key_name(key)}{_SUFFIX}"
+
+    def _acquired(self, key_name):
+        with self._lock:
+            self._refs[key_name] += 1
+
+    def _released(self, key_name):
+        with self._lock:
+            self._refs[key_name] -= 1
+            if self._refs[key_name] <= 0:
+                del self._refs[key_name]
+
+    def put(self, key, df):
+        """Simpan `df` di bawah `key` (menggantikan versi lama secara atomik), lalu tegakkan anggaran."""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        table = _frame_to_table(df, time.time())
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def get(self, key, max_age=None):
+        """DataFrame zero-copy untuk `key`, atau None jika tidak ada / lebih tua dari `max_age` detik.
+
+        Kolom numerik hasilnya read-only; salin dulu (`df.copy()`) sebelum
+        mengubahnya di tempat.
+        """
+        path = self.path(key)
+        try:
+            lease = _Lease(self, path)
+        except FileNotFoundError:
+            self.misses += 1
+            telemetry.record_cache('frame_cache', 'miss')
+            return None
+        try:
+            table = pa.ipc.open_file(pa.memory_map(lease.source)).read_all()
+            created = float(table.schema.metadata[b'gss_created'])
+            if max_age is not None and time.time() - created > max_age:
+                lease.release()
+                self.misses += 1
+                telemetry.record_cache('frame_cache', 'expired')
+                return None
+            df = _table_to_frame(table)
+        except Exception:
+            lease.release()
+            raise
+        try:
+            os.utime(path)  # tandai baru dipakai untuk LRU
+        except FileNotFoundError:
+            pass
+        weakref.finalize(df, lease.release)
+        self.hits += 1
+        telemetry.record_cache('frame_cache', 'hit')
+        return df
+
+    def get_or_compute(self, key, compute, max_age=None):
+        """`get(key)`, atau hitung dengan `compute()` lalu simpan; hasil None tidak disimpan."""
+        df = self.get(key, max_age)
+        if df is not None:
+            return df
+        df = compute()
+        if df is None:
+            return None
+        self.put(key, df)
+        # Kembalikan view dari cache agar salinan hasil hitung bisa segera dilepas
+        cached = self.get(key)
+        return df if cached is None else cached
+
+    def _entries(self):
+        """(mtime, ukuran, path) semua file cache, terlama lebih dulu."""
+        entries = []
+        for path in self.root.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def _remove_if_unused(self, path):
+        """Hapus `path` jika tidak ada pembaca (di proses mana pun); True jika terhapus."""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return False
+            try:
+                path.unlink()
+            except OSError:
+                return False
+            return True
+        finally:
+            os.close(fd)
+
+    def evict(self, budget_bytes=None):
+        """Buang entri LRU tanpa pembaca sampai total ukuran <= anggaran; kembalikan jumlah yang dibuang."""
+        budget = self.budget_bytes if budget_bytes is None else budget_bytes
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= budget:
+                break
+            if self._remove_if_unused(path):
+                total -= size
+                removed += 1
+        if total > budget:
+            logger.warning("Cache %s masih %.1f MB (> anggaran %.1f MB): semua entri sisanya sedang dipakai",
+                           self.root, total / 1e6, budget / 1e6)
+        self.evictions += removed
+        return removed
+
+    def clear(self):
+        """Buang semua entri tanpa pembaca."""
+        return self.evict(budget_bytes=0)
+
+    def stats(self):
+        """Ringkasan isi cache dan pemakaian di proses ini."""
+        entries = self._entries()
+        with self._lock:
+            leases = sum(self._refs.values())
+        return {
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'budget_bytes': self.budget_bytes,
+            'leases': leases,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
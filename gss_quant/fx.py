@@ -0,0 +1,70 @@
+"""Kurs USD/IDR dan konversi harga ke Rupiah.
+
+Kurs bisa berupa satu angka (kurs hari ini) atau seri kurs penutupan harian
+IDR=X yang di-join as-of ke index aset, sehingga harga historis dikonversi
+dengan kurs pada tanggalnya sendiri.
+"""
+import numpy as np
+import pandas as pd
+
+# 1 Troy Ounce = 31.1035 Gram
+GRAM_PER_TROY_OUNCE = 31.1035
+FALLBACK_USD_IDR = 16000.0
+FX_TICKER = "IDR=X"
+
+
+def convert_price_to_idr(price_usd, is_gold, usd_idr_rate):
+    """Fungsi utilitas untuk konversi harga USD ke IDR (skalar, array, Series maupun DataFrame).
+
+    `usd_idr_rate` boleh skalar atau array kurs per baris (lihat `usd_idr_at`);
+    untuk DataFrame, kurs per baris diterapkan ke semua kolom sekaligus.
+    """
+    if is_gold:
+        price_usd = price_usd / GRAM_PER_TROY_OUNCE
+    if isinstance(price_usd, pd.DataFrame):
+        return price_usd.mul(usd_idr_rate, axis=0)
+    return price_usd * usd_idr_rate
+
+
+def _naive_utc(index):
+    index = pd.DatetimeIndex(index)
+    return index.tz_convert(None) if index.tz is not None else index
+
+
+def usd_idr_at(index, usd_idr_rate):
+    """Array kurs USD/IDR untuk setiap timestamp di `index`.
+
+    Skalar diulang apa adanya. Seri kurs (index waktu, terurut) di-join as-of:
+    setiap bar memakai kurs penutupan terakhir pada atau sebelum waktunya;
+    bar sebelum awal seri memakai kurs pertama yang ada.
+    """
+    if not isinstance(usd_idr_rate, pd.Series):
+        return np.full(len(index), float(usd_idr_rate))
+    rates = usd_idr_rate.dropna()
+    if rates.empty:
+        return np.full(len(index), FALLBACK_USD_IDR)
+    position = _naive_utc(rates.index).searchsorted(_naive_utc(index), side='right') - 1
+    return rates.to_numpy(dtype=np.float64)[np.maximum(position, 0)]
+
+
+def load_usd_idr_history(store, fetch=True):
+    """Seri kurs penutupan harian USD/IDR dari `store` (OHLCVStore; hanya bar baru yang diunduh)."""
+    history = store.refresh(FX_TICKER, "1d") if fetch else store.load(FX_TICKER, "1d")
+    return history['Close'].dropna().rename('USD_IDR')
+
+
+def fetch_usd_idr_rate(raise_errors=False):
+    """Mengambil kurs USD ke IDR hari ini (16000 jika gagal, atau exception jika `raise_errors`)"""
+    try:
+        import yfinance as yf
+
+        data = yf.Ticker("IDR=X").history(period="1d")
+        if not data.empty:
+            return float(data['Close'].iloc[-1])
+        if raise_errors:
+            raise RuntimeError("Kurs USD/IDR kosong")
+        return FALLBACK_USD_IDR
+    except Exception:
+        if raise_errors:
+            raise
+        return FALLBACK_USD_IDR
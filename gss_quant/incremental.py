@@ -0,0 +1,360 @@
+"""Indikator streaming: setiap bar baru diperbarui dalam waktu konstan.
+
+Setiap indikator menyimpan state-nya sendiri (nilai EMA, akumulator Wilder,
+ring buffer jendela rolling) sehingga bar baru tidak perlu menghitung ulang
+seluruh riwayat. Rumusnya mengikuti pandas_ta 0.4 (tanpa TA-Lib):
+
+* EMA diawali SMA dari `length` bar pertama, lalu ewm(adjust=False).
+* RMA/Wilder = ewm(alpha=1/length, adjust=False) tanpa min_periods.
+* ATR diawali SMA True Range; ATR di dalam ADX memakai TR bar pertama = NaN.
+* Bollinger Bands memakai SMA dan standar deviasi ddof=1.
+
+State bisa diserialisasi ke JSON dan disimpan di samping file Parquet OHLCV.
+"""
+import json
+import math
+import os
+import sys
+from collections import deque
+from dataclasses import asdict
+
+import pandas as pd
+
+from gss_quant import telemetry
+from gss_quant.kernels import INDICATOR_COLUMNS
+from gss_quant.params import DEFAULT_PARAMS, StrategyParams
+
+NAN = float('nan')
+_EPSILON = sys.float_info.epsilon
+
+
+def _nanmean(values):
+    valid = [v for v in values if v == v]
+    return sum(valid) / len(valid) if valid else NAN
+
+
+class EWM:
+    """Rekursi `Series.ewm(alpha=..., adjust=False).mean()` milik pandas (ignore_na=False)."""
+
+    def __init__(self, alpha):
+        self.alpha = alpha
+        self.weighted = NAN
+        self.old_wt = 1.0
+
+    def update(self, x):
+        if self.weighted == self.weighted:
+            # Bar NaN tetap meluruhkan bobot nilai lama, sama seperti pandas
+            self.old_wt *= 1.0 - self.alpha
+            if x == x:
+                if self.weighted != x:
+                    self.weighted = (self.old_wt * self.weighted + self.alpha * x) / (self.old_wt + self.alpha)
+                self.old_wt = 1.0
+        elif x == x:
+            self.weighted = x
+        return self.weighted
+
+    def to_state(self):
+        return {'alpha': self.alpha, 'weighted': self.weighted, 'old_wt': self.old_wt}
+
+    @classmethod
+    def from_state(cls, state):
+        obj = cls(state['alpha'])
+        obj.weighted = state['weighted']
+        obj.old_wt = state['old_wt']
+        return obj
+
+
+class SeededEWM:
+    """EWM yang diawali rata-rata `length` nilai pertama (EMA dan ATR pandas_ta)."""
+
+    def __init__(self, length, alpha):
+        self.length = length
+        self.seed = []  # None setelah nilai awal SMA terbentuk
+        self.ewm = EWM(alpha)
+
+    @property
+    def started(self):
+        return self.seed is None or len(self.seed) > 0
+
+    def update(self, x):
+        if self.seed is not None:
+            self.seed.append(x)
+            if len(self.seed) < self.length:
+                return NAN
+            x = _nanmean(self.seed)
+            self.seed = None
+        return self.ewm.update(x)
+
+    def to_state(self):
+        seed = None if self.seed is None else list(self.seed)
+        return {'length': self.length, 'seed': seed, 'ewm': self.ewm.to_state()}
+
+    @classmethod
+    def from_state(cls, state):
+        obj = cls(state['length'], state['ewm']['alpha'])
+        obj.seed = None if state['seed'] is None else list(state['seed'])
+        obj.ewm = EWM.from_state(state['ewm'])
+        return obj
+
+
+def ema_state(length):
+    return SeededEWM(length, 2.0 / (length + 1))
+
+
+def wilder_state(length):
+    return SeededEWM(length, 1.0 / length)
+
+
+class RollingStats:
+    """Ring buffer dengan rata-rata dan M2 geser (Welford) untuk SMA dan standar deviasi."""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, x):
+        if len(self.values) == self.window:
+            old = self.values[0]
+            if old == old:
+                self.count -= 1
+                if self.count == 0:
+                    self.mean = self.m2 = 0.0
+                else:
+                    delta = old - self.mean
+                    self.mean -= delta / self.count
+                    self.m2 -= delta * (old - self.mean)
+        self.values.append(x)
+        if x == x:
+            self.count += 1
+            delta = x - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (x - self.mean)
+
+    def sma(self):
+        return self.mean if self.count >= self.window else NAN
+
+    def std(self, ddof=1):
+        if self.count < self.window or self.count <= ddof:
+            return NAN
+        return math.sqrt(max(self.m2, 0.0) / (self.count - ddof))
+
+    def to_state(self):
+        return {'window': self.window, 'values': list(self.values), 'count': self.count, 'mean': self.mean, 'm2': self.m2}
+
+    @classmethod
+    def from_state(cls, state):
+        obj = cls(state['window'])
+        obj.values.extend(state['values'])
+        obj.count = state['count']
+        obj.mean = state['mean']
+        obj.m2 = state['m2']
+        return obj
+
+
+class IndicatorState:
+    """State semua indikator dashboard untuk satu (ticker, interval).
+
+    `update(timestamp, bar)` menambahkan bar baru, atau merevisi bar terakhir
+    jika timestamp-nya sama (bar yang belum ditutup). Keduanya O(1).
+    """
+
+    def __init__(self, params=DEFAULT_PARAMS):
+        self.params = params
+        self.count = 0
+        self.last_timestamp = None
+        self.prev_close = NAN
+        self.prev_high = NAN
+        self.prev_low = NAN
+        self.ema_fast = ema_state(params.ema_fast)
+        self.ema_mid = ema_state(params.ema_mid)
+        self.ema_long = ema_state(params.ema_long)
+        self.rsi_pos = EWM(1.0 / params.rsi_length)
+        self.rsi_neg = EWM(1.0 / params.rsi_length)
+        self.macd_fast = ema_state(params.macd_fast)
+        self.macd_slow = ema_state(params.macd_slow)
+        self.macd_signal = ema_state(params.macd_signal)
+        self.bb = RollingStats(params.bb_length)
+        self.volatility = RollingStats(params.volatility_window)
+        self.atr = wilder_state(params.atr_length)
+        self.adx_atr = wilder_state(params.adx_length)
+        self.adx_pos = EWM(1.0 / params.adx_length)
+        self.adx_neg = EWM(1.0 / params.adx_length)
+        self.adx = EWM(1.0 / params.adx_length)
+        self._before_last = None
+
+    # --- Bar baru ---
+
+    def update(self, timestamp, bar):
+        """Proses satu bar (mapping Open/High/Low/Close) dan kembalikan dict nilai indikator."""
+        timestamp = pd.Timestamp(timestamp)
+        if self.last_timestamp is not None and timestamp == self.last_timestamp:
+            if self._before_last is None:
+                raise ValueError("Bar terakhir tidak bisa direvisi setelah state dimuat ulang tanpa snapshot")
+            self._restore(self._before_last)
+        elif self.last_timestamp is not None and timestamp < self.last_timestamp:
+            raise ValueError(f"Bar {timestamp} lebih lama dari bar terakhir {self.last_timestamp}")
+        self._before_last = self._components()
+        values = self._apply(float(bar['High']), float(bar['Low']), float(bar['Close']))
+        self.count += 1
+        self.last_timestamp = timestamp
+        return values
+
+    def _apply(self, high, low, close):
+        p = self.params
+        prev_close, prev_high, prev_low = self.prev_close, self.prev_high, self.prev_low
+        out = {}
+
+        out['EMA_20'] = self.ema_fast.update(close)
+        out['EMA_50'] = self.ema_mid.update(close)
+        out['EMA_200'] = self.ema_long.update(close)
+
+        change = close - prev_close
+        pos_avg = self.rsi_pos.update(max(change, 0.0) if change == change else NAN)
+        neg_avg = self.rsi_neg.update(min(change, 0.0) if change == change else NAN)
+        denom = pos_avg + abs(neg_avg)
+        out['RSI'] = 100 * pos_avg / denom if denom else NAN
+
+        macd = self.macd_fast.update(close) - self.macd_slow.update(close)
+        out['MACD'] = macd
+        # Sinyal MACD baru mulai dihitung sejak nilai MACD pertama yang valid
+        out['MACD_SIGNAL'] = self.macd_signal.update(macd) if (macd == macd or self.macd_signal.started) else NAN
+
+        self.bb.update(close)
+        mid = self.bb.sma()
+        deviation = self.bb.std(ddof=1)
+        out['BB_UPPER'] = mid + p.bb_std * deviation
+        out['BB_MIDDLE'] = mid
+        out['BB_LOWER'] = mid - p.bb_std * deviation
+
+        self.volatility.update(close)
+        out['VOLATILITY_30D'] = self.volatility.std(ddof=1)
+
+        # True Range: bar pertama memakai High-Low (ATR) atau NaN (ATR internal ADX)
+        true_range = max(abs(high - low), abs(high - prev_close), abs(prev_close - low)) if prev_close == prev_close else NAN
+        out['ATR'] = self.atr.update(abs(high - low) if true_range != true_range else true_range)
+
+        adx_atr = self.adx_atr.update(true_range)
+        up = high - prev_high
+        dn = prev_low - low
+        pos_dm = (up if (up > dn and up > 0) else 0.0) if up == up and dn == dn else NAN
+        neg_dm = (dn if (dn > up and dn > 0) else 0.0) if up == up and dn == dn else NAN
+        pos_dm = 0.0 if abs(pos_dm) < _EPSILON else pos_dm
+        neg_dm = 0.0 if abs(neg_dm) < _EPSILON else neg_dm
+        k = 100 / adx_atr if adx_atr == adx_atr and adx_atr != 0 else NAN
+        dmp = k * self.adx_pos.update(pos_dm)
+        dmn = k * self.adx_neg.update(neg_dm)
+        dx = 100 * abs(dmp - dmn) / (dmp + dmn) if (dmp + dmn) else NAN
+        out['ADX'] = self.adx.update(dx)
+
+        self.prev_close, self.prev_high, self.prev_low = close, high, low
+        return out
+
+    @classmethod
+    def from_history(cls, df, params=DEFAULT_PARAMS):
+        """Bangun state dari riwayat OHLCV; kembalikan (state, DataFrame kolom indikator)."""
+        state = cls(params)
+        rows = [
+            state.update(ts, {'High': high, 'Low': low, 'Close': close})
+            for ts, high, low, close in zip(df.index, df['High'], df['Low'], df['Close'])
+        ]
+        return state, pd.DataFrame(rows, index=df.index, columns=INDICATOR_COLUMNS)
+
+    # --- Serialisasi ---
+
+    _EWM_FIELDS = ('rsi_pos', 'rsi_neg', 'adx_pos', 'adx_neg', 'adx')
+    _SEEDED_FIELDS = ('ema_fast', 'ema_mid', 'ema_long', 'macd_fast', 'macd_slow', 'macd_signal', 'atr', 'adx_atr')
+    _ROLLING_FIELDS = ('bb', 'volatility')
+
+    def _components(self):
+        state = {name: getattr(self, name).to_state() for name in self._EWM_FIELDS + self._SEEDED_FIELDS + self._ROLLING_FIELDS}
+        state.update(count=self.count, prev_close=self.prev_close, prev_high=self.prev_high, prev_low=self.prev_low,
+                     last_timestamp=None if self.last_timestamp is None else self.last_timestamp.isoformat())
+        return state
+
+    def _restore(self, state):
+        for name in self._EWM_FIELDS:
+            setattr(self, name, EWM.from_state(state[name]))
+        for name in self._SEEDED_FIELDS:
+            setattr(self, name, SeededEWM.from_state(state[name]))
+        for name in self._ROLLING_FIELDS:
+            setattr(self, name, RollingStats.from_state(state[name]))
+        self.count = state['count']
+        self.prev_close, self.prev_high, self.prev_low = state['prev_close'], state['prev_high'], state['prev_low']
+        self.last_timestamp = None if state['last_timestamp'] is None else pd.Timestamp(state['last_timestamp'])
+
+    def to_dict(self):
+        """State lengkap (termasuk snapshot sebelum bar terakhir) sebagai dict siap JSON."""
+        return {'params': asdict(self.params), 'current': self._components(), 'before_last': self._before_last}
+
+    @classmethod
+    def from_dict(cls, data):
+        state = cls(StrategyParams(**data['params']))
+        state._restore(data['current'])
+        state._before_last = data['before_last']
+        return state
+
+    def save(self, path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def refresh_indicators(store, ticker, interval="1d", params=DEFAULT_PARAMS, fetch=True):
+    """Perbarui OHLCV dan kolom indikator; hanya bar baru yang diproses.
+
+    Kolom indikator dan state disimpan di samping file Parquet OHLCV. Jika
+    state tidak cocok dengan riwayat (parameter berubah, riwayat lama direvisi),
+    state dibangun ulang dari awal sekali. Dengan `fetch=False` provider tidak
+    dihubungi; hanya riwayat yang sudah tersimpan yang diproses.
+    """
+    with telemetry.span('store_refresh' if fetch else 'store_load', ticker=ticker, interval=interval):
+        history = store.refresh(ticker, interval) if fetch else store.load(ticker, interval)
+    if history.empty:
+        return history.reindex(columns=[*history.columns, *INDICATOR_COLUMNS])
+    state_path = store.sidecar_path(ticker, interval, 'state.json')
+    frame_path = store.sidecar_path(ticker, interval, 'indicators.parquet')
+
+    with store.lock(ticker, interval), telemetry.span('indicators', ticker=ticker, interval=interval):
+        state = indicators = None
+        if state_path.exists() and frame_path.exists():
+            state = IndicatorState.load(state_path)
+            indicators = pd.read_parquet(frame_path)
+            consistent = (
+                state.params == params
+                and 0 < state.count <= len(history)
+                and len(indicators) == state.count
+                and history.index[state.count - 1] == state.last_timestamp
+            )
+            if not consistent:
+                state = indicators = None
+
+        changed = True
+        if state is None:
+            state, indicators = IndicatorState.from_history(history, params)
+        else:
+            # Bar terakhir yang tersimpan ikut diproses ulang (revisi), lalu bar baru
+            new_bars = history.iloc[state.count - 1:]
+            rows = [
+                state.update(ts, {'High': high, 'Low': low, 'Close': close})
+                for ts, high, low, close in zip(new_bars.index, new_bars['High'], new_bars['Low'], new_bars['Close'])
+            ]
+            fresh = pd.DataFrame(rows, index=new_bars.index, columns=INDICATOR_COLUMNS)
+            # Tanpa bar baru dan tanpa revisi bar terakhir, file indikator dan state tidak ditulis ulang
+            changed = len(fresh) > 1 or not fresh.equals(indicators.iloc[-1:])
+            if changed:
+                indicators = pd.concat([indicators.iloc[:-1], fresh])
+
+        if changed:
+            indicators.to_parquet(frame_path)
+            state.save(state_path)
+
+    return history.join(indicators)
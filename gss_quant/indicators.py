@@ -0,0 +1,83 @@
+"""Perhitungan indikator teknikal (basis USD) yang dipakai dashboard dan backtest.
+
+Semua angka berasal dari kernel tergabung di `gss_quant.kernels` (Numba bila
+tersedia, NumPy bila tidak) dengan semantik pandas_ta 0.4.
+"""
+import pandas as pd
+
+from gss_quant import kernels
+from gss_quant.kernels import INDICATOR_COLUMNS, indicator_frame
+from gss_quant.params import DEFAULT_PARAMS
+
+
+def add_indicators(df, params=DEFAULT_PARAMS):
+    """Tambahkan kolom indikator ke DataFrame OHLCV (in-place) dan kembalikan df.
+
+    Nama kolom selalu mengikuti dashboard (EMA_50, EMA_200, RSI, ...) apa pun
+    panjang indikator di `params`.
+    """
+    df[INDICATOR_COLUMNS] = indicator_frame(df, params).to_numpy()
+    return df
+
+
+# --- KOLOM INDIKATOR BERBAGI (untuk sweep parameter) ---
+# Setiap spec menghasilkan kolom dengan nama unik, sehingga satu set kolom per
+# ticker bisa dipakai ulang oleh banyak kombinasi parameter.
+
+def scoring_specs(params):
+    """Spec indikator yang dibutuhkan Quantum Score untuk `params`."""
+    return [
+        ('EMA', params.ema_mid),
+        ('EMA', params.ema_long),
+        ('RSI', params.rsi_length),
+        ('MACD', params.macd_fast, params.macd_slow, params.macd_signal),
+        ('BB', params.bb_length, params.bb_std),
+        ('ADX', params.adx_length),
+    ]
+
+
+def spec_columns(spec):
+    """Nama kolom unik yang dihasilkan oleh satu spec."""
+    kind, *args = spec
+    suffix = '_'.join(str(a) for a in args)
+    if kind == 'MACD':
+        return [f'MACD_{suffix}', f'MACDs_{suffix}']
+    if kind == 'BB':
+        return [f'BBU_{suffix}', f'BBL_{suffix}']
+    return [f'{kind}_{suffix}']
+
+
+# Spec -> kernel satu indikator; argumen spec diteruskan apa adanya
+_SPEC_KERNELS = {
+    'EMA': lambda df, length: [kernels.ema(df['Close'], length)],
+    'RSI': lambda df, length: [kernels.rsi(df['Close'], length)],
+    'MACD': lambda df, fast, slow, signal: list(kernels.macd(df['Close'], fast, slow, signal)),
+    # (atas, tengah, bawah) -> atas, bawah
+    'BB': lambda df, length, std: list(kernels.bollinger(df['Close'], length, std))[::2],
+    'ADX': lambda df, length: [kernels.adx(df['High'], df['Low'], df['Close'], length)],
+}
+
+
+def compute_spec(df, spec):
+    """Hitung satu spec indikator -> dict nama kolom unik ke Series (hanya kernel indikator itu)."""
+    kind, *args = spec
+    if kind not in _SPEC_KERNELS:
+        raise ValueError(f"Spec indikator tidak dikenal: {spec!r}")
+    values = _SPEC_KERNELS[kind](df, *args)
+    return {name: pd.Series(v, index=df.index) for name, v in zip(spec_columns(spec), values)}
+
+
+def scoring_frame(panel, params):
+    """Ambil kolom panel bersama dan beri nama standar dashboard untuk `params`."""
+    ema_mid, ema_long, rsi, macd, bb, adx = (spec_columns(s) for s in scoring_specs(params))
+    return pd.DataFrame({
+        'Close': panel['Close'],
+        'EMA_50': panel[ema_mid[0]],
+        'EMA_200': panel[ema_long[0]],
+        'RSI': panel[rsi[0]],
+        'MACD': panel[macd[0]],
+        'MACD_SIGNAL': panel[macd[1]],
+        'BB_UPPER': panel[bb[0]],
+        'BB_LOWER': panel[bb[1]],
+        'ADX': panel[adx[0]],
+    }, index=panel.index)
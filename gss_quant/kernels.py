@@ -0,0 +1,267 @@
+"""Kernel indikator tergabung untuk array float64 1-D (bar) atau 2-D (ticker x bar).
+
+Semua indikator dashboard (EMA 20/50/200, RSI, MACD, Bollinger Bands, ADX,
+ATR, volatilitas 30 bar) dihitung dalam satu panggilan dengan rumus yang
+sama seperti `gss_quant.incremental` (semantik pandas_ta 0.4; kedua backend
+diuji terhadap nilai acuan pandas_ta di `tests/data/pandas_ta_reference.csv`):
+
+* backend "numba": satu lintasan per ticker, paralel antar ticker;
+* backend "numpy": operasi kolom NumPy, rekursi EWM dan jendela rolling
+  memakai implementasi terkompilasi pandas. Dipakai bila numba tidak ada.
+
+numba baru di-import saat kernel pertama kali dipanggil.
+"""
+import numpy as np
+import pandas as pd
+
+from gss_quant.params import DEFAULT_PARAMS
+
+INDICATOR_COLUMNS = [
+    'EMA_20', 'EMA_50', 'EMA_200', 'RSI', 'MACD', 'MACD_SIGNAL',
+    'BB_UPPER', 'BB_MIDDLE', 'BB_LOWER', 'ADX', 'VOLATILITY_30D', 'ATR',
+]
+
+_EPSILON = np.finfo(float).eps
+_numba_module = None
+
+
+def _numba():
+    """Modul kernel Numba, atau None jika numba tidak terpasang."""
+    global _numba_module
+    if _numba_module is None:
+        try:
+            from gss_quant import _numba_kernels
+        except ImportError:
+            _numba_module = False
+        else:
+            _numba_module = _numba_kernels
+    return _numba_module or None
+
+
+def default_backend():
+    return "numba" if _numba() is not None else "numpy"
+
+
+def _param_vector(params):
+    return np.array([
+        params.ema_fast, params.ema_mid, params.ema_long, params.rsi_length,
+        params.macd_fast, params.macd_slow, params.macd_signal,
+        params.bb_length, params.bb_std, params.adx_length, params.atr_length, params.volatility_window,
+    ], dtype=np.float64)
+
+
+# --- BACKEND NUMPY ---
+# Array selalu 2-D (ticker x bar); pandas bekerja per kolom sehingga ditransposisi.
+
+def _ewm(x, alpha):
+    return pd.DataFrame(x.T).ewm(alpha=alpha, adjust=False).mean().to_numpy().T
+
+
+def _seeded_ewm(x, length, alpha):
+    """EWM yang diawali rata-rata (abaikan NaN) dari `length` bar pertama."""
+    seeded = np.full_like(x, np.nan)
+    if x.shape[1] >= length:
+        head = x[:, :length]
+        valid = ~np.isnan(head)
+        count = valid.sum(axis=1)
+        total = np.where(valid, head, 0.0).sum(axis=1)
+        seeded[:, length - 1] = np.where(count > 0, total / np.maximum(count, 1), np.nan)
+        seeded[:, length:] = x[:, length:]
+    return _ewm(seeded, alpha)
+
+
+def _seeded_ewm_from_first_valid(x, length, alpha):
+    """Seperti `_seeded_ewm`, tetapi seed setiap baris dimulai dari nilai valid pertamanya."""
+    valid = ~np.isnan(x)
+    start = np.where(valid.any(axis=1), valid.argmax(axis=1), x.shape[1])
+    out = np.full_like(x, np.nan)
+    for offset in np.unique(start):
+        if offset >= x.shape[1]:
+            continue
+        rows = start == offset
+        out[rows, offset:] = _seeded_ewm(x[rows, offset:], length, alpha)
+    return out
+
+
+def _rolling(x, window):
+    return pd.DataFrame(x.T).rolling(window)
+
+
+def _previous(x):
+    prev = np.empty_like(x)
+    prev[:, 0] = np.nan
+    prev[:, 1:] = x[:, :-1]
+    return prev
+
+
+# Kernel per indikator: dipakai bersama oleh backend gabungan dan spec sweep parameter
+
+def _ema(close, length):
+    return _seeded_ewm(close, length, 2.0 / (length + 1))
+
+
+def _rsi(close, length):
+    change = close - _previous(close)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pos_avg = _ewm(np.where(np.isnan(change), np.nan, np.maximum(change, 0.0)), 1.0 / length)
+        neg_avg = _ewm(np.where(np.isnan(change), np.nan, np.minimum(change, 0.0)), 1.0 / length)
+        denom = pos_avg + np.abs(neg_avg)
+        return np.where(denom != 0, 100 * pos_avg / denom, np.nan)
+
+
+def _macd(close, fast, slow, signal):
+    macd = _ema(close, fast) - _ema(close, slow)
+    return macd, _seeded_ewm_from_first_valid(macd, signal, 2.0 / (signal + 1))
+
+
+def _bollinger(close, length, std):
+    bb = _rolling(close, length)
+    mid = bb.mean().to_numpy().T
+    deviation = bb.std(ddof=1).to_numpy().T
+    return mid + std * deviation, mid, mid - std * deviation
+
+
+def _true_range(high, low, close):
+    # Bar pertama NaN; ATR menggantinya dengan High-Low, ATR internal ADX tidak
+    prev_close = _previous(close)
+    with np.errstate(invalid='ignore'):
+        return np.maximum(np.abs(high - low), np.maximum(np.abs(high - prev_close), np.abs(prev_close - low)))
+
+
+def _adx(high, low, close, length, true_range=None):
+    true_range = _true_range(high, low, close) if true_range is None else true_range
+    with np.errstate(invalid='ignore', divide='ignore'):
+        adx_atr = _seeded_ewm(true_range, length, 1.0 / length)
+        up = high - _previous(high)
+        dn = _previous(low) - low
+        has_dm = ~np.isnan(up) & ~np.isnan(dn)
+        pos_dm = np.where(has_dm, np.where((up > dn) & (up > 0), up, 0.0), np.nan)
+        neg_dm = np.where(has_dm, np.where((dn > up) & (dn > 0), dn, 0.0), np.nan)
+        pos_dm[np.abs(pos_dm) < _EPSILON] = 0.0
+        neg_dm[np.abs(neg_dm) < _EPSILON] = 0.0
+        k = np.where(adx_atr != 0, 100 / adx_atr, np.nan)
+        dmp = k * _ewm(pos_dm, 1.0 / length)
+        dmn = k * _ewm(neg_dm, 1.0 / length)
+        total = dmp + dmn
+        dx = np.where(total != 0, 100 * np.abs(dmp - dmn) / total, np.nan)
+        return _ewm(dx, 1.0 / length)
+
+
+def _numpy_indicators(high, low, close, params):
+    p = params
+    out = {}
+    out['EMA_20'] = _ema(close, p.ema_fast)
+    out['EMA_50'] = _ema(close, p.ema_mid)
+    out['EMA_200'] = _ema(close, p.ema_long)
+    out['RSI'] = _rsi(close, p.rsi_length)
+    out['MACD'], out['MACD_SIGNAL'] = _macd(close, p.macd_fast, p.macd_slow, p.macd_signal)
+    out['BB_UPPER'], out['BB_MIDDLE'], out['BB_LOWER'] = _bollinger(close, p.bb_length, p.bb_std)
+    true_range = _true_range(high, low, close)
+    out['ADX'] = _adx(high, low, close, p.adx_length, true_range)
+    with np.errstate(invalid='ignore'):
+        out['VOLATILITY_30D'] = _rolling(close, p.volatility_window).std(ddof=1).to_numpy().T
+        atr_input = np.where(np.isnan(true_range), np.abs(high - low), true_range)
+        out['ATR'] = _seeded_ewm(atr_input, p.atr_length, 1.0 / p.atr_length)
+    return out
+
+
+# --- API ---
+
+def _compute_block(high, low, close, params, backend):
+    """Array (kolom indikator, ticker, bar) untuk input 2-D yang sudah kontigu."""
+    backend = backend or default_backend()
+    if backend == "numba":
+        kernels = _numba()
+        if kernels is None:
+            raise ImportError("Backend 'numba' dipilih tetapi numba tidak terpasang")
+        out = np.empty((len(INDICATOR_COLUMNS),) + close.shape)
+        if close.shape[0] == 1:
+            kernels.fused_row(high[0], low[0], close[0], _param_vector(params), out[:, 0, :])
+        else:
+            kernels.fused_panel(high, low, close, _param_vector(params), out)
+        return out
+    if backend == "numpy":
+        result = _numpy_indicators(high, low, close, params)
+        return np.stack([result[name] for name in INDICATOR_COLUMNS])
+    raise ValueError(f"Backend tidak dikenal: {backend!r}")
+
+
+def _as_panel(*arrays):
+    return tuple(np.ascontiguousarray(np.asarray(a, dtype=np.float64).reshape(-1, np.shape(a)[-1])) for a in arrays)
+
+
+def compute_indicators(high, low, close, params=DEFAULT_PARAMS, backend=None):
+    """Semua kolom `INDICATOR_COLUMNS` untuk array High/Low/Close.
+
+    Input 1-D (bar) atau 2-D (ticker x bar, NaN untuk bar yang tidak ada);
+    hasil berupa dict nama kolom -> array dengan bentuk yang sama.
+    `backend` "numba" atau "numpy"; bawaan numba bila terpasang.
+    """
+    shape = np.shape(close)
+    if len(shape) not in (1, 2):
+        raise ValueError(f"Input harus 1-D atau 2-D, bukan {len(shape)}-D")
+    block = _compute_block(*_as_panel(high, low, close), params, backend)
+    return {name: values.reshape(shape) for name, values in zip(INDICATOR_COLUMNS, block)}
+
+
+def indicator_frame(df, params=DEFAULT_PARAMS, backend=None):
+    """DataFrame kolom indikator untuk DataFrame OHLCV satu ticker (index sama dengan `df`)."""
+    block = _compute_block(*_as_panel(df['High'], df['Low'], df['Close']), params, backend)
+    return pd.DataFrame(block[:, 0, :].T, index=df.index, columns=INDICATOR_COLUMNS)
+
+
+def universe_indicators(frames, params=DEFAULT_PARAMS, backend=None):
+    """Indikator untuk banyak ticker sekaligus: dict ticker -> DataFrame OHLCV menjadi dict ticker -> DataFrame indikator.
+
+    Setiap seri diletakkan rata kiri dalam satu array 2-D; sisa bar di kanan
+    diisi NaN dan tidak memengaruhi hasil karena semua indikator kausal.
+    """
+    tickers = list(frames)
+    if not tickers:
+        return {}
+    lengths = [len(frames[t]) for t in tickers]
+    high, low, close = (np.full((len(tickers), max(lengths)), np.nan) for _ in range(3))
+    for i, ticker in enumerate(tickers):
+        df = frames[ticker]
+        high[i, :lengths[i]] = df['High'].to_numpy(dtype=np.float64)
+        low[i, :lengths[i]] = df['Low'].to_numpy(dtype=np.float64)
+        close[i, :lengths[i]] = df['Close'].to_numpy(dtype=np.float64)
+    block = _compute_block(high, low, close, params, backend)
+    return {
+        ticker: pd.DataFrame(block[:, i, :lengths[i]].T, index=frames[ticker].index, columns=INDICATOR_COLUMNS)
+        for i, ticker in enumerate(tickers)
+    }
+
+
+# --- INDIKATOR TUNGGAL ---
+# Satu indikator dengan panjang bebas (backend NumPy), untuk sweep parameter
+# yang hanya membutuhkan kolom tertentu. Input 1-D atau 2-D seperti `compute_indicators`.
+
+def _single(kernel, arrays, *args):
+    shape = np.shape(arrays[-1])
+    result = kernel(*_as_panel(*arrays), *args)
+    if isinstance(result, tuple):
+        return tuple(r.reshape(shape) for r in result)
+    return result.reshape(shape)
+
+
+def ema(close, length):
+    return _single(_ema, (close,), length)
+
+
+def rsi(close, length):
+    return _single(_rsi, (close,), length)
+
+
+def macd(close, fast, slow, signal):
+    """(MACD, garis sinyal)."""
+    return _single(_macd, (close,), fast, slow, signal)
+
+
+def bollinger(close, length, std):
+    """(band atas, tengah, bawah)."""
+    return _single(_bollinger, (close,), length, std)
+
+
+def adx(high, low, close, length):
+    return _single(_adx, (high, low, close), length)
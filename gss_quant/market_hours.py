@@ -0,0 +1,63 @@
+"""Jam perdagangan per kelas aset (dipakai penjadwal prefetch).
+
+* Crypto: 24/7.
+* ETF / Stock (bursa AS): Senin-Jumat 09:30-16:00 waktu New York.
+* Commodity (futures CME Globex, mis. GC=F): Minggu 18:00 - Jumat 17:00
+  waktu New York dengan jeda harian 17:00-18:00.
+
+Hari libur bursa tidak dimodelkan; pada hari libur pasar dianggap buka dan
+prefetch hanya membuang beberapa permintaan.
+"""
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def _always_open(local):
+    return True
+
+
+def _us_equity_open(local):
+    return local.weekday() < 5 and time(9, 30) <= local.time() < time(16, 0)
+
+
+def _cme_globex_open(local):
+    weekday, t = local.weekday(), local.time()
+    if weekday == 5:  # Sabtu
+        return False
+    if weekday == 6:  # Minggu: buka 18:00
+        return t >= time(18, 0)
+    if weekday == 4:  # Jumat: tutup 17:00 sampai Minggu
+        return t < time(17, 0)
+    return not time(17, 0) <= t < time(18, 0)
+
+
+# Tipe aset (kolom "type" di ASSETS) -> fungsi "buka?" dalam waktu New York
+SESSIONS = {
+    'Crypto': _always_open,
+    'ETF': _us_equity_open,
+    'Stock': _us_equity_open,
+    'Commodity': _cme_globex_open,
+}
+
+
+def infer_asset_type(ticker):
+    """Tebak tipe aset dari format ticker Yahoo (untuk watchlist di luar ASSETS)."""
+    if ticker.endswith('-USD'):
+        return 'Crypto'
+    if ticker.endswith('=F'):
+        return 'Commodity'
+    return 'Stock'
+
+
+def is_market_open(asset_type, when=None, grace=timedelta(0)):
+    """True jika pasar `asset_type` buka pada `when` (datetime ber-zona waktu, bawaan sekarang).
+
+    Dengan `grace`, pasar yang baru tutup kurang dari `grace` lalu masih
+    dianggap buka agar bar penutupan ikut terambil. Tipe tidak dikenal
+    dianggap selalu buka.
+    """
+    is_open = SESSIONS.get(asset_type, _always_open)
+    when = when or datetime.now(timezone.utc)
+    return is_open(when.astimezone(NEW_YORK)) or (grace > timedelta(0) and is_open((when - grace).astimezone(NEW_YORK)))
@@ -0,0 +1,45 @@
+"""Parameter strategi: panjang indikator, ambang skor dan batas sinyal."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StrategyParams:
+    """Semua angka yang sebelumnya di-hard-code di dashboard.
+
+    Nilai bawaan sama persis dengan perilaku dashboard v9.
+    """
+    # Panjang indikator (get_market_data)
+    ema_fast: int = 20
+    ema_mid: int = 50
+    ema_long: int = 200
+    rsi_length: int = 14
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal: int = 9
+    bb_length: int = 20
+    bb_std: float = 2.0
+    adx_length: int = 14
+    atr_length: int = 14
+    volatility_window: int = 30
+
+    # Ambang skor (analyze_signal)
+    rsi_oversold: float = 30.0
+    rsi_overbought: float = 70.0
+    adx_trend: float = 25.0
+
+    # Batas sinyal (main)
+    strong_buy: int = 75
+    buy: int = 55
+    strong_sell: int = 25
+
+    def is_valid(self):
+        """Kombinasi parameter masuk akal (dipakai untuk menyaring grid sweep)."""
+        return (
+            0 < self.ema_mid < self.ema_long
+            and 0 < self.macd_fast < self.macd_slow
+            and self.rsi_oversold < self.rsi_overbought
+            and self.strong_sell < self.buy <= self.strong_buy
+        )
+
+
+DEFAULT_PARAMS = StrategyParams()
@@ -0,0 +1,107 @@
+"""Penjadwal prefetch latar yang sadar jam pasar.
+
+Satu thread daemon memperbarui setiap ticker terdaftar secara berkala agar
+permintaan pengguna hampir selalu mengenai cache yang hangat:
+
+* ticker yang baru dilihat (`touch`) diperbarui lebih dulu dan lebih sering;
+* pasar yang tutup dilewati (setelah satu kali pemanasan saat start);
+* pembaruan dijalankan berurutan sehingga tidak menambah beban provider.
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from gss_quant.market_hours import infer_asset_type, is_market_open
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchScheduler:
+    """Panggil `refresh(ticker)` untuk setiap ticker sesuai jadwal.
+
+    `assets` adalah dict ticker -> tipe aset (lihat `gss_quant.market_hours`).
+    Ticker yang dilihat dalam `hot_window` detik terakhir diperbarui setiap
+    `interval` detik, sisanya setiap `idle_interval` detik.
+    """
+
+    def __init__(self, refresh, assets, interval=45.0, idle_interval=300.0, hot_window=900.0,
+                 close_grace=timedelta(minutes=20), tick=1.0):
+        self._refresh = refresh
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.hot_window = hot_window
+        self.close_grace = close_grace
+        self.tick = tick
+        self._assets = dict(assets)
+        self._last_refresh = {}
+        self._last_viewed = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add(self, ticker, asset_type=None):
+        """Daftarkan ticker (tipe ditebak dari format ticker jika tidak diberikan)."""
+        with self._lock:
+            self._assets.setdefault(ticker, asset_type or infer_asset_type(ticker))
+        self._wake.set()
+
+    def touch(self, ticker):
+        """Catat bahwa `ticker` baru saja dilihat pengguna (menaikkan prioritasnya)."""
+        with self._lock:
+            self._assets.setdefault(ticker, infer_asset_type(ticker))
+            self._last_viewed[ticker] = time.monotonic()
+        self._wake.set()
+
+    def due(self, now=None, wall=None):
+        """Ticker yang perlu diperbarui sekarang, yang terakhir dilihat lebih dulu."""
+        now = time.monotonic() if now is None else now
+        wall = wall or datetime.now(timezone.utc)
+        due = []
+        with self._lock:
+            for ticker, asset_type in self._assets.items():
+                last = self._last_refresh.get(ticker)
+                if last is not None and not is_market_open(asset_type, wall, self.close_grace):
+                    continue
+                viewed = self._last_viewed.get(ticker)
+                hot = viewed is not None and now - viewed < self.hot_window
+                if last is None or now - last >= (self.interval if hot else self.idle_interval):
+                    due.append(ticker)
+            due.sort(key=lambda t: self._last_viewed.get(t, float('-inf')), reverse=True)
+        return due
+
+    def run_once(self):
+        """Perbarui semua ticker yang jatuh tempo; kembalikan daftar ticker yang diproses."""
+        due = self.due()
+        for ticker in due:
+            if self._stop.is_set():
+                break
+            try:
+                self._refresh(ticker)
+            except Exception:
+                # Tetap dicatat agar ticker yang gagal tidak dicoba ulang setiap detik
+                logger.warning("Prefetch %s gagal", ticker, exc_info=True)
+            with self._lock:
+                self._last_refresh[ticker] = time.monotonic()
+        return due
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.run_once()
+            self._wake.wait(self.tick)
+            self._wake.clear()
+
+    def start(self):
+        """Jalankan thread daemon (tidak melakukan apa-apa jika sudah berjalan)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='gss-prefetch', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -0,0 +1,111 @@
+"""Sumber data OHLCV yang bisa diganti-ganti (Yahoo Finance atau file lokal)."""
+import re
+from pathlib import Path
+
+import pandas as pd
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+_PERIOD_RE = re.compile(r'(\d+)(d|wk|mo|y)')
+_PERIOD_UNITS = {'d': 'days', 'wk': 'weeks', 'mo': 'months', 'y': 'years'}
+
+
+def slice_period(df, period):
+    """Potong `df` ke jendela `period` gaya yfinance ("1y", "6mo", "ytd", "max") dihitung dari bar terakhir."""
+    if df.empty or period in (None, 'max'):
+        return df
+    end = df.index[-1]
+    if period == 'ytd':
+        start = end.normalize().replace(month=1, day=1)
+    else:
+        match = _PERIOD_RE.fullmatch(period)
+        if not match:
+            raise ValueError(f"Period tidak dikenal: {period!r}")
+        start = end - pd.DateOffset(**{_PERIOD_UNITS[match.group(2)]: int(match.group(1))})
+    return df[df.index >= start]
+
+
+def normalize_ohlcv(df):
+    """Rapikan hasil download: kolom datar, Close terisi, hanya kolom OHLCV float64 berurutan waktu."""
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    if 'Close' not in df.columns and 'Adj Close' in df.columns:
+        df['Close'] = df['Adj Close']
+    if df.empty or 'Close' not in df.columns:
+        return pd.DataFrame(columns=OHLCV_COLUMNS, dtype=float)
+    df = df.reindex(columns=OHLCV_COLUMNS).astype(float)
+    df = df[~df.index.duplicated(keep='last')].sort_index()
+    df.index.name = 'Date'
+    return df
+
+
+class MarketDataProvider:
+    """Antarmuka penyedia data OHLCV.
+
+    `fetch` mengembalikan bar untuk `ticker` sejak `start` (inklusif), atau
+    sepanjang `period` jika `start` tidak diberikan.
+    """
+    name = "base"
+
+    def fetch(self, ticker, interval="1d", start=None, period="max"):
+        raise NotImplementedError
+
+    def fetch_many(self, tickers, interval="1d", period="1y"):
+        """Ambil banyak ticker sekaligus -> dict ticker ke DataFrame OHLCV.
+
+        Implementasi bawaan memanggil `fetch` satu per satu; provider yang
+        mendukung permintaan multi-ticker sebaiknya meng-override ini.
+        """
+        return {ticker: self.fetch(ticker, interval, period=period) for ticker in tickers}
+
+
+class YahooProvider(MarketDataProvider):
+    """Data dari Yahoo Finance melalui yfinance."""
+    name = "yahoo"
+
+    def fetch(self, ticker, interval="1d", start=None, period="max"):
+        import yfinance as yf
+
+        if start is not None:
+            df = yf.download(ticker, start=start, interval=interval, progress=False)
+        else:
+            df = yf.download(ticker, period=period, interval=interval, progress=False)
+        return normalize_ohlcv(df)
+
+    def fetch_many(self, tickers, interval="1d", period="1y"):
+        import yfinance as yf
+
+        # Satu permintaan untuk seluruh batch; kolom berbentuk (ticker, field)
+        df = yf.download(list(tickers), period=period, interval=interval, group_by='ticker',
+                         progress=False, threads=False)
+        available = set(df.columns.get_level_values(0)) if isinstance(df.columns, pd.MultiIndex) else set()
+        return {
+            ticker: normalize_ohlcv(df[ticker].dropna(how='all')) if ticker in available else normalize_ohlcv(pd.DataFrame())
+            for ticker in tickers
+        }
+
+
+class LocalFileProvider(MarketDataProvider):
+    """Data dari file lokal `<root>/<ticker>_<interval>.parquet` atau `.csv`.
+
+    Dipakai untuk kerja offline dan pengujian tanpa jaringan.
+    """
+    name = "local"
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def fetch(self, ticker, interval="1d", start=None, period="max"):
+        stem = f"{ticker}_{interval}"
+        parquet_path = self.root / f"{stem}.parquet"
+        csv_path = self.root / f"{stem}.csv"
+        if parquet_path.exists():
+            df = pd.read_parquet(parquet_path)
+        elif csv_path.exists():
+            df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+        else:
+            return normalize_ohlcv(pd.DataFrame())
+        df = normalize_ohlcv(df)
+        if start is not None:
+            return df[df.index >= pd.Timestamp(start)]
+        return slice_period(df, period)
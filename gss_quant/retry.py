@@ -0,0 +1,15 @@
+"""Retry dengan exponential backoff + jitter untuk panggilan ke penyedia data."""
+import random
+import time
+
+
+def call_with_retry(fn, *args, attempts=3, base_delay=1.0, max_delay=8.0, retry_on=(Exception,), **kwargs):
+    """Panggil `fn`; ulangi hingga `attempts` kali dengan jeda 1x, 2x, 4x ... `base_delay` (maks `max_delay`)."""
+    for attempt in range(attempts):
+        try:
+            return fn(*args, **kwargs)
+        except retry_on:
+            if attempt == attempts - 1:
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt)
+            time.sleep(delay * random.uniform(0.5, 1.0))
@@ -0,0 +1,251 @@
+"""Mesin risiko Monte Carlo: VaR, Expected Shortfall dan peluang kena stop-loss ATR (USD & IDR).
+
+Jalur harga disimulasikan dari return log harian terbaru satu aset atau
+portofolio berbobot, dengan salah satu model:
+
+* "bootstrap": baris return historis diambil ulang utuh (korelasi antar-aset terjaga);
+* "gbm": return normal multivariat dengan rata-rata dan kovarians historis;
+* "garch": GARCH(1,1) per aset (dikalibrasi dengan pencarian grid
+  likelihood), residual terstandardisasi diambil ulang per baris
+  (filtered historical simulation).
+
+Jika return kurs (`FX_TICKER`) ikut disertakan, kurs USD/IDR disimulasikan
+bersama aset sehingga nilai IDR memuat risiko kurs; tanpa itu kurs tetap.
+
+Simulasi sepenuhnya tervektorisasi atas jalur dan berjalan per potongan
+(`chunk_bytes`) sehingga memori terbatas berapa pun jumlah jalurnya. Setiap
+grup `_PATH_GROUP` jalur punya generator acak sendiri, sehingga hasilnya tidak
+bergantung pada ukuran potongan; jalur dibagi ke beberapa proses dengan benih
+turunan `SeedSequence` (hasil deterministik untuk pasangan `seed` + `workers`
+yang sama).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from gss_quant.fx import FX_TICKER, convert_price_to_idr
+
+MODELS = ('bootstrap', 'gbm', 'garch')
+DEFAULT_CONFIDENCE = (0.95, 0.99)
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+# Langkah per blok untuk model tanpa state (bootstrap/gbm): cumsum per blok, bukan per langkah
+_STEP_BLOCK = 50
+# Jalur per generator acak; potongan simulasi selalu berisi grup utuh
+_PATH_GROUP = 4096
+
+_GARCH_ALPHAS = np.array([0.02, 0.05, 0.08, 0.12, 0.16, 0.20])
+_GARCH_BETAS = np.array([0.70, 0.80, 0.85, 0.90, 0.94, 0.97])
+
+
+@dataclass(frozen=True)
+class ReturnModel:
+    """Model return hasil `calibrate` (picklable, dikirim ke proses worker)."""
+    kind: str
+    tickers: tuple
+    sample: np.ndarray                   # baris return (bootstrap) atau residual terstandardisasi (garch)
+    mu: np.ndarray
+    chol: Optional[np.ndarray] = None    # gbm
+    omega: Optional[np.ndarray] = None   # garch
+    alpha: Optional[np.ndarray] = None
+    beta: Optional[np.ndarray] = None
+    sigma2: Optional[np.ndarray] = None  # varians bersyarat untuk langkah pertama
+
+
+def joint_returns(returns):
+    """Return log pada hari semua kolom memiliki bar.
+
+    Pergerakan di hari ketika hanya sebagian aset diperdagangkan (mis. kripto
+    di akhir pekan) diakumulasikan ke hari bersama berikutnya, bukan dibuang.
+    """
+    levels = returns.fillna(0.0).cumsum().where(returns.notna())
+    return levels.dropna().diff().dropna()
+
+
+def _garch_filter(r, omega, alpha, beta, sigma2_0):
+    """Varians bersyarat untuk setiap bar (r: T x ...; parameter di-broadcast ke bentuk baris)."""
+    sigma2 = np.empty_like(r * alpha)
+    current = np.broadcast_to(sigma2_0, sigma2.shape[1:]).astype(np.float64)
+    for t in range(len(r)):
+        sigma2[t] = current
+        current = omega + alpha * r[t] ** 2 + beta * current
+    return sigma2, current
+
+
+def _fit_garch(r):
+    """Parameter GARCH(1,1) per kolom dengan variance targeting dan grid (alpha, beta)."""
+    alpha, beta = np.meshgrid(_GARCH_ALPHAS, _GARCH_BETAS, indexing='ij')
+    valid = alpha + beta < 0.999
+    alpha, beta = alpha[valid][:, None], beta[valid][:, None]             # G x 1
+    variance = r.var(axis=0)                                              # K
+    omega = variance * (1.0 - alpha - beta)                               # G x K
+    sigma2, _ = _garch_filter(r[:, None, :], omega, alpha, beta, variance)  # T x G x K
+    loglik = -0.5 * (np.log(sigma2) + r[:, None, :] ** 2 / sigma2).sum(axis=0)
+    best = loglik.argmax(axis=0)                                          # K
+    columns = np.arange(r.shape[1])
+    return omega[best, columns], alpha[best, 0], beta[best, 0]
+
+
+def calibrate(returns, model='bootstrap', lookback=500):
+    """`ReturnModel` dari DataFrame return log (kolom = ticker) memakai `lookback` hari bersama terakhir."""
+    if model not in MODELS:
+        raise ValueError(f"Model tidak dikenal: {model!r} (pilih dari {', '.join(MODELS)})")
+    joint = joint_returns(returns).tail(lookback)
+    if len(joint) < 30:
+        raise ValueError(f"Return bersama terlalu sedikit untuk kalibrasi ({len(joint)} bar)")
+    r = joint.to_numpy(dtype=np.float64)
+    tickers = tuple(joint.columns)
+    mu = r.mean(axis=0)
+
+    if model == 'bootstrap':
+        return ReturnModel(model, tickers, r, mu)
+    if model == 'gbm':
+        covariance = np.atleast_2d(np.cov(r, rowvar=False))
+        # Jitter kecil di diagonal agar Cholesky tetap jalan untuk aset yang hampir kolinear
+        chol = np.linalg.cholesky(covariance + np.eye(len(tickers)) * 1e-12)
+        return ReturnModel(model, tickers, r, mu, chol=chol)
+
+    centered = r - mu
+    omega, alpha, beta = _fit_garch(centered)
+    sigma2, sigma2_next = _garch_filter(centered, omega, alpha, beta, centered.var(axis=0))
+    residuals = centered / np.sqrt(sigma2)
+    return ReturnModel(model, tickers, residuals, mu, omega=omega, alpha=alpha, beta=beta, sigma2=sigma2_next)
+
+
+def _draw(model, rng, paths, steps, state):
+    """Return log (paths x steps x K) berikutnya; `state` varians GARCH diperbarui di tempat."""
+    n_sample, k = model.sample.shape
+    if model.kind == 'bootstrap':
+        return model.sample[rng.integers(0, n_sample, (paths, steps))]
+    if model.kind == 'gbm':
+        return model.mu + rng.standard_normal((paths, steps, k)) @ model.chol.T
+    out = np.empty((paths, steps, k))
+    for j in range(steps):
+        shock = np.sqrt(state) * model.sample[rng.integers(0, n_sample, paths)]
+        out[:, j] = model.mu + shock
+        state[:] = model.omega + model.alpha * shock * shock + model.beta * state
+    return out
+
+
+def simulate_terminal(model, paths, horizon, stop_levels=None, seed=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Return log kumulatif di akhir `horizon` (paths x K) dan jumlah jalur yang menyentuh `stop_levels`.
+
+    `stop_levels` adalah ambang return log kumulatif per aset (-inf = tanpa
+    stop); sebuah jalur dihitung kena stop jika titik terendahnya <= ambang.
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    k = len(model.tickers)
+    stop_levels = np.full(k, -np.inf) if stop_levels is None else np.asarray(stop_levels, dtype=np.float64)
+    block = 1 if model.kind == 'garch' else min(horizon, _STEP_BLOCK)
+    starts = range(0, paths, _PATH_GROUP)
+    # Benih anak ditentukan oleh urutan grup (tanpa `spawn`, yang mengubah `root`)
+    rngs = [np.random.default_rng(np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (i,)))
+            for i in range(len(starts))]
+    # Blok draw + cumsum + indeks bootstrap hidup bersamaan: ~3 array paths x block x K
+    chunk = max(1, int(chunk_bytes // (block * k * 8 * 3 * _PATH_GROUP))) * _PATH_GROUP
+
+    terminal = np.empty((paths, k))
+    hits = np.zeros(k, dtype=np.int64)
+    for start in range(0, paths, chunk):
+        size = min(chunk, paths - start)
+        groups = [(g, lo - start, min(lo + _PATH_GROUP, paths) - start)
+                  for g, lo in enumerate(starts) if start <= lo < start + size]
+        cumulative = np.zeros((size, k))
+        lowest = np.zeros((size, k))
+        state = np.tile(model.sigma2, (size, 1)) if model.kind == 'garch' else None
+        for step in range(0, horizon, block):
+            steps = min(block, horizon - step)
+            draws = np.empty((size, steps, k))
+            for g, lo, hi in groups:
+                draws[lo:hi] = _draw(model, rngs[g], hi - lo, steps, None if state is None else state[lo:hi])
+            path = cumulative[:, None, :] + np.cumsum(draws, axis=1)
+            np.minimum(lowest, path.min(axis=1), out=lowest)
+            cumulative = path[:, -1, :]
+        terminal[start:start + size] = cumulative
+        hits += (lowest <= stop_levels).sum(axis=0)
+    return terminal, hits
+
+
+def simulate(model, paths, horizon, stop_levels=None, seed=None, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """`simulate_terminal` yang dibagi ke `workers` proses (bawaan: jumlah CPU, 1 untuk simulasi kecil)."""
+    if workers is None:
+        workers = 1 if paths * horizon < 2_000_000 else (os.cpu_count() or 1)
+    workers = max(1, min(workers, paths))
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    sizes = [len(part) for part in np.array_split(np.arange(paths), workers)]
+    if workers == 1:
+        return simulate_terminal(model, paths, horizon, stop_levels, seeds[0], chunk_bytes)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(simulate_terminal, repeat(model), sizes, repeat(horizon), repeat(stop_levels),
+                                seeds, repeat(chunk_bytes)))
+    return np.concatenate([r[0] for r in results]), sum(r[1] for r in results)
+
+
+def _tail_risk(losses, confidence):
+    rows = []
+    for level in confidence:
+        var = float(np.quantile(losses, level))
+        rows.append({'confidence': level, 'var': var, 'es': float(losses[losses >= var].mean())})
+    return rows
+
+
+def portfolio_risk(returns, positions_usd, usd_idr_rate, prices_usd=None, atr_usd=None, gold_tickers=frozenset(),
+                   model='bootstrap', horizon=20, paths=100_000, confidence=DEFAULT_CONFIDENCE, atr_multiple=2.0,
+                   lookback=500, seed=None, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Simulasikan portofolio dan kembalikan ringkasan risiko sebagai dict (siap JSON).
+
+    `returns`: DataFrame return log harian per ticker (lihat
+    `gss_quant.correlation.aligned_returns`), boleh memuat kolom `FX_TICKER`.
+    `positions_usd`: dict ticker -> nilai posisi dalam USD (satu ticker = aset tunggal).
+    `prices_usd` / `atr_usd`: dict harga terakhir dan ATR per ticker untuk
+    stop-loss di `atr_multiple` x ATR di bawah harga.
+    """
+    tickers = [t for t in positions_usd if positions_usd[t]]
+    columns = tickers + ([FX_TICKER] if FX_TICKER in returns.columns and FX_TICKER not in tickers else [])
+    fitted = calibrate(returns[columns], model, lookback)
+
+    prices_usd, atr_usd = prices_usd or {}, atr_usd or {}
+    stop_prices = {
+        t: prices_usd[t] - atr_multiple * atr_usd[t]
+        for t in tickers if prices_usd.get(t) and atr_usd.get(t) and prices_usd[t] - atr_multiple * atr_usd[t] > 0
+    }
+    stop_levels = np.array([np.log(stop_prices[t] / prices_usd[t]) if t in stop_prices else -np.inf for t in columns])
+    terminal, hits = simulate(fitted, paths, horizon, stop_levels, seed, workers, chunk_bytes)
+
+    weights = np.array([positions_usd[t] for t in tickers], dtype=np.float64)
+    value_usd = float(weights.sum())
+    final_usd = np.exp(terminal[:, :len(tickers)]) @ weights
+    rate_now = float(usd_idr_rate)
+    fx_path = np.exp(terminal[:, len(tickers)]) if len(columns) > len(tickers) else 1.0
+    final_idr = final_usd * rate_now * fx_path
+
+    usd_risk = _tail_risk(value_usd - final_usd, confidence)
+    idr_risk = _tail_risk(value_usd * rate_now - final_idr, confidence)
+    tail = [
+        {'confidence': u['confidence'], 'var_usd': u['var'], 'es_usd': u['es'], 'var_idr': i['var'], 'es_idr': i['es'],
+         'var_pct': u['var'] / value_usd * 100, 'es_pct': u['es'] / value_usd * 100}
+        for u, i in zip(usd_risk, idr_risk)
+    ]
+    stops = [
+        {'ticker': t, 'price_usd': prices_usd[t], 'stop_usd': stop_prices[t],
+         'stop_idr': float(convert_price_to_idr(stop_prices[t], t in gold_tickers, rate_now)),
+         'hit_probability': float(hits[columns.index(t)] / paths)}
+        for t in tickers if t in stop_prices
+    ]
+    return {
+        'model': model,
+        'horizon': horizon,
+        'paths': paths,
+        'tickers': tickers,
+        'fx_simulated': len(columns) > len(tickers),
+        'value_usd': value_usd,
+        'value_idr': value_usd * rate_now,
+        'expected_return_pct': float(final_usd.mean() / value_usd * 100 - 100),
+        'risk': tail,
+        'stops': stops,
+        'terminal_idr': pd.Series(final_idr).quantile([0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]).to_dict(),
+    }
@@ -0,0 +1,478 @@
+"""Aturan skor deklaratif yang dikompilasi menjadi ekspresi kolom tervektorisasi.
+
+Satu `RuleSet` berisi aturan berurutan. Setiap aturan (`Rule`) adalah daftar
+kasus (`Case`) dengan semantik "kasus pertama yang cocok": kasus yang cocok
+menambah `points` ke skor mentah, dan menambah satu poin kepercayaan jika
+kondisi `confidence`-nya juga benar. Aturan `Boost` dijalankan setelahnya
+dan mengganti skor mentah dengan `trunc(clip((base + skor) * factor))`.
+Skor akhir = clip(base + skor mentah); tingkat kepercayaan diambil dari
+ambang `confidence_levels`.
+
+Kondisi ditulis sebagai teks ekspresi (`"Close > EMA_200 and notna(RSI)"`) atau
+dengan DSL Python (`col('Close') > col('EMA_200')`). Nama kolom indikator
+dibaca dari DataFrame, nama field `StrategyParams` menjadi parameter, dan
+`score` merujuk ke skor mentah (hanya untuk `Boost`). Teks diurai dengan
+`ast` dan hanya operator / fungsi yang terdaftar yang diizinkan.
+
+Rule set juga bisa ditulis sebagai dict (JSON / YAML, lihat `RuleSet.from_dict`).
+`DEFAULT_RULES` adalah definisi Quantum Score: `scoring.quantum_score` (dan
+semua pemakainya) mengevaluasinya, dan hasilnya sama persis dengan
+`analyze_signal` per bar.
+
+`score_profiles` mengevaluasi beberapa profil (rule set + parameter) dalam
+satu lintasan: kolom dibaca sekali dan sub-ekspresi yang sama (setelah
+parameter diisi) hanya dihitung sekali untuk semua profil.
+"""
+import ast
+import json
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gss_quant.params import DEFAULT_PARAMS, StrategyParams
+
+_PARAM_NAMES = frozenset(StrategyParams.__dataclass_fields__)
+
+_OPS = {
+    'and': np.logical_and,
+    'or': np.logical_or,
+    'not': np.logical_not,
+    'neg': np.negative,
+    'add': np.add,
+    'sub': np.subtract,
+    'mul': np.multiply,
+    'div': np.divide,
+    'lt': np.less,
+    'le': np.less_equal,
+    'gt': np.greater,
+    'ge': np.greater_equal,
+    'eq': np.equal,
+    'ne': np.not_equal,
+    'isna': np.isnan,
+    'notna': lambda x: ~np.isnan(x),
+    'abs': np.abs,
+    'fillna': lambda x, value: np.where(np.isnan(x), value, x),
+}
+_SYMBOLS = {
+    'and': ' and ', 'or': ' or ', 'add': ' + ', 'sub': ' - ', 'mul': ' * ', 'div': ' / ',
+    'lt': ' < ', 'le': ' <= ', 'gt': ' > ', 'ge': ' >= ', 'eq': ' == ', 'ne': ' != ',
+}
+_FUNCTIONS = {'isna': 1, 'notna': 1, 'abs': 1, 'fillna': 2}
+_AST_OPS = {
+    ast.And: 'and', ast.Or: 'or', ast.Not: 'not', ast.USub: 'neg',
+    ast.Add: 'add', ast.Sub: 'sub', ast.Mult: 'mul', ast.Div: 'div',
+    ast.Lt: 'lt', ast.LtE: 'le', ast.Gt: 'gt', ast.GtE: 'ge', ast.Eq: 'eq', ast.NotEq: 'ne',
+}
+
+
+# --- EKSPRESI ---
+# Node berupa tuple (hashable) agar sub-ekspresi yang sama bisa di-memo:
+# ('col', nama) | ('param', nama) | ('const', nilai) | ('score',) | ('op', nama, *argumen)
+
+class Expr:
+    """Pembungkus node ekspresi untuk DSL Python (`col('RSI') < param('rsi_oversold')`)."""
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    def _op(self, name, *others):
+        return Expr(('op', name, self.node, *(_node(o) for o in others)))
+
+    def _rop(self, name, other):
+        # Operand kiri bukan Expr (mis. `1 + col('x')`): urutan argumen dibalik
+        return Expr(('op', name, _node(other), self.node))
+
+    def __and__(self, other): return self._op('and', other)
+    def __or__(self, other): return self._op('or', other)
+    def __invert__(self): return self._op('not')
+    def __neg__(self): return self._op('neg')
+    def __add__(self, other): return self._op('add', other)
+    def __sub__(self, other): return self._op('sub', other)
+    def __mul__(self, other): return self._op('mul', other)
+    def __truediv__(self, other): return self._op('div', other)
+    def __rand__(self, other): return self._rop('and', other)
+    def __ror__(self, other): return self._rop('or', other)
+    def __radd__(self, other): return self._rop('add', other)
+    def __rsub__(self, other): return self._rop('sub', other)
+    def __rmul__(self, other): return self._rop('mul', other)
+    def __rtruediv__(self, other): return self._rop('div', other)
+    def __lt__(self, other): return self._op('lt', other)
+    def __le__(self, other): return self._op('le', other)
+    def __gt__(self, other): return self._op('gt', other)
+    def __ge__(self, other): return self._op('ge', other)
+
+    def __repr__(self):
+        return f"Expr({self.node!r})"
+
+
+def col(name):
+    return Expr(('col', name))
+
+
+def param(name):
+    if name not in _PARAM_NAMES:
+        raise ValueError(f"Parameter tidak dikenal: {name!r}")
+    return Expr(('param', name))
+
+
+def isna(x):
+    return Expr(('op', 'isna', _node(x)))
+
+
+def notna(x):
+    return Expr(('op', 'notna', _node(x)))
+
+
+SCORE = Expr(('score',))
+
+
+def _node(value):
+    if isinstance(value, Expr):
+        return value.node
+    if isinstance(value, str):
+        return parse_expr(value)
+    if isinstance(value, (bool, int, float)):
+        return ('const', value)
+    raise TypeError(f"Bukan ekspresi: {value!r}")
+
+
+def parse_expr(text):
+    """Urai teks ekspresi menjadi node; hanya operator dan fungsi yang terdaftar yang diizinkan."""
+
+    def convert(node):
+        if isinstance(node, ast.Expression):
+            return convert(node.body)
+        if isinstance(node, ast.BoolOp):
+            result = convert(node.values[0])
+            for value in node.values[1:]:
+                result = ('op', _AST_OPS[type(node.op)], result, convert(value))
+            return result
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _AST_OPS:
+            return ('op', _AST_OPS[type(node.op)], convert(node.operand))
+        if isinstance(node, ast.BinOp) and type(node.op) in _AST_OPS:
+            return ('op', _AST_OPS[type(node.op)], convert(node.left), convert(node.right))
+        if isinstance(node, ast.Compare):
+            # a < b < c menjadi (a < b) and (b < c)
+            result, left = None, convert(node.left)
+            for op, comparator in zip(node.ops, node.comparators):
+                if type(op) not in _AST_OPS:
+                    break
+                right = convert(comparator)
+                term = ('op', _AST_OPS[type(op)], left, right)
+                result = term if result is None else ('op', 'and', result, term)
+                left = right
+            else:
+                return result
+        if isinstance(node, ast.Name):
+            if node.id == 'score':
+                return ('score',)
+            return ('param', node.id) if node.id in _PARAM_NAMES else ('col', node.id)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (bool, int, float)):
+            return ('const', node.value)
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _FUNCTIONS
+                and len(node.args) == _FUNCTIONS[node.func.id] and not node.keywords):
+            return ('op', node.func.id, *(convert(a) for a in node.args))
+        raise ValueError(f"Ekspresi tidak didukung di {text!r}: {ast.dump(node)}")
+
+    try:
+        tree = ast.parse(text.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Ekspresi tidak valid: {text!r}") from e
+    return convert(tree)
+
+
+def _bind(node, params):
+    """Ganti node parameter dengan konstanta dari `params`."""
+    if node[0] == 'param':
+        return ('const', getattr(params, node[1]))
+    if node[0] == 'op':
+        return ('op', node[1], *(_bind(arg, params) for arg in node[2:]))
+    return node
+
+
+def _columns(node):
+    if node[0] == 'col':
+        return {node[1]}
+    if node[0] == 'op':
+        return set().union(*(_columns(arg) for arg in node[2:]))
+    return set()
+
+
+@lru_cache(maxsize=None)
+def _uses_score(node):
+    return node[0] == 'score' or (node[0] == 'op' and any(_uses_score(arg) for arg in node[2:]))
+
+
+def _evaluate(node, columns, score, memo):
+    if node[0] == 'score':
+        return score
+    cacheable = not _uses_score(node)
+    if cacheable and node in memo:
+        return memo[node]
+    if node[0] == 'col':
+        value = columns[node[1]]
+    elif node[0] == 'const':
+        value = node[1]
+    else:
+        value = _OPS[node[1]](*(_evaluate(arg, columns, score, memo) for arg in node[2:]))
+    if cacheable:
+        memo[node] = value
+    return value
+
+
+def _text(node):
+    """Node -> teks ekspresi (kebalikan `parse_expr`), untuk `to_dict`."""
+    kind = node[0]
+    if kind in ('col', 'param'):
+        return node[1]
+    if kind == 'const':
+        return repr(node[1])
+    if kind == 'score':
+        return 'score'
+    name, args = node[1], node[2:]
+    if name in _SYMBOLS:
+        return f"({_SYMBOLS[name].join(_text(a) for a in args)})"
+    if name == 'not':
+        return f"not {_text(args[0])}"
+    if name == 'neg':
+        return f"-{_text(args[0])}"
+    return f"{name}({', '.join(_text(a) for a in args)})"
+
+
+# --- ATURAN ---
+
+@dataclass(frozen=True)
+class Case:
+    """Satu cabang aturan: jika `when` benar, tambah `points`; +1 kepercayaan jika `confidence` juga benar."""
+    name: str
+    when: tuple
+    points: int
+    confidence: tuple = ('const', False)
+
+    @classmethod
+    def of(cls, name, when, points, confidence=False):
+        return cls(name, _node(when), int(points), _node(confidence))
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Kasus berurutan; hanya kasus pertama yang cocok yang dihitung (seperti if / elif)."""
+    name: str
+    cases: tuple
+
+
+@dataclass(frozen=True)
+class Boost:
+    """Setelah semua `Rule`: jika `when` benar, skor mentah = trunc(clip((base + skor) * factor)), +1 kepercayaan."""
+    name: str
+    when: tuple
+    factor: float
+
+    @classmethod
+    def of(cls, name, when, factor):
+        return cls(name, _node(when), float(factor))
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    name: str
+    rules: tuple
+    boosts: tuple = ()
+    base: int = 50
+    score_range: tuple = (0, 100)
+    # (poin minimum, tingkat) dari yang tertinggi; di bawah semuanya = default_confidence
+    confidence_levels: tuple = ((5, 3), (3, 2))
+    default_confidence: int = 1
+
+    @classmethod
+    def from_dict(cls, spec):
+        """Rule set dari dict (hasil JSON / YAML):
+
+            {"name": ..., "base": 50,
+             "rules": [{"name": "rsi", "cases": [{"name": "oversold", "when": "RSI < rsi_oversold",
+                                                   "points": 35, "confidence": true}, ...]}],
+             "boosts": [{"name": "adx", "when": "ADX > adx_trend and abs(score) > 20", "factor": 1.1}],
+             "confidence_levels": [[5, 3], [3, 2]]}
+        """
+        rules = tuple(
+            Rule(rule['name'], tuple(
+                Case.of(case.get('name', str(i)), case['when'], case['points'], case.get('confidence', False))
+                for i, case in enumerate(rule['cases'])
+            ))
+            for rule in spec['rules']
+        )
+        boosts = tuple(Boost.of(b['name'], b['when'], b['factor']) for b in spec.get('boosts', []))
+        return cls(
+            spec['name'], rules, boosts,
+            base=spec.get('base', 50),
+            score_range=tuple(spec.get('score_range', (0, 100))),
+            confidence_levels=tuple(tuple(level) for level in spec.get('confidence_levels', ((5, 3), (3, 2)))),
+            default_confidence=spec.get('default_confidence', 1),
+        )
+
+    def to_dict(self):
+        def confidence(node):
+            return node[1] if node[0] == 'const' else _text(node)
+
+        return {
+            'name': self.name,
+            'base': self.base,
+            'score_range': list(self.score_range),
+            'confidence_levels': [list(level) for level in self.confidence_levels],
+            'default_confidence': self.default_confidence,
+            'rules': [
+                {'name': rule.name, 'cases': [
+                    {'name': c.name, 'when': _text(c.when), 'points': c.points, 'confidence': confidence(c.confidence)}
+                    for c in rule.cases
+                ]}
+                for rule in self.rules
+            ],
+            'boosts': [{'name': b.name, 'when': _text(b.when), 'factor': b.factor} for b in self.boosts],
+        }
+
+    def with_points(self, name=None, **points):
+        """Salinan dengan bobot kasus diganti, kunci `<aturan>__<kasus>` (mis. `rsi__oversold=40`)."""
+        rules = []
+        for rule in self.rules:
+            cases = tuple(
+                replace(c, points=int(points.pop(f"{rule.name}__{c.name}"))) if f"{rule.name}__{c.name}" in points else c
+                for c in rule.cases
+            )
+            rules.append(replace(rule, cases=cases))
+        if points:
+            raise ValueError(f"Kasus tidak dikenal: {', '.join(points)}")
+        return replace(self, name=name or self.name, rules=tuple(rules))
+
+    @property
+    def columns(self):
+        nodes = [n for rule in self.rules for c in rule.cases for n in (c.when, c.confidence)]
+        nodes += [b.when for b in self.boosts]
+        return set().union(*(_columns(n) for n in nodes))
+
+
+def load_ruleset(path):
+    """Baca rule set dari file .json atau .yaml / .yml (YAML memerlukan PyYAML)."""
+    path = Path(path)
+    text = path.read_text(encoding='utf-8')
+    if path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError("Membaca rule set YAML memerlukan PyYAML (pip install pyyaml)") from e
+        return RuleSet.from_dict(yaml.safe_load(text))
+    return RuleSet.from_dict(json.loads(text))
+
+
+DEFAULT_RULES = RuleSet.from_dict({
+    'name': 'default',
+    'rules': [
+        # 1. Tren EMA 200 (harga sama dengan EMA 200 dihitung bearish) + konfirmasi EMA 50
+        {'name': 'trend', 'cases': [
+            {'name': 'above', 'when': "notna(EMA_200) and Close > EMA_200", 'points': 25, 'confidence': "EMA_50 > EMA_200"},
+            {'name': 'below', 'when': "notna(EMA_200)", 'points': -25, 'confidence': "EMA_50 < EMA_200"},
+        ]},
+        # Golden Cross / Death Cross
+        {'name': 'cross', 'cases': [
+            {'name': 'golden', 'when': "EMA_50 > EMA_200", 'points': 15},
+            {'name': 'death', 'when': "EMA_50 < EMA_200", 'points': -10},
+        ]},
+        # 2. Momentum RSI
+        {'name': 'rsi', 'cases': [
+            {'name': 'oversold', 'when': "RSI < rsi_oversold", 'points': 35, 'confidence': True},
+            {'name': 'overbought', 'when': "RSI > rsi_overbought", 'points': -25, 'confidence': True},
+            {'name': 'accumulation', 'when': "RSI <= 50", 'points': 10},
+            {'name': 'growth', 'when': "notna(RSI)", 'points': 5},
+        ]},
+        # 3. MACD
+        {'name': 'macd', 'cases': [
+            {'name': 'bullish', 'when': "MACD > MACD_SIGNAL", 'points': 20, 'confidence': True},
+            {'name': 'bearish', 'when': "notna(MACD) and notna(MACD_SIGNAL)", 'points': -20, 'confidence': True},
+        ]},
+        # 4. Bollinger Bands
+        {'name': 'bollinger', 'cases': [
+            {'name': 'upper_break', 'when': "notna(BB_LOWER) and Close > BB_UPPER", 'points': -30, 'confidence': True},
+            {'name': 'lower_break', 'when': "notna(BB_UPPER) and Close < BB_LOWER", 'points': 30, 'confidence': True},
+        ]},
+    ],
+    # 5. ADX: tren kuat mempertegas sinyal yang sudah jelas arahnya
+    'boosts': [{'name': 'adx', 'when': "ADX > adx_trend and abs(score) > 20", 'factor': 1.1}],
+})
+
+
+# --- EVALUASI ---
+
+@dataclass(frozen=True)
+class Profile:
+    """Profil strategi: rule set + parameter ambang."""
+    name: str
+    rules: RuleSet = DEFAULT_RULES
+    params: StrategyParams = field(default=DEFAULT_PARAMS)
+
+
+def _run(ruleset, params, columns, n, memo):
+    score = np.zeros(n, dtype=np.int64)
+    points = np.zeros(n, dtype=np.int64)
+    for rule in ruleset.rules:
+        conditions = [np.broadcast_to(_evaluate(_bind(c.when, params), columns, score, memo), (n,)) for c in rule.cases]
+        score = score + np.select(conditions, [c.points for c in rule.cases], default=0)
+        confidence = [_evaluate(_bind(c.confidence, params), columns, score, memo) for c in rule.cases]
+        points = points + np.select(conditions, confidence, default=False)
+    low, high = ruleset.score_range
+    for boost in ruleset.boosts:
+        active = np.broadcast_to(_evaluate(_bind(boost.when, params), columns, score, memo), (n,))
+        boosted = np.trunc(np.clip((ruleset.base + score) * boost.factor, low, high)).astype(np.int64)
+        score = np.where(active, boosted, score)
+        points = points + active
+    final = np.clip(ruleset.base + score, low, high)
+    levels = ruleset.confidence_levels
+    confidence = np.select([points >= minimum for minimum, _ in levels], [level for _, level in levels],
+                           default=ruleset.default_confidence)
+    return final, confidence
+
+
+def evaluate_arrays(columns, profiles):
+    """Dict profil -> (skor, kepercayaan) dari dict kolom -> array 1-D; sub-ekspresi dibagi antar profil."""
+    n = len(next(iter(columns.values())))
+    memo = {}
+    return {p.name: _run(p.rules, p.params, columns, n, memo) for p in profiles}
+
+
+def _needed_columns(profiles):
+    return sorted(set().union(*(p.rules.columns for p in profiles)))
+
+
+def score_profiles(df, profiles=(Profile('default'),)):
+    """DataFrame (index sama dengan `df`) berkolom MultiIndex (profil, SCORE / CONFIDENCE)."""
+    columns = {name: df[name].to_numpy(dtype=np.float64) for name in _needed_columns(profiles)}
+    results = evaluate_arrays(columns, profiles)
+    return pd.concat({
+        name: pd.DataFrame({'SCORE': score, 'CONFIDENCE': confidence}, index=df.index)
+        for name, (score, confidence) in results.items()
+    }, axis=1)
+
+
+def score_universe(frames, profiles=(Profile('default'),)):
+    """Skor semua bar semua ticker untuk semua profil dalam satu lintasan.
+
+    Aturan hanya membaca baris yang sama, sehingga baris semua ticker cukup
+    digabung menjadi satu kolom panjang. Hasil: DataFrame ber-index
+    (ticker, waktu) dengan kolom seperti `score_profiles`.
+    """
+    frames = {t: df for t, df in frames.items() if len(df)}
+    if not frames:
+        return pd.DataFrame()
+    needed = _needed_columns(profiles)
+    columns = {name: np.concatenate([df[name].to_numpy(dtype=np.float64) for df in frames.values()]) for name in needed}
+    index = pd.MultiIndex.from_arrays([
+        np.repeat(list(frames), [len(df) for df in frames.values()]),
+        np.concatenate([df.index.to_numpy() for df in frames.values()]),
+    ], names=['ticker', 'Date'])
+    results = evaluate_arrays(columns, profiles)
+    return pd.concat({
+        name: pd.DataFrame({'SCORE': score, 'CONFIDENCE': confidence}, index=index)
+        for name, (score, confidence) in results.items()
+    }, axis=1)
@@ -0,0 +1,63 @@
+"""Engine Quantum Score tervektorisasi untuk seluruh riwayat bar.
+
+Aturan skor (`gss_quant.rules.DEFAULT_RULES`) mengikuti `analyze_signal`
+baris per baris, tetapi dievaluasi sekaligus untuk semua bar memakai
+operasi kolom NumPy.
+"""
+import numpy as np
+import pandas as pd
+
+from gss_quant.fx import convert_price_to_idr, usd_idr_at
+from gss_quant.params import DEFAULT_PARAMS
+from gss_quant.rules import DEFAULT_RULES, Profile, evaluate_arrays
+
+
+def quantum_score(df, params=DEFAULT_PARAMS):
+    """Quantum Score (0-100) dan tingkat kepercayaan (1-3) untuk setiap bar.
+
+    Aturan dan bobotnya didefinisikan di `gss_quant.rules.DEFAULT_RULES`.
+    Mengembalikan tuple dua array int64 sepanjang `df`.
+    """
+    columns = {name: df[name].to_numpy(dtype=float) for name in DEFAULT_RULES.columns}
+    return evaluate_arrays(columns, (Profile('default', params=params),))['default']
+
+
+def signal_labels(score, params=DEFAULT_PARAMS):
+    """Petakan skor ke label sinyal dashboard (STRONG BUY, BUY, STRONG SELL, NEUTRAL)."""
+    score = np.asarray(score)
+    return np.select(
+        [score >= params.strong_buy, score >= params.buy, score <= params.strong_sell],
+        ["STRONG BUY", "BUY", "STRONG SELL"],
+        default="NEUTRAL",
+    )
+
+
+def score_history(df, asset_is_gold, usd_idr_rate, params=DEFAULT_PARAMS):
+    """Hitung Quantum Score, tingkat kepercayaan dan pita risiko untuk setiap bar.
+
+    Hasil baris terakhir identik dengan nilai yang dikembalikan `analyze_signal`.
+    Mengembalikan DataFrame dengan index yang sama seperti `df` dan kolom
+    SCORE, CONFIDENCE, RISK, VOLATILITY_IDR, ATR_IDR. `usd_idr_rate` boleh
+    skalar atau seri kurs historis (dikonversi dengan kurs tiap bar).
+    """
+    close = df['Close'].to_numpy(dtype=float)
+    atr = np.nan_to_num(df['ATR'].to_numpy(dtype=float), nan=0.0)
+    volatility = np.nan_to_num(df['VOLATILITY_30D'].to_numpy(dtype=float), nan=0.0)
+
+    rate = usd_idr_at(df.index, usd_idr_rate)
+    final_score, confidence_level = quantum_score(df, params)
+
+    # Pita risiko seperti kartu "Risiko (Volatilitas 30D)" di dashboard
+    risk = np.select(
+        [volatility == 0, volatility < close * 0.02, volatility < close * 0.05],
+        ["N/A", "Rendah", "Sedang"],
+        default="Tinggi",
+    )
+
+    return pd.DataFrame({
+        'SCORE': final_score,
+        'CONFIDENCE': confidence_level,
+        'RISK': risk,
+        'VOLATILITY_IDR': convert_price_to_idr(volatility, asset_is_gold, rate),
+        'ATR_IDR': convert_price_to_idr(atr, asset_is_gold, rate),
+    }, index=df.index)
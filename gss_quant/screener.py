@@ -0,0 +1,99 @@
+"""Screener multi-aset: fetch batch paralel, skor di banyak proses, hasil bertahap.
+
+Alur: watchlist dipecah menjadi batch multi-ticker yang diunduh oleh thread
+pool terbatas (dengan retry + backoff). Begitu satu batch tiba, setiap
+ticker dikirim ke process pool untuk perhitungan indikator dan skor, dan
+hasilnya langsung di-yield sehingga UI bisa menampilkan tabel parsial.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from gss_quant.fx import convert_price_to_idr
+from gss_quant.kernels import indicator_frame
+from gss_quant.params import DEFAULT_PARAMS
+from gss_quant.retry import call_with_retry
+from gss_quant.scoring import score_history, signal_labels
+
+
+def parse_watchlist(text):
+    """Ubah teks (dipisah koma, spasi atau baris baru) menjadi daftar ticker unik berurutan."""
+    tickers = (t.strip().upper() for t in text.replace(',', ' ').split())
+    return list(dict.fromkeys(t for t in tickers if t))
+
+
+def _fetch_batch(provider, tickers, interval, period):
+    frames = provider.fetch_many(tickers, interval=interval, period=period)
+    if all(df.empty for df in frames.values()):
+        # Biasanya tanda rate limit / gangguan jaringan: biarkan retry bekerja
+        raise RuntimeError(f"Tidak ada data untuk batch {tickers[0]}..{tickers[-1]}")
+    return frames
+
+
+def score_ticker(ticker, df, is_gold, usd_idr_rate, params=DEFAULT_PARAMS):
+    """Hitung indikator dan Quantum Score bar terakhir untuk satu ticker (dijalankan di worker)."""
+    enriched = df.join(indicator_frame(df, params))
+    last = score_history(enriched.tail(1), is_gold, usd_idr_rate, params).iloc[-1]
+    close = enriched['Close'].to_numpy()
+    return {
+        'ticker': ticker,
+        'score': int(last['SCORE']),
+        'confidence': int(last['CONFIDENCE']),
+        'signal': str(signal_labels([last['SCORE']], params)[0]),
+        'risk': last['RISK'],
+        'adx': float(enriched['ADX'].iloc[-1]),
+        'atr': float(enriched['ATR'].iloc[-1]),
+        'close_usd': float(close[-1]),
+        'close_idr': float(convert_price_to_idr(close[-1], is_gold, usd_idr_rate)),
+        'change_pct': float((close[-1] - close[-2]) / close[-2] * 100),
+        'last_bar': enriched.index[-1],
+        'error': None,
+    }
+
+
+def _error_row(ticker, message):
+    return {'ticker': ticker, 'error': message}
+
+
+def screen_universe(tickers, provider, usd_idr_rate, gold_tickers=frozenset(), period="1y", interval="1d",
+                    batch_size=50, fetch_workers=4, compute_workers=None, params=DEFAULT_PARAMS):
+    """Generator: yield satu dict hasil per ticker segera setelah selesai dihitung.
+
+    Ticker yang gagal di-yield sebagai dict dengan kunci `error` terisi.
+    """
+    tickers = list(tickers)
+    batches = [tickers[i:i + batch_size] for i in range(0, len(tickers), batch_size)]
+    fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers)
+    compute_pool = ProcessPoolExecutor(max_workers=compute_workers or os.cpu_count())
+    try:
+        pending = {
+            fetch_pool.submit(call_with_retry, _fetch_batch, provider, batch, interval, period): ('fetch', batch)
+            for batch in batches
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, payload = pending.pop(future)
+                if kind == 'score':
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        yield _error_row(payload, f"Gagal menghitung: {e}")
+                    continue
+
+                try:
+                    frames = future.result()
+                except Exception as e:
+                    for ticker in payload:
+                        yield _error_row(ticker, f"Gagal mengambil data: {e}")
+                    continue
+                for ticker in payload:
+                    df = frames.get(ticker)
+                    if df is None or len(df) < 2:
+                        yield _error_row(ticker, "Data kosong")
+                        continue
+                    job = compute_pool.submit(score_ticker, ticker, df, ticker in gold_tickers, usd_idr_rate, params)
+                    pending[job] = ('score', ticker)
+    finally:
+        # Dipanggil juga saat generator ditutup lebih awal (mis. rerun Streamlit)
+        fetch_pool.shutdown(wait=False, cancel_futures=True)
+        compute_pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,137 @@
+"""Riwayat sinyal dan alert di SQLite lokal (mode WAL, insert per batch).
+
+Satu baris sinyal per (ticker, bar): scan ulang untuk bar yang sama menimpa
+barisnya, sehingga setiap siklus idempoten. Alert unik per (ticker, bar,
+jenis, `previous_scan`), yaitu waktu scan baris sinyal yang menjadi
+pembandingnya: bar yang masih berjalan bisa berpindah ambang berkali-kali
+(mis. BUY -> NEUTRAL -> BUY) dan setiap transisi tercatat, sedangkan dua scan
+yang membandingkan keadaan tercatat yang sama hanya menghasilkan satu alert.
+Alert baru dianggap terkirim setelah `mark_delivered`, sehingga alert yang
+gagal dikirim dicoba lagi di siklus berikutnya.
+"""
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS signals (
+    ticker TEXT NOT NULL,
+    bar_time TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    signal TEXT NOT NULL,
+    confidence INTEGER NOT NULL,
+    risk TEXT,
+    close_usd REAL,
+    close_idr REAL,
+    usd_idr REAL,
+    reasons TEXT,
+    scanned_at TEXT NOT NULL,
+    PRIMARY KEY (ticker, bar_time)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS alerts (
+    ticker TEXT NOT NULL,
+    bar_time TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    previous TEXT,
+    current TEXT,
+    previous_scan TEXT NOT NULL,
+    message TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    delivered_at TEXT,
+    PRIMARY KEY (ticker, bar_time, kind, previous_scan)
+);
+
+CREATE INDEX IF NOT EXISTS alerts_undelivered ON alerts (delivered_at) WHERE delivered_at IS NULL;
+"""
+
+SIGNAL_FIELDS = ['ticker', 'bar_time', 'score', 'signal', 'confidence', 'risk', 'close_usd', 'close_idr', 'usd_idr', 'reasons', 'scanned_at']
+ALERT_FIELDS = ['ticker', 'bar_time', 'kind', 'previous', 'current', 'previous_scan', 'message', 'created_at']
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+class SignalDatabase:
+    """Akses SQLite yang aman dipakai dari banyak thread (satu koneksi, dijaga lock)."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            # WAL: pembaca (mis. dashboard) tidak terblokir oleh penulisan daemon
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def latest_signals(self):
+        """Dict ticker -> baris sinyal terakhir yang tercatat (bar terbaru, scan terakhir)."""
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT * FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY bar_time DESC) AS rn FROM signals
+                ) WHERE rn = 1
+            """).fetchall()
+        return {row['ticker']: dict(row) for row in rows}
+
+    def record_cycle(self, signals, alerts):
+        """Tulis baris sinyal (timpa per ticker+bar) dan alert baru dalam satu transaksi.
+
+        Mengembalikan jumlah alert yang benar-benar baru.
+        """
+        scanned_at = _now()
+        signal_rows = [
+            tuple(json.dumps(s.get('reasons', []), ensure_ascii=False) if f == 'reasons' else
+                  scanned_at if f == 'scanned_at' else s.get(f) for f in SIGNAL_FIELDS)
+            for s in signals
+        ]
+        alert_rows = [tuple(a.get(f, scanned_at) if f == 'created_at' else a.get(f) for f in ALERT_FIELDS) for a in alerts]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO signals ({', '.join(SIGNAL_FIELDS)}) VALUES ({', '.join('?' * len(SIGNAL_FIELDS))})",
+                    signal_rows,
+                )
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    f"INSERT OR IGNORE INTO alerts ({', '.join(ALERT_FIELDS)}) VALUES ({', '.join('?' * len(ALERT_FIELDS))})",
+                    alert_rows,
+                )
+                inserted = self._conn.total_changes - before
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return inserted
+
+    def pending_alerts(self, limit=1000):
+        """Alert yang belum terkirim, terlama lebih dulu."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM alerts WHERE delivered_at IS NULL ORDER BY created_at, ticker LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def mark_delivered(self, alerts):
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE alerts SET delivered_at = ? WHERE ticker = ? AND bar_time = ? AND kind = ? AND previous_scan = ?",
+                [(_now(), a['ticker'], a['bar_time'], a['kind'], a['previous_scan']) for a in alerts],
+            )
+
+    def history(self, ticker, limit=500):
+        """Riwayat sinyal satu ticker (terbaru lebih dulu), `reasons` sudah di-decode."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM signals WHERE ticker = ? ORDER BY bar_time DESC LIMIT ?", (ticker, limit)
+            ).fetchall()
+        return [{**dict(row), 'reasons': json.loads(row['reasons'] or '[]')} for row in rows]
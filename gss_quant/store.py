@@ -0,0 +1,111 @@
+"""Penyimpanan OHLCV lokal (Parquet) dengan pembaruan inkremental.
+
+Satu file per (ticker, interval). Saat refresh hanya bar sejak timestamp
+terakhir yang diambil dari provider; bar terakhir ikut diambil ulang karena
+nilainya bisa masih berubah (bar harian yang belum ditutup).
+"""
+import logging
+import os
+import re
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+import pandas as pd
+
+from gss_quant.providers import OHLCV_COLUMNS, normalize_ohlcv
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path(os.environ.get("GSS_DATA_DIR", Path.home() / ".gss_quant")) / "ohlcv"
+
+
+def _safe_name(ticker):
+    return re.sub(r'[^A-Za-z0-9._-]', '_', ticker)
+
+
+class OHLCVStore:
+    """Riwayat OHLCV penuh di disk, diperbarui dari `provider` secara inkremental."""
+
+    def __init__(self, provider, root=DEFAULT_STORE_DIR):
+        self.provider = provider
+        self.root = Path(root)
+        self._locks = defaultdict(threading.RLock)
+        self._locks_guard = threading.Lock()
+
+    def path(self, ticker, interval="1d"):
+        return self.root / f"{_safe_name(ticker)}_{interval}.parquet"
+
+    def sidecar_path(self, ticker, interval, suffix):
+        """Path file pendamping (mis. state indikator) di samping file OHLCV."""
+        return self.root / f"{_safe_name(ticker)}_{interval}.{suffix}"
+
+    def lock(self, ticker, interval="1d"):
+        """Lock (reentrant) per (ticker, interval) untuk menulis file store dan pendampingnya."""
+        with self._locks_guard:
+            return self._locks[(ticker, interval)]
+
+    def load(self, ticker, interval="1d"):
+        """Riwayat yang tersimpan, atau DataFrame kosong jika belum ada."""
+        path = self.path(ticker, interval)
+        if not path.exists():
+            return pd.DataFrame(columns=OHLCV_COLUMNS, dtype=float)
+        return pd.read_parquet(path)
+
+    def _save(self, ticker, interval, df):
+        path = self.path(ticker, interval)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, path)  # atomik: pembaca tidak pernah melihat file setengah jadi
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def merge_bars(stored, bars):
+        """Gabungkan bar baru ke riwayat; bar dengan timestamp sama ditimpa (revisi)."""
+        if stored.empty:
+            return bars
+        if bars.empty:
+            return stored
+        merged = pd.concat([stored, bars])
+        return merged[~merged.index.duplicated(keep='last')].sort_index()
+
+    def append(self, ticker, bars, interval="1d"):
+        """Tulis `bars` ke store dan kembalikan riwayat lengkap."""
+        with self.lock(ticker, interval):
+            stored = self.load(ticker, interval)
+            merged = self.merge_bars(stored, normalize_ohlcv(bars.copy()))
+            if not merged.equals(stored):
+                self._save(ticker, interval, merged)
+            return merged
+
+    def refresh(self, ticker, interval="1d", seed_period="max"):
+        """Perbarui store dari provider dan kembalikan riwayat lengkap.
+
+        Store kosong diisi sepanjang `seed_period`; selebihnya hanya bar sejak
+        timestamp terakhir yang diambil. Jika provider gagal sementara data
+        lama tersedia, data lama dikembalikan.
+        """
+        with self.lock(ticker, interval):
+            stored = self.load(ticker, interval)
+            try:
+                if stored.empty:
+                    bars = self.provider.fetch(ticker, interval, period=seed_period)
+                else:
+                    bars = self.provider.fetch(ticker, interval, start=stored.index[-1])
+            except Exception:
+                if stored.empty:
+                    raise
+                logger.warning("Gagal memperbarui %s (%s) dari %s, memakai data tersimpan",
+                               ticker, interval, self.provider.name, exc_info=True)
+                return stored
+            if bars.empty:
+                return stored
+            merged = self.merge_bars(stored, bars)
+            # Bar terakhir selalu ikut diambil ulang; file hanya ditulis jika ada bar baru atau revisi
+            if not merged.equals(stored):
+                self._save(ticker, interval, merged)
+            return merged
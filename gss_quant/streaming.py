@@ -0,0 +1,408 @@
+"""Mode streaming: tick -> bar berjalan -> indikator dan Quantum Score inkremental.
+
+Alur: `TickSource` (feed pluggable) -> thread ingest -> antrean terbatas ->
+thread proses -> `BarBuilder` -> `IndicatorState` (revisi bar berjalan O(1))
+-> `LiveUpdate` terbaru untuk UI.
+
+Backpressure: kebijakan "block" membuat source menunggu saat antrean penuh
+(cocok untuk replay), "drop_oldest" membuang tick tertua (feed live yang tidak
+bisa ditahan; jumlahnya dicatat). Prosesor mengosongkan antrean per batch dan
+menghitung indikator + skor sekali per batch, sehingga lonjakan tick hanya
+menambah kerja agregasi bar yang murah.
+"""
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from gss_quant.fx import FALLBACK_USD_IDR, convert_price_to_idr
+from gss_quant.incremental import IndicatorState
+from gss_quant.params import DEFAULT_PARAMS
+from gss_quant.scoring import score_history, signal_labels
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_POLICIES = ('block', 'drop_oldest')
+
+
+@dataclass(frozen=True)
+class Tick:
+    """Satu transaksi / kuotasi. `received_at` (time.monotonic) dipakai untuk latensi end-to-end."""
+    timestamp: pd.Timestamp
+    price: float
+    size: float = 0.0
+    received_at: float = field(default_factory=time.monotonic)
+
+
+# --- SUMBER TICK ---
+
+class TickSource:
+    """Antarmuka feed tick: `ticks()` menghasilkan `Tick` sampai feed habis atau `close()` dipanggil."""
+    name = "base"
+
+    def __init__(self):
+        self._closed = threading.Event()
+
+    @property
+    def closed(self):
+        return self._closed.is_set()
+
+    def ticks(self):
+        raise NotImplementedError
+
+    def close(self):
+        self._closed.set()
+
+
+class ReplaySource(TickSource):
+    """Putar ulang bar OHLCV sebagai tick (Open, Low/High, High/Low, Close) untuk kerja offline.
+
+    `bars_per_second` None berarti secepat mungkin (dibatasi backpressure).
+    """
+    name = "replay"
+
+    def __init__(self, df, bars_per_second=None):
+        super().__init__()
+        self.df = df
+        self.bars_per_second = bars_per_second
+
+    def ticks(self):
+        index = self.df.index
+        step = (index[1:] - index[:-1]).min() if len(index) > 1 else pd.Timedelta(0)
+        delay = 1.0 / self.bars_per_second / 4 if self.bars_per_second else 0.0
+        for ts, o, h, l, c, v in zip(index, self.df['Open'], self.df['High'], self.df['Low'],
+                                     self.df['Close'], self.df['Volume']):
+            # Bar naik biasanya menyentuh low lebih dulu, bar turun high lebih dulu
+            path = (o, l, h, c) if c >= o else (o, h, l, c)
+            for i, price in enumerate(path):
+                if self.closed:
+                    return
+                yield Tick(ts + step * (i / 4), float(price), float(v) / 4)
+                if delay:
+                    time.sleep(delay)
+
+
+class SimulatedSource(TickSource):
+    """Feed acak (random walk) dengan lonjakan tick sesekali, untuk demo dan uji beban."""
+    name = "simulated"
+
+    def __init__(self, start_price, ticks_per_second=20.0, tick_volatility=0.0005,
+                 burst_prob=0.01, burst_size=500, seed=None):
+        super().__init__()
+        self.price = float(start_price)
+        self.ticks_per_second = ticks_per_second
+        self.tick_volatility = tick_volatility
+        self.burst_prob = burst_prob
+        self.burst_size = burst_size
+        self._rng = np.random.default_rng(seed)
+
+    def ticks(self):
+        while not self.closed:
+            count = self.burst_size if self._rng.random() < self.burst_prob else 1
+            for step in self._rng.normal(0.0, self.tick_volatility, count):
+                self.price *= float(np.exp(step))
+                yield Tick(pd.Timestamp.now(tz='UTC'), self.price, float(self._rng.integers(1, 100)))
+            time.sleep(self._rng.exponential(1.0 / self.ticks_per_second))
+
+
+# --- BAR DAN SINYAL ---
+
+class BarBuilder:
+    """Agregasi tick menjadi bar OHLCV dengan panjang `interval` (mis. "5s", "1min", "1D").
+
+    Timestamp tick diubah ke zona waktu `tz` (None = tanpa zona waktu, UTC)
+    agar sejajar dengan index riwayat. Tick yang lebih lama dari bar berjalan
+    diabaikan dan dihitung di `late_ticks`.
+    """
+
+    def __init__(self, interval, tz=None):
+        self.freq = pd.Timedelta(interval)
+        self.tz = tz
+        self.timestamp = None
+        self.bar = None
+        self.late_ticks = 0
+
+    def seed(self, timestamp, bar):
+        """Lanjutkan bar yang sudah ada (mis. bar terakhir riwayat yang belum ditutup)."""
+        self.timestamp = pd.Timestamp(timestamp)
+        self.bar = {k: float(bar[k]) for k in ('Open', 'High', 'Low', 'Close', 'Volume')}
+
+    def _bucket(self, timestamp):
+        if timestamp.tzinfo is None:
+            timestamp = timestamp if self.tz is None else timestamp.tz_localize(self.tz)
+        else:
+            timestamp = timestamp.tz_convert(self.tz) if self.tz is not None else timestamp.tz_convert(None)
+        return timestamp.floor(self.freq)
+
+    def add(self, tick):
+        """Masukkan tick; kembalikan (timestamp, bar) yang baru ditutup, atau None."""
+        ts = self._bucket(tick.timestamp)
+        if self.timestamp is not None and ts < self.timestamp:
+            self.late_ticks += 1
+            return None
+        if self.timestamp is None or ts > self.timestamp:
+            closed = (self.timestamp, self.bar) if self.bar is not None else None
+            self.timestamp = ts
+            self.bar = {'Open': tick.price, 'High': tick.price, 'Low': tick.price, 'Close': tick.price, 'Volume': tick.size}
+            return closed
+        bar = self.bar
+        bar['High'] = max(bar['High'], tick.price)
+        bar['Low'] = min(bar['Low'], tick.price)
+        bar['Close'] = tick.price
+        bar['Volume'] += tick.size
+        return None
+
+
+@dataclass(frozen=True)
+class LiveUpdate:
+    """Keadaan bar berjalan setelah satu batch tick."""
+    timestamp: pd.Timestamp
+    bar: dict
+    indicators: dict
+    score: int
+    confidence: int
+    signal: str
+    risk: str
+    close_idr: float
+    ticks: int
+    latency_ms: float
+    bars_closed: int = 0
+
+
+class LiveSignalEngine:
+    """Indikator dan Quantum Score bar berjalan, diperbarui dari batch tick.
+
+    `history` (OHLCV dengan interval yang sama) menghangatkan indikator; bar
+    terakhirnya dilanjutkan jika tick pertama jatuh pada bar yang sama.
+    """
+
+    def __init__(self, history, interval, asset_is_gold=False, usd_idr_rate=FALLBACK_USD_IDR, params=DEFAULT_PARAMS):
+        self.asset_is_gold = asset_is_gold
+        self.usd_idr_rate = usd_idr_rate
+        self.params = params
+        tz = history.index.tz if isinstance(history.index, pd.DatetimeIndex) else None
+        self.builder = BarBuilder(interval, tz)
+        if len(history):
+            self.state, _ = IndicatorState.from_history(history, params)
+            self.builder.seed(history.index[-1], history.iloc[-1])
+        else:
+            self.state = IndicatorState(params)
+
+    def apply(self, ticks):
+        """Proses satu batch tick; kembalikan `LiveUpdate` atau None jika belum ada bar."""
+        bars_closed = 0
+        for tick in ticks:
+            closed = self.builder.add(tick)
+            if closed is not None:
+                # Finalisasi bar lama (revisi jika versi berjalannya sudah diproses)
+                self.state.update(*closed)
+                bars_closed += 1
+        if self.builder.bar is None:
+            return None
+        bar = dict(self.builder.bar)
+        indicators = self.state.update(self.builder.timestamp, bar)
+        row = pd.DataFrame([{**bar, **indicators}], index=pd.DatetimeIndex([self.builder.timestamp]))
+        scored = score_history(row, self.asset_is_gold, self.usd_idr_rate, self.params).iloc[-1]
+        oldest = min(t.received_at for t in ticks) if ticks else time.monotonic()
+        return LiveUpdate(
+            timestamp=self.builder.timestamp,
+            bar=bar,
+            indicators=indicators,
+            score=int(scored['SCORE']),
+            confidence=int(scored['CONFIDENCE']),
+            signal=str(signal_labels([scored['SCORE']], self.params)[0]),
+            risk=str(scored['RISK']),
+            close_idr=float(convert_price_to_idr(bar['Close'], self.asset_is_gold, self.usd_idr_rate)),
+            ticks=len(ticks),
+            latency_ms=(time.monotonic() - oldest) * 1000,
+            bars_closed=bars_closed,
+        )
+
+
+# --- PIPELINE ---
+
+class StreamMetrics:
+    """Penghitung throughput, antrean dan latensi end-to-end (tick diterima -> update terbit)."""
+
+    def __init__(self, window=4096):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.started_at = time.monotonic()
+        self.ticks_in = self.ticks_dropped = self.ticks_processed = 0
+        self.updates = self.errors = 0
+        self.max_queue = self.max_batch = 0
+
+    def record_tick(self, queue_depth, dropped=False):
+        with self._lock:
+            self.ticks_in += 1
+            self.ticks_dropped += dropped
+            self.max_queue = max(self.max_queue, queue_depth)
+
+    def record_update(self, batch_size, latency_ms=None):
+        """Catat satu batch yang diproses; `latency_ms` None berarti batch tanpa update (belum ada bar)."""
+        with self._lock:
+            self.ticks_processed += batch_size
+            self.max_batch = max(self.max_batch, batch_size)
+            if latency_ms is not None:
+                self.updates += 1
+                self._latencies.append(latency_ms)
+
+    def record_error(self, batch_size):
+        with self._lock:
+            self.ticks_processed += batch_size
+            self.errors += 1
+
+    def snapshot(self, queue_depth=0):
+        with self._lock:
+            elapsed = max(time.monotonic() - self.started_at, 1e-9)
+            latencies = np.asarray(self._latencies) if self._latencies else np.full(1, np.nan)
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            return {
+                'ticks_in': self.ticks_in,
+                'ticks_processed': self.ticks_processed,
+                'ticks_dropped': self.ticks_dropped,
+                'ticks_per_sec': self.ticks_in / elapsed,
+                'updates': self.updates,
+                'errors': self.errors,
+                'queue_depth': queue_depth,
+                'max_queue': self.max_queue,
+                'max_batch': self.max_batch,
+                'latency_p50_ms': float(p50),
+                'latency_p95_ms': float(p95),
+                'latency_p99_ms': float(p99),
+                'latency_max_ms': float(np.max(latencies)),
+            }
+
+
+_DONE = object()
+
+
+class StreamPipeline:
+    """Jalankan `source` -> antrean terbatas -> `engine` di dua thread daemon.
+
+    Update terbaru tersedia di `latest`; `on_update(update)` (opsional)
+    dipanggil dari thread proses untuk setiap update.
+    """
+
+    def __init__(self, source, engine, maxsize=10_000, policy='block', max_batch=5_000, on_update=None):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Kebijakan backpressure tidak dikenal: {policy!r} (pilih dari {', '.join(BACKPRESSURE_POLICIES)})")
+        self.source = source
+        self.engine = engine
+        self.policy = policy
+        self.max_batch = max_batch
+        self.on_update = on_update
+        self.metrics = StreamMetrics()
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._latest = None
+        self._stop = threading.Event()
+        self._threads = []
+
+    @property
+    def latest(self):
+        return self._latest
+
+    @property
+    def running(self):
+        return any(t.is_alive() for t in self._threads)
+
+    def _put(self, item, policy=None):
+        """Masukkan item sesuai kebijakan backpressure; True jika tick lama dibuang."""
+        if (policy or self.policy) == 'block':
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(item, timeout=0.2)
+                    break
+                except queue.Full:
+                    continue
+            return False
+        dropped = False
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return dropped
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    dropped = True
+                except queue.Empty:
+                    pass
+
+    def _ingest(self):
+        try:
+            for tick in self.source.ticks():
+                if self._stop.is_set():
+                    break
+                dropped = self._put(tick)
+                self.metrics.record_tick(self._queue.qsize(), dropped)
+        except Exception:
+            logger.exception("Sumber tick %s berhenti karena error", self.source.name)
+        finally:
+            # Penanda selesai selalu menunggu tempat agar tidak membuang tick yang belum dihitung
+            self._put(_DONE, 'block')
+
+    def _process(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=0.2)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            batch, done = [], item is _DONE
+            if not done:
+                batch.append(item)
+            while not done and len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._handle(batch)
+            if done:
+                return
+
+    def _handle(self, batch):
+        try:
+            update = self.engine.apply(batch)
+        except Exception:
+            logger.exception("Gagal memproses %d tick", len(batch))
+            self.metrics.record_error(len(batch))
+            return
+        if update is None:
+            self.metrics.record_update(len(batch))
+            return
+        self._latest = update
+        self.metrics.record_update(len(batch), update.latency_ms)
+        if self.on_update is not None:
+            self.on_update(update)
+
+    def start(self):
+        if self.running:
+            return self
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._ingest, name='gss-stream-ingest', daemon=True),
+            threading.Thread(target=self._process, name='gss-stream-process', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        self.source.close()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def stats(self):
+        return self.metrics.snapshot(self._queue.qsize())
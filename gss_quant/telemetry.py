@@ -0,0 +1,390 @@
+"""Instrumentasi kinerja ringan: durasi per tahap, hit rate cache, latensi provider, memori DataFrame.
+
+Mati secara bawaan; aktifkan dengan `GSS_TELEMETRY=1` (atau `enable()`).
+Saat mati, `span()` dan `upstream()` mengembalikan context manager kosong
+yang sama dan `record_*` langsung kembali, sehingga biaya di jalur panas
+hanya satu pengecekan boolean.
+
+Metrik tersedia sebagai teks Prometheus (`render_prometheus`) dan JSON
+(`snapshot`), dan bisa disajikan lewat HTTP (`start_metrics_server`, atau
+`GSS_METRICS_PORT`). Setiap span juga ditulis sebagai log JSON satu baris ke
+logger `gss_quant.telemetry`. `SamplingProfiler` (`GSS_PROFILE=1`) mengambil
+sampel stack semua thread secara berkala dalam format "collapsed" untuk
+flame graph.
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+STAGE_SECONDS = 'gss_stage_seconds'
+UPSTREAM_SECONDS = 'gss_upstream_seconds'
+UPSTREAM_ERRORS = 'gss_upstream_errors_total'
+CACHE_REQUESTS = 'gss_cache_requests_total'
+FRAME_BYTES = 'gss_frame_bytes'
+API_REQUESTS = 'gss_api_requests_total'
+
+_HELP = {
+    STAGE_SECONDS: ('histogram', "Durasi setiap tahap pipeline"),
+    UPSTREAM_SECONDS: ('histogram', "Latensi permintaan ke provider data (tanpa antrean limiter)"),
+    UPSTREAM_ERRORS: ('counter', "Permintaan ke provider data yang gagal"),
+    CACHE_REQUESTS: ('counter', "Permintaan cache menurut hasilnya"),
+    FRAME_BYTES: ('gauge', "Memori DataFrame terakhir per ticker dalam byte"),
+    API_REQUESTS: ('counter', "Permintaan API sinyal menurut rute dan status HTTP"),
+}
+# Hasil cache yang dilayani tanpa menunggu hulu
+CACHE_HIT_RESULTS = frozenset({'hit', 'fresh', 'refreshing', 'stale'})
+
+
+class _Histogram:
+    __slots__ = ('counts', 'sum', 'count', 'max')
+
+    def __init__(self, size):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+
+def _label_key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key, extra=()):
+    pairs = [*key, *extra]
+    if not pairs:
+        return ''
+    escaped = (v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+    return '{' + ','.join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + '}'
+
+
+class MetricsRegistry:
+    """Counter, gauge dan histogram berlabel dalam memori proses (thread-safe)."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._gauges = {}
+        self._histograms = {}
+
+    def inc(self, name, value=1.0, **labels):
+        with self._lock:
+            self._counters[(name, _label_key(labels))] += value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._gauges[(name, _label_key(labels))] = float(value)
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = _Histogram(len(self.buckets) + 1)
+            hist.counts[bisect_left(self.buckets, value)] += 1
+            hist.sum += value
+            hist.count += 1
+            hist.max = max(hist.max, value)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        """Semua metrik sebagai dict yang bisa langsung di-dump ke JSON."""
+        with self._lock:
+            return {
+                'counters': [{'name': n, 'labels': dict(k), 'value': v} for (n, k), v in sorted(self._counters.items())],
+                'gauges': [{'name': n, 'labels': dict(k), 'value': v} for (n, k), v in sorted(self._gauges.items())],
+                'histograms': [
+                    {'name': n, 'labels': dict(k), 'count': h.count, 'sum': h.sum, 'max': h.max}
+                    for (n, k), h in sorted(self._histograms.items())
+                ],
+            }
+
+    def render_prometheus(self):
+        """Metrik dalam format eksposisi teks Prometheus 0.0.4."""
+        lines = []
+        with self._lock:
+            series = defaultdict(list)
+            for (name, key), value in sorted(self._counters.items()):
+                series[name].append(f"{name}{_format_labels(key)} {value:g}")
+            for (name, key), value in sorted(self._gauges.items()):
+                series[name].append(f"{name}{_format_labels(key)} {value:g}")
+            for (name, key), hist in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip([*map(str, self.buckets), '+Inf'], hist.counts):
+                    cumulative += count
+                    series[name].append(f"{name}_bucket{_format_labels(key, [('le', bound)])} {cumulative}")
+                series[name].append(f"{name}_sum{_format_labels(key)} {hist.sum:g}")
+                series[name].append(f"{name}_count{_format_labels(key)} {hist.count}")
+        for name in sorted(series):
+            kind, help_text = _HELP.get(name, ('untyped', name))
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *series[name]]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+_enabled = os.environ.get("GSS_TELEMETRY", "") not in ("", "0")
+
+
+def enabled():
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def _log(event, **fields):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({'event': event, 'ts': round(time.time(), 3), **fields}, default=str))
+
+
+class _Timer:
+    """Ukur durasi blok ke histogram `metric`; label tambahan hanya masuk log agar kardinalitas tetap kecil."""
+    __slots__ = ('metric', 'labels', 'fields', 'start')
+
+    def __init__(self, metric, labels, fields):
+        self.metric = metric
+        self.labels = labels
+        self.fields = fields
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        REGISTRY.observe(self.metric, seconds, **self.labels)
+        if exc_type is not None and self.metric == UPSTREAM_SECONDS:
+            REGISTRY.inc(UPSTREAM_ERRORS, **self.labels)
+        _log(self.metric, ms=round(seconds * 1000, 3), error=exc_type.__name__ if exc_type else None,
+             **self.labels, **self.fields)
+        return False
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopTimer()
+
+
+def span(stage, **fields):
+    """Context manager yang mencatat durasi tahap `stage` (`fields` hanya ditulis ke log)."""
+    if not _enabled:
+        return _NOOP
+    return _Timer(STAGE_SECONDS, {'stage': stage}, fields)
+
+
+def upstream(provider, **fields):
+    """Seperti `span`, untuk satu permintaan ke provider data; exception dihitung sebagai galat."""
+    if not _enabled:
+        return _NOOP
+    return _Timer(UPSTREAM_SECONDS, {'provider': provider}, fields)
+
+
+def record_cache(cache, result):
+    """Catat satu permintaan ke `cache` dengan hasil `result` (hit, miss, fresh, refreshing, stale)."""
+    if _enabled:
+        REGISTRY.inc(CACHE_REQUESTS, cache=cache, result=result)
+
+
+def record_request(route, status):
+    """Catat satu permintaan API ke `route` dengan kode status HTTP `status`."""
+    if _enabled:
+        REGISTRY.inc(API_REQUESTS, route=route, status=str(status))
+
+
+def record_frame_memory(ticker, df):
+    """Catat memori `df` (deep, termasuk index) untuk `ticker`."""
+    if _enabled and df is not None:
+        REGISTRY.set(FRAME_BYTES, int(df.memory_usage(deep=True).sum()), ticker=ticker)
+
+
+def stage_summary(metric=STAGE_SECONDS, label='stage'):
+    """List dict per tahap: jumlah, rata-rata dan maksimum dalam milidetik, terlama lebih dulu."""
+    rows = [
+        {label: h['labels'].get(label), 'count': h['count'],
+         'mean_ms': h['sum'] / h['count'] * 1000 if h['count'] else 0.0, 'max_ms': h['max'] * 1000}
+        for h in REGISTRY.snapshot()['histograms'] if h['name'] == metric
+    ]
+    return sorted(rows, key=lambda r: r['mean_ms'] * r['count'], reverse=True)
+
+
+def cache_hit_rates():
+    """Dict cache -> {'requests', 'hit_rate'}; hit adalah permintaan yang dilayani tanpa menunggu hulu."""
+    totals, hits = Counter(), Counter()
+    for c in REGISTRY.snapshot()['counters']:
+        if c['name'] == CACHE_REQUESTS:
+            totals[c['labels']['cache']] += c['value']
+            if c['labels']['result'] in CACHE_HIT_RESULTS:
+                hits[c['labels']['cache']] += c['value']
+    return {cache: {'requests': int(n), 'hit_rate': hits[cache] / n} for cache, n in sorted(totals.items())}
+
+
+def snapshot():
+    return REGISTRY.snapshot()
+
+
+def render_prometheus():
+    return REGISTRY.render_prometheus()
+
+
+# --- PROFILER SAMPLING ---
+
+class SamplingProfiler:
+    """Ambil sampel stack semua thread (kecuali dirinya) setiap `interval` detik.
+
+    Tanpa hook per panggilan fungsi, sehingga overhead sebanding dengan laju
+    sampel, bukan dengan jumlah kode yang dijalankan.
+    """
+
+    def __init__(self, interval=0.01, max_depth=64):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+        self._stacks = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _sample(self):
+        own = threading.get_ident()
+        stacks = []
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            stacks.append(';'.join(reversed(stack)))
+        with self._lock:
+            self._stacks.update(stacks)
+            self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='gss-profiler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def clear(self):
+        with self._lock:
+            self._stacks.clear()
+            self.samples = 0
+
+    def collapsed(self):
+        """Stack dalam format collapsed (`a;b;c <jumlah>`), masukan untuk flamegraph.pl / speedscope."""
+        with self._lock:
+            return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+    def top(self, n=20):
+        """Fungsi teratas menurut jumlah sampel di puncak stack (self time): list (fungsi, porsi)."""
+        with self._lock:
+            leaves = Counter()
+            for stack, count in self._stacks.items():
+                leaves[stack.rsplit(';', 1)[-1]] += count
+            total = sum(leaves.values())
+        return [(func, count / total) for func, count in leaves.most_common(n)]
+
+
+PROFILER = SamplingProfiler()
+
+
+# --- ENDPOINT HTTP ---
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    routes = {
+        '/metrics': (render_prometheus, 'text/plain; version=0.0.4; charset=utf-8'),
+        '/metrics.json': (lambda: json.dumps(snapshot()), 'application/json'),
+        '/profile': (PROFILER.collapsed, 'text/plain; charset=utf-8'),
+    }
+
+    def do_GET(self):
+        route = self.routes.get(self.path.split('?', 1)[0])
+        if route is None:
+            self.send_error(404)
+            return
+        render, content_type = route
+        body = render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_server = None
+_server_guard = threading.Lock()
+
+
+def start_metrics_server(port, host="127.0.0.1"):
+    """Sajikan /metrics, /metrics.json dan /profile di thread daemon (sekali per proses)."""
+    global _server
+    with _server_guard:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name='gss-metrics', daemon=True).start()
+        return _server
+
+
+def configure_from_env():
+    """Terapkan `GSS_TELEMETRY`, `GSS_METRICS_PORT` dan `GSS_PROFILE`; kembalikan True jika telemetri aktif."""
+    if not _enabled:
+        return False
+    port = os.environ.get("GSS_METRICS_PORT")
+    if port:
+        try:
+            start_metrics_server(int(port))
+        except OSError:
+            # Proses lain (mis. worker Streamlit kedua) sudah memakai port ini
+            logger.warning("Endpoint metrik tidak bisa dibuka di port %s", port, exc_info=True)
+    if os.environ.get("GSS_PROFILE", "") not in ("", "0"):
+        PROFILER.start()
+    return True
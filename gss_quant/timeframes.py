@@ -0,0 +1,153 @@
+"""Analisis multi-timeframe dari dua seri dasar yang di-resample.
+
+Hanya seri dasar yang diunduh: 1h (untuk 1h dan 4h) dan 1d dengan riwayat
+penuh (untuk 1d dan 1w). Bar 1h dari Yahoo Finance terbatas ~730 hari, terlalu
+pendek untuk EMA 200 mingguan, sehingga 1w diturunkan dari seri harian.
+Timeframe turunan dibangun dengan resample OHLCV dan disimpan sebagai store
+turunan, lalu indikatornya diperbarui inkremental lewat `refresh_indicators`.
+"""
+import pandas as pd
+
+from gss_quant.analysis import analyze_signal
+from gss_quant.incremental import refresh_indicators
+from gss_quant.params import DEFAULT_PARAMS
+from gss_quant.providers import OHLCV_COLUMNS, slice_period
+from gss_quant.scoring import signal_labels
+from gss_quant.store import OHLCVStore
+
+BASE_INTERVAL = "1h"
+# Yahoo Finance hanya menyediakan bar 1h untuk ~730 hari terakhir
+BASE_SEED_PERIOD = "730d"
+DAILY_INTERVAL = "1d"
+DAILY_SEED_PERIOD = "max"
+
+# Timeframe -> interval seri dasar asalnya
+TIMEFRAME_BASES = {'4h': BASE_INTERVAL, '1w': DAILY_INTERVAL}
+# Timeframe -> argumen DataFrame.resample; bucket diberi label awal periodenya
+TIMEFRAMES = {
+    '4h': dict(rule='4h'),
+    '1d': dict(rule='1D'),
+    '1w': dict(rule='W-MON', label='left', closed='left'),
+}
+# Bobot skor konfluensi: timeframe lebih tinggi lebih menentukan arah
+DEFAULT_WEIGHTS = {'1h': 1.0, '4h': 1.0, '1d': 2.0, '1w': 3.0}
+
+_AGGREGATION = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+
+
+def resample_ohlcv(df, timeframe):
+    """Resample OHLCV ke `timeframe` (kunci `TIMEFRAMES`); bucket tanpa bar dibuang."""
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Timeframe tidak dikenal: {timeframe!r} (pilih dari {', '.join(TIMEFRAMES)})")
+    if df.empty:
+        return df[OHLCV_COLUMNS]
+    resampled = df[OHLCV_COLUMNS].resample(**TIMEFRAMES[timeframe]).agg(_AGGREGATION)
+    return resampled[resampled['Close'].notna()]
+
+
+class ResampledStore(OHLCVStore):
+    """Store turunan: `refresh(ticker, timeframe)` me-resample seri dasar yang sudah tersimpan di `base`.
+
+    Tidak menghubungi jaringan; perbarui `base` lebih dulu. Hanya bar dasar
+    sejak bucket terakhir yang tersimpan yang di-resample ulang.
+    """
+
+    def __init__(self, base, base_interval=BASE_INTERVAL, root=None):
+        super().__init__(base.provider, root or base.root / "resampled" / base_interval)
+        self.base = base
+        self.base_interval = base_interval
+
+    def refresh(self, ticker, interval="1d", seed_period="max"):
+        with self.lock(ticker, interval):
+            base = self.base.load(ticker, self.base_interval)
+            stored = self.load(ticker, interval)
+            if stored.empty:
+                merged = resample_ohlcv(base, interval)
+            else:
+                # Bucket terakhir dibangun ulang karena bisa masih menerima bar dasar baru
+                tail = base[base.index >= stored.index[-1]]
+                merged = self.merge_bars(stored, resample_ohlcv(tail, interval))
+            if not merged.empty:
+                self._save(ticker, interval, merged)
+            return merged
+
+
+def load_timeframes(store, ticker, timeframes=('4h', '1d', '1w'), period="1y",
+                    params=DEFAULT_PARAMS, fetch=True, base_interval=BASE_INTERVAL):
+    """Dict timeframe -> DataFrame OHLCV + indikator sepanjang `period` (timeframe kosong dilewati).
+
+    Setiap seri dasar (`base_interval` dan harian) diunduh paling banyak sekali
+    (inkremental); timeframe lain diturunkan dari seri dasar di `TIMEFRAME_BASES`.
+    """
+    sources = {tf: TIMEFRAME_BASES.get(tf, base_interval) for tf in timeframes if tf not in (base_interval, DAILY_INTERVAL)}
+    bases = {tf for tf in timeframes if tf not in sources} | set(sources.values())
+    if fetch:
+        for interval in sorted(bases):
+            seed = DAILY_SEED_PERIOD if interval == DAILY_INTERVAL else BASE_SEED_PERIOD
+            store.refresh(ticker, interval, seed_period=seed)
+    derived = {interval: ResampledStore(store, interval) for interval in set(sources.values())}
+    frames = {}
+    for timeframe in timeframes:
+        if timeframe in sources:
+            history = refresh_indicators(derived[sources[timeframe]], ticker, timeframe, params, fetch=True)
+        else:
+            history = refresh_indicators(store, ticker, timeframe, params, fetch=False)
+        df = slice_period(history, period)
+        if len(df) >= 2:
+            frames[timeframe] = df
+    return frames
+
+
+def confluence(frames, asset_is_gold, usd_idr_rate, params=DEFAULT_PARAMS, weights=None):
+    """Gabungkan `analyze_signal` setiap timeframe menjadi satu skor konfluensi.
+
+    Skor = rata-rata tertimbang skor per timeframe. `agreement` adalah porsi
+    bobot timeframe yang searah dengan sinyal gabungan (bullish >= ambang BUY,
+    bearish <= ambang STRONG SELL, selain itu netral).
+
+    Timeframe yang bar terakhirnya belum punya EMA 200 (riwayat kurang dari
+    `ema_long` bar) tidak bisa memicu aturan tren dan cross, sehingga bobotnya
+    dinolkan dan namanya dilaporkan di `incomplete`. Jika semua timeframe
+    belum lengkap, bobot bawaan tetap dipakai.
+    """
+    if not frames:
+        raise ValueError("Tidak ada timeframe dengan data yang cukup")
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+
+    def direction(score):
+        return 1 if score >= params.buy else (-1 if score <= params.strong_sell else 0)
+
+    rows = []
+    for timeframe, df in frames.items():
+        score, reasons, _, _, confidence_level = analyze_signal(df, asset_is_gold, usd_idr_rate, params)
+        rows.append({
+            'timeframe': timeframe,
+            'last_bar': df.index[-1],
+            'score': int(score),
+            'signal': str(signal_labels([score], params)[0]),
+            'confidence': int(confidence_level),
+            'weight': weights.get(timeframe, 1.0),
+            'complete': bool(pd.notna(df['EMA_200'].iloc[-1])),
+            'reasons': reasons,
+        })
+    incomplete = [r['timeframe'] for r in rows if not r['complete']]
+    if len(incomplete) < len(rows):
+        for r in rows:
+            if not r['complete']:
+                r['weight'] = 0.0
+
+    total_weight = sum(r['weight'] for r in rows)
+    score = round(sum(r['score'] * r['weight'] for r in rows) / total_weight)
+    agreeing = sum(r['weight'] for r in rows if direction(r['score']) == direction(score))
+    return {
+        'score': int(score),
+        'signal': str(signal_labels([score], params)[0]),
+        'agreement': agreeing / total_weight,
+        'incomplete': incomplete,
+        'timeframes': rows,
+    }
+
+
+def confluence_table(result):
+    """DataFrame ringkas per timeframe (tanpa alasan) untuk ditampilkan."""
+    return pd.DataFrame(result['timeframes'], columns=['timeframe', 'last_bar', 'score', 'signal', 'confidence', 'weight', 'complete'])
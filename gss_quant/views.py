@@ -0,0 +1,136 @@
+"""Pembangun grafik Plotly dan tabel dashboard (tanpa ketergantungan Streamlit).
+
+Plotly diimpor di dalam fungsi grafik, sehingga tabel tetap bisa dibuat tanpa extra `app`.
+"""
+import pandas as pd
+
+from gss_quant.decimation import CHART_MAX_CANDLES, CHART_MAX_POINTS, lttb_decimate, ohlc_decimate
+from gss_quant.fx import convert_price_to_idr, usd_idr_at
+from gss_quant.params import DEFAULT_PARAMS
+
+# Kolom harga yang ditampilkan juga dalam Rupiah
+IDR_PRICE_COLUMNS = ['Close', 'EMA_20', 'EMA_50', 'EMA_200', 'BB_UPPER', 'BB_LOWER', 'ATR']
+
+
+def gauge_figure(score):
+    """Gauge 'Kekuatan Sinyal' untuk Quantum Score."""
+    import plotly.graph_objects as go
+
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Kekuatan Sinyal"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "white"},
+            'steps': [
+                {'range': [0, 40], 'color': "#ff4b4b"},
+                {'range': [40, 60], 'color': "#ffff00"},
+                {'range': [60, 100], 'color': "#00ff00"}],
+        }
+    ))
+    fig_gauge.update_layout(height=300, margin=dict(l=20, r=20, t=30, b=20), paper_bgcolor="#0e1117")
+    return fig_gauge
+
+
+def price_figure(df, asset_name, max_candles=CHART_MAX_CANDLES, max_points=CHART_MAX_POINTS):
+    """Candlestick USD dengan overlay EMA 50/200 dan Bollinger Bands.
+
+    Riwayat didecimasi di server (candle OHLC per ember, overlay LTTB di
+    WebGL) sehingga ukuran payload tetap walaupun riwayatnya panjang. Untuk
+    detail lebih halus, panggil ulang dengan `df` yang sudah dipotong ke
+    rentang yang dilihat (`gss_quant.decimation.slice_range`).
+    """
+    import plotly.graph_objects as go
+
+    candles = ohlc_decimate(df, max_candles)
+
+    def overlay(column):
+        line = lttb_decimate(df[column], max_points)
+        return dict(x=line.index, y=line.to_numpy())
+
+    fig = go.Figure()
+    fig.add_trace(go.Candlestick(x=candles.index, open=candles['Open'], high=candles['High'], low=candles['Low'], close=candles['Close'], name='Price (USD)', opacity=0.8))
+    fig.add_trace(go.Scattergl(**overlay('EMA_50'), line=dict(color='orange', width=1.5), name='EMA 50 (USD)', visible='legendonly'))
+    fig.add_trace(go.Scattergl(**overlay('EMA_200'), line=dict(color='blue', width=2), name='EMA 200 (USD)', visible='legendonly'))
+    fig.add_trace(go.Scattergl(**overlay('BB_UPPER'), line=dict(color='rgba(255, 0, 0, 0.3)', width=1), name='BB Upper (USD)', fill=None, visible='legendonly'))
+    fig.add_trace(go.Scattergl(**overlay('BB_LOWER'), line=dict(color='rgba(0, 255, 0, 0.3)', width=1), name='BB Lower (USD)', fill='tonexty', visible='legendonly'))
+
+    title = f"Pergerakan Global {asset_name} (Basis USD)"
+    if len(candles) < len(df):
+        title += f" - {len(df):,} bar, ~{len(df) / len(candles):.0f} bar per candle"
+    fig.update_layout(
+        xaxis_rangeslider_visible=False,
+        height=600,
+        template="plotly_dark",
+        title=title,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+def score_figure(score_hist, params=DEFAULT_PARAMS, max_points=CHART_MAX_POINTS):
+    """Garis riwayat Quantum Score dengan batas STRONG BUY / STRONG SELL (LTTB, WebGL)."""
+    import plotly.graph_objects as go
+
+    score = lttb_decimate(score_hist['SCORE'].astype(float), max_points)
+    fig_score = go.Figure()
+    fig_score.add_trace(go.Scattergl(x=score.index, y=score.to_numpy(), line=dict(color='#FFD700', width=1.5), name='Quantum Score'))
+    fig_score.add_hline(y=params.strong_buy, line=dict(color='#00ff00', dash='dot', width=1))
+    fig_score.add_hline(y=params.strong_sell, line=dict(color='#ff4b4b', dash='dot', width=1))
+    fig_score.update_layout(height=300, template="plotly_dark", yaxis=dict(range=[0, 100]), margin=dict(l=20, r=20, t=30, b=20))
+    return fig_score
+
+
+def latest_data_table(df, is_gold, usd_idr):
+    """Tabel 'Data Terbaru' bar terakhir dalam USD dan estimasi IDR (kolom unik).
+
+    `usd_idr` boleh skalar atau seri kurs historis (dipakai kurs bar terakhir).
+    """
+    last = df.tail(1)
+    rate = usd_idr_at(last.index, usd_idr)
+    latest_data_usd = last[['Close', 'EMA_20', 'EMA_50', 'EMA_200', 'RSI', 'MACD', 'BB_UPPER', 'BB_LOWER', 'ADX', 'ATR']].round(2)
+    latest_data_usd.index = [latest_data_usd.index[-1].strftime('%Y-%m-%d')]
+
+    # Kolom harga dikonversi ke IDR sekaligus; RSI, MACD, ADX tetap, diberi akhiran _Rp agar unik
+    latest_data_idr = convert_price_to_idr(latest_data_usd[IDR_PRICE_COLUMNS], is_gold, rate).add_suffix('_Rp')
+    latest_data_plain = latest_data_usd[['RSI', 'MACD', 'ADX']].add_suffix('_Rp')
+
+    # Format sebagai Rupiah untuk tampilan (dengan koma); satu lintasan atas semua sel
+    latest_data_idr = pd.DataFrame(
+        [[f"Rp {x:,.0f}" for x in row] for row in latest_data_idr.to_numpy(dtype=float)],
+        index=latest_data_idr.index, columns=latest_data_idr.columns,
+    )
+
+    # Gabungkan USD dan Estimasi IDR
+    return pd.concat([latest_data_usd.add_suffix('_Usd'), latest_data_idr, latest_data_plain], axis=1)
+
+
+def matrix_heatmap(matrix, title, zmin=None, zmax=None):
+    """Heatmap matriks ticker x ticker (korelasi / beta) sesuai urutan baris dan kolomnya."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Heatmap(
+        z=matrix.to_numpy(), x=list(matrix.columns), y=list(matrix.index),
+        colorscale='RdBu', zmid=0.0, zmin=zmin, zmax=zmax,
+        hovertemplate="%{y} / %{x}: %{z:.2f}<extra></extra>",
+    ))
+    height = min(1200, max(400, 16 * len(matrix)))
+    fig.update_layout(height=height, template="plotly_dark", title=title, yaxis=dict(autorange='reversed'),
+                      margin=dict(l=20, r=20, t=40, b=20))
+    return fig
+
+
+def rolling_pair_figure(pair, ticker, benchmark, max_points=CHART_MAX_POINTS):
+    """Garis korelasi dan beta bergulir `ticker` terhadap `benchmark` (LTTB, WebGL)."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for column, color in (('CORRELATION', '#FFD700'), ('BETA', '#00BFFF')):
+        series = lttb_decimate(pair[column].dropna(), max_points)
+        fig.add_trace(go.Scattergl(x=series.index, y=series.to_numpy(), line=dict(color=color, width=1.5), name=column.title()))
+    fig.add_hline(y=0, line=dict(color='#888888', dash='dot', width=1))
+    fig.update_layout(height=300, template="plotly_dark", title=f"{ticker} terhadap {benchmark}",
+                      margin=dict(l=20, r=20, t=40, b=20))
+    return fig
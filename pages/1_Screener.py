@@ -0,0 +1,93 @@
+import time
+
+import pandas as pd
+import streamlit as st
+
+from gss_quant.assets import ASSETS, GOLD_TICKERS
+from gss_quant.fetch import ThrottledProvider
+from gss_quant.fx import fetch_usd_idr_rate
+from gss_quant.providers import YahooProvider
+from gss_quant.screener import parse_watchlist, screen_universe
+
+# --- KONFIGURASI HALAMAN ---
+st.set_page_config(
+    page_title="GSS Quantum Screener",
+    page_icon="🦅",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+COLUMN_CONFIG = {
+    'ticker': st.column_config.TextColumn("Ticker"),
+    'score': st.column_config.ProgressColumn("Quantum Score", min_value=0, max_value=100, format="%d"),
+    'signal': st.column_config.TextColumn("Sinyal"),
+    'confidence': st.column_config.NumberColumn("Kepercayaan", format="%d / 3"),
+    'risk': st.column_config.TextColumn("Risiko"),
+    'adx': st.column_config.NumberColumn("ADX", format="%.1f"),
+    'atr': st.column_config.NumberColumn("ATR (USD)", format="%.2f"),
+    'close_usd': st.column_config.NumberColumn("Harga USD", format="$%.2f"),
+    'close_idr': st.column_config.NumberColumn("Harga IDR", format="Rp %.0f"),
+    'change_pct': st.column_config.NumberColumn("Perubahan", format="%+.2f%%"),
+    'last_bar': st.column_config.DatetimeColumn("Bar Terakhir", format="YYYY-MM-DD"),
+}
+
+
+@st.cache_data(ttl=300)
+def get_exchange_rate():
+    """Mengambil kurs USD ke IDR hari ini"""
+    return fetch_usd_idr_rate()
+
+
+def render_results(placeholder, rows):
+    """Tampilkan tabel hasil (bisa diurutkan per kolom) dan daftar ticker yang gagal."""
+    ok = [r for r in rows if r.get('error') is None]
+    failed = [r for r in rows if r.get('error') is not None]
+    with placeholder.container():
+        if ok:
+            table = pd.DataFrame(ok, columns=list(COLUMN_CONFIG)).sort_values('score', ascending=False)
+            st.dataframe(table, column_config=COLUMN_CONFIG, hide_index=True, use_container_width=True)
+        if failed:
+            with st.expander(f"⚠️ {len(failed)} ticker gagal"):
+                st.dataframe(pd.DataFrame(failed), hide_index=True, use_container_width=True)
+
+
+def main():
+    st.markdown("<h1 style='font-size:2.5rem; color:#FFD700; text-align:center'>🦅 GSS QUANTUM SCREENER</h1>", unsafe_allow_html=True)
+    st.markdown("<p style='font-size:1.2rem; color:#cccccc; text-align:center'>Quantum Score untuk seluruh watchlist sekaligus</p>", unsafe_allow_html=True)
+
+    st.sidebar.header("🎛️ Kontrol Screener")
+    default_watchlist = "\n".join(info["ticker"] for info in ASSETS.values())
+    watchlist = parse_watchlist(st.sidebar.text_area("Watchlist (pisahkan dengan koma atau baris baru):", default_watchlist, height=220))
+    batch_size = st.sidebar.slider("Ticker per permintaan", 10, 200, 50, step=10)
+    fetch_workers = st.sidebar.slider("Unduhan paralel", 1, 8, 4)
+    run = st.sidebar.button("🚀 Jalankan Screener", type="primary", disabled=not watchlist)
+
+    placeholder = st.empty()
+    if not run:
+        if 'screener_rows' in st.session_state:
+            render_results(placeholder, st.session_state['screener_rows'])
+        else:
+            st.info(f"{len(watchlist)} ticker siap dipindai. Tekan **Jalankan Screener** di sidebar.")
+        return
+
+    usd_idr = get_exchange_rate()
+    st.sidebar.metric("Kurs USD/IDR Hari Ini", f"Rp {usd_idr:,.0f}")
+    progress = st.progress(0.0, text="Menghubungkan ke satelit data global...")
+
+    # Tabel diperbarui bertahap (maks. 2x per detik) selama hasil berdatangan
+    rows = []
+    last_render = 0.0
+    for row in screen_universe(watchlist, ThrottledProvider(YahooProvider()), usd_idr, gold_tickers=GOLD_TICKERS,
+                               batch_size=batch_size, fetch_workers=fetch_workers):
+        rows.append(row)
+        progress.progress(len(rows) / len(watchlist), text=f"{len(rows)}/{len(watchlist)} ticker selesai")
+        if time.monotonic() - last_render > 0.5:
+            render_results(placeholder, rows)
+            last_render = time.monotonic()
+
+    render_results(placeholder, rows)
+    progress.empty()
+    st.session_state['screener_rows'] = rows
+
+
+main()
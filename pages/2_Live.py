@@ -0,0 +1,127 @@
+import pandas as pd
+import streamlit as st
+
+from gss_quant.assets import ASSETS
+from gss_quant.fetch import ThrottledProvider
+from gss_quant.fx import fetch_usd_idr_rate
+from gss_quant.providers import YahooProvider
+from gss_quant.store import OHLCVStore
+from gss_quant.streaming import BACKPRESSURE_POLICIES, LiveSignalEngine, ReplaySource, SimulatedSource, StreamPipeline
+from gss_quant.synthetic import synthetic_ohlcv
+
+# --- KONFIGURASI HALAMAN ---
+st.set_page_config(
+    page_title="GSS Quantum Live",
+    page_icon="🦅",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+SOURCES = ["Replay riwayat aset (harian)", "Simulasi (demo, harga acak)"]
+WARMUP_BARS = 300
+REPLAY_BARS = 250
+
+
+@st.cache_data(ttl=300)
+def get_exchange_rate():
+    """Mengambil kurs USD ke IDR hari ini"""
+    return fetch_usd_idr_rate()
+
+
+@st.cache_resource
+def get_ohlcv_store():
+    """Store OHLCV lokal yang sama dengan dashboard utama"""
+    return OHLCVStore(ThrottledProvider(YahooProvider()))
+
+
+def build_pipeline(source_name, interval, asset_info, usd_idr, policy, speed):
+    """Pipeline baru: riwayat pemanasan dari OHLCV aset yang tersimpan + sumber tick sesuai pilihan."""
+    stored = get_ohlcv_store().refresh(asset_info["ticker"], "1d").dropna(subset=['Close'])
+    if len(stored) <= REPLAY_BARS:
+        raise ValueError(f"Riwayat {asset_info['ticker']} baru {len(stored)} bar")
+    if source_name == SOURCES[0]:
+        # Indikator dihangatkan dengan riwayat lama, lalu bar harian terakhir diputar ulang sebagai tick
+        history, replay = stored.iloc[:-REPLAY_BARS], stored.iloc[-REPLAY_BARS:]
+        interval = "1D"
+        source = ReplaySource(replay, bars_per_second=speed)
+    else:
+        # Demo: bentuk seri sintetis, diskalakan ke harga penutupan terakhir aset agar levelnya wajar
+        freq = pd.Timedelta(interval)
+        history = synthetic_ohlcv(WARMUP_BARS, seed=0, start_price=1.0)
+        scale = stored['Close'].iloc[-1] / history['Close'].iloc[-1]
+        history[['Open', 'High', 'Low', 'Close']] *= scale
+        end = pd.Timestamp.now(tz='UTC').floor(freq) - freq
+        history.index = pd.date_range(end=end, periods=len(history), freq=freq, name='Date')
+        source = SimulatedSource(history['Close'].iloc[-1], seed=None)
+    engine = LiveSignalEngine(history, interval, asset_info["is_gold"], usd_idr)
+    return StreamPipeline(source, engine, policy=policy).start()
+
+
+@st.fragment(run_every=0.5)
+def live_panel():
+    """Bagian yang diperbarui sendiri setiap 0,5 detik tanpa rerun seluruh halaman."""
+    pipeline = st.session_state.get('live_pipeline')
+    if pipeline is None:
+        st.info("Pilih sumber tick lalu tekan **Mulai** di sidebar.")
+        return
+    update = pipeline.latest
+    stats = pipeline.stats()
+    if update is None:
+        st.write("Menunggu tick pertama...")
+        return
+
+    bar = update.bar
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Harga (USD)", f"${bar['Close']:,.2f}")
+    c2.metric("Harga (IDR)", f"Rp {update.close_idr:,.0f}")
+    c3.metric("Quantum Score", update.score, help=f"Kepercayaan {update.confidence}/3")
+    c4.metric("Sinyal", update.signal)
+
+    st.caption(f"Bar berjalan {update.timestamp} - O {bar['Open']:,.2f} H {bar['High']:,.2f} "
+               f"L {bar['Low']:,.2f} C {bar['Close']:,.2f} | Risiko {update.risk}")
+    st.dataframe(pd.DataFrame([update.indicators]).round(2), hide_index=True, use_container_width=True)
+
+    st.markdown("#### ⏱️ Kinerja Pipeline")
+    m1, m2, m3, m4, m5 = st.columns(5)
+    m1.metric("Tick/detik", f"{stats['ticks_per_sec']:,.0f}")
+    m2.metric("Latensi p50 / p95", f"{stats['latency_p50_ms']:.1f} / {stats['latency_p95_ms']:.1f} ms")
+    m3.metric("Antrean (maks)", f"{stats['queue_depth']:,} ({stats['max_queue']:,})")
+    m4.metric("Tick dibuang", f"{stats['ticks_dropped']:,}")
+    m5.metric("Batch terbesar", f"{stats['max_batch']:,}")
+    if not pipeline.running:
+        st.warning("Sumber tick selesai atau berhenti.")
+
+
+def main():
+    st.markdown("<h1 style='font-size:2.5rem; color:#FFD700; text-align:center'>🦅 GSS QUANTUM LIVE</h1>", unsafe_allow_html=True)
+    st.markdown("<p style='font-size:1.2rem; color:#cccccc; text-align:center'>Tick → bar berjalan → Quantum Score, diperbarui di bawah satu detik</p>", unsafe_allow_html=True)
+
+    st.sidebar.header("🎛️ Kontrol Live")
+    asset_info = ASSETS[st.sidebar.selectbox("Pilih Aset:", list(ASSETS.keys()))]
+    source_name = st.sidebar.radio("Sumber tick", SOURCES)
+    interval = st.sidebar.selectbox("Panjang bar", ["5s", "15s", "1min"], disabled=source_name != SOURCES[1])
+    speed = st.sidebar.slider("Kecepatan replay (bar/detik)", 1, 200, 20, disabled=source_name != SOURCES[0])
+    policy = st.sidebar.selectbox("Backpressure", BACKPRESSURE_POLICIES)
+    usd_idr = get_exchange_rate()
+    st.sidebar.metric("Kurs USD/IDR Hari Ini", f"Rp {usd_idr:,.0f}")
+
+    start, stop = st.sidebar.columns(2)
+    if start.button("▶️ Mulai", type="primary"):
+        if st.session_state.get('live_pipeline') is not None:
+            st.session_state['live_pipeline'].stop()
+        st.session_state.pop('live_pipeline', None)
+        try:
+            st.session_state['live_pipeline'] = build_pipeline(source_name, interval, asset_info, usd_idr, policy, speed)
+        except Exception as e:
+            st.error(f"Gagal memuat riwayat {asset_info['ticker']}: {e}")
+    if stop.button("⏹️ Berhenti") and st.session_state.get('live_pipeline') is not None:
+        st.session_state.pop('live_pipeline').stop()
+
+    if source_name == SOURCES[1]:
+        st.warning("Mode demo: tick dibangkitkan acak dari harga penutupan terakhir aset, bukan harga pasar sungguhan.")
+    else:
+        st.caption(f"Replay {REPLAY_BARS} bar harian terakhir {asset_info['ticker']} dari store OHLCV lokal.")
+    live_panel()
+
+
+main()
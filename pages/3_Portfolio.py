@@ -0,0 +1,108 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+
+from gss_quant.assets import ASSETS
+from gss_quant.correlation import RollingCorrelation, aligned_returns, cluster_order, rolling_pair
+from gss_quant.fetch import ThrottledProvider
+from gss_quant.providers import YahooProvider, slice_period
+from gss_quant.screener import parse_watchlist
+from gss_quant.store import OHLCVStore
+from gss_quant.views import matrix_heatmap, rolling_pair_figure
+
+# --- KONFIGURASI HALAMAN ---
+st.set_page_config(
+    page_title="GSS Quantum Portfolio",
+    page_icon="🦅",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+MARKET_DATA_TTL = 60
+HISTORY_PERIOD = "2y"
+
+
+@st.cache_resource
+def get_ohlcv_store():
+    """Store OHLCV lokal yang sama dengan dashboard utama"""
+    return OHLCVStore(ThrottledProvider(YahooProvider()))
+
+
+@st.cache_data(ttl=MARKET_DATA_TTL, show_spinner=False)
+def get_returns(tickers):
+    """Return log harian sejajar untuk watchlist -> (DataFrame, daftar ticker yang gagal)"""
+    store = get_ohlcv_store()
+
+    def close(ticker):
+        try:
+            return slice_period(store.refresh(ticker, "1d"), HISTORY_PERIOD)['Close']
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        closes = dict(zip(tickers, pool.map(close, tickers)))
+    failed = [t for t, c in closes.items() if c is None or c.dropna().empty]
+    return aligned_returns({t: c for t, c in closes.items() if t not in failed}), failed
+
+
+@st.cache_resource
+def get_correlation_state(tickers, window):
+    """State korelasi bergulir bersama per (watchlist, jendela); diperbarui inkremental setiap rerun"""
+    return {'state': RollingCorrelation(tickers, window), 'lock': threading.Lock()}
+
+
+def main():
+    st.markdown("<h1 style='font-size:2.5rem; color:#FFD700; text-align:center'>🦅 GSS QUANTUM PORTFOLIO</h1>", unsafe_allow_html=True)
+    st.markdown("<p style='font-size:1.2rem; color:#cccccc; text-align:center'>Korelasi dan beta bergulir lintas aset</p>", unsafe_allow_html=True)
+
+    st.sidebar.header("🎛️ Kontrol Portofolio")
+    default_watchlist = "\n".join(info["ticker"] for info in ASSETS.values())
+    watchlist = parse_watchlist(st.sidebar.text_area("Watchlist (pisahkan dengan koma atau baris baru):", default_watchlist, height=220))
+    window = st.sidebar.slider("Jendela bergulir (bar harian)", 20, 250, 60, step=5)
+    clustered = st.sidebar.checkbox("Urutkan heatmap berdasarkan kluster", value=True)
+    if len(watchlist) < 2:
+        st.info("Masukkan minimal dua ticker di watchlist.")
+        return
+
+    with st.spinner("Menghubungkan ke satelit data global..."):
+        returns, failed = get_returns(tuple(watchlist))
+    if failed:
+        st.warning(f"Data tidak tersedia untuk: {', '.join(failed)}")
+    tickers = tuple(returns.columns)
+    if len(tickers) < 2 or returns.empty:
+        st.error("Data belum cukup untuk menghitung korelasi.")
+        return
+
+    shared = get_correlation_state(tickers, window)
+    with shared['lock']:
+        state = shared['state'].sync(returns)
+        correlation, beta = state.correlation(), state.beta()
+        last_bar = state.last_timestamp
+
+    order = cluster_order(correlation) if clustered else list(tickers)
+    correlation, beta = correlation.loc[order, order], beta.loc[order, order]
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Aset", f"{len(tickers):,}")
+    c2.metric("Jendela", f"{window} bar")
+    c3.metric("Bar Terakhir", pd.Timestamp(last_bar).strftime('%Y-%m-%d'))
+
+    st.markdown("### 🔗 Matriks Korelasi")
+    st.plotly_chart(matrix_heatmap(correlation, f"Korelasi return harian ({window} bar)", zmin=-1, zmax=1), use_container_width=True)
+
+    st.markdown("### ⚖️ Matriks Beta")
+    st.caption("Beta aset baris terhadap aset kolom: cov(baris, kolom) / var(kolom).")
+    st.plotly_chart(matrix_heatmap(beta, f"Beta ({window} bar)"), use_container_width=True)
+
+    st.markdown("### 📈 Korelasi & Beta Bergulir per Pasangan")
+    p1, p2 = st.columns(2)
+    ticker = p1.selectbox("Aset", tickers)
+    benchmark_options = [t for t in tickers if t != ticker]
+    benchmark = p2.selectbox("Terhadap", benchmark_options, index=benchmark_options.index("SPY") if "SPY" in benchmark_options else 0)
+    pair = rolling_pair(returns, ticker, benchmark, window)
+    st.plotly_chart(rolling_pair_figure(pair, ticker, benchmark), use_container_width=True)
+
+
+main()
@@ -1,20 +1,39 @@
+import os
 import streamlit as st
-import yfinance as yf
 import pandas as pd
-import pandas_ta as ta
-import plotly.graph_objects as go
 from datetime import datetime
 
+from gss_quant import telemetry
+from gss_quant.analysis import analyze_signal, load_market_data
+from gss_quant.assets import ASSETS, GOLD_TICKERS
+from gss_quant.correlation import aligned_returns
+from gss_quant.decimation import CHART_MAX_CANDLES, slice_range
+from gss_quant.fetch import STALE, Fetched, SingleFlightCache, ThrottledProvider, provider_limiter
+from gss_quant.frame_cache import SharedFrameCache
+from gss_quant.fx import FX_TICKER, FALLBACK_USD_IDR, convert_price_to_idr, fetch_usd_idr_rate, load_usd_idr_history, usd_idr_at
+from gss_quant.params import DEFAULT_PARAMS
+from gss_quant.prefetch import PrefetchScheduler
+from gss_quant.providers import YahooProvider
+from gss_quant.risk import MODELS, portfolio_risk
+from gss_quant.scoring import score_history
+from gss_quant.screener import parse_watchlist
+from gss_quant.store import OHLCVStore
+from gss_quant.timeframes import confluence, confluence_table, load_timeframes
+from gss_quant.views import gauge_figure, latest_data_table, price_figure, score_figure
+
 # --- KONFIGURASI HALAMAN ---
-st.set_page_config(
-    page_title="GSS Quantum Analytics v9 - Confidence Level",
-    page_icon="🦅",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+def setup_page():
+    """Konfigurasi halaman dan CSS; dipanggil dari main() agar import modul ini bebas efek samping"""
+    st.set_page_config(
+        page_title="GSS Quantum Analytics v9 - Confidence Level",
+        page_icon="🦅",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # --- CSS CUSTOM (Tampilan Profesional GSS) ---
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header { 
         font-size: 2.5rem; 
@@ -122,243 +141,409 @@ st.markdown("""
     .hl-strong-trend { background-color: rgba(255, 215, 0, 0.2); padding: 2px 4px; border-radius: 3px; }
     .hl-volatility-info { background-color: rgba(135, 206, 250, 0.2); padding: 2px 4px; border-radius: 3px; }
 </style>
-""", unsafe_allow_html=True)
-
-# --- DAFTAR ASET GSS ---
-ASSETS = {
-    "EMAS PLUANG (Gram)": {"ticker": "GC=F", "type": "Commodity", "is_gold": True},
-    "PAX GOLD (PAXG)": {"ticker": "PAXG-USD", "type": "Crypto", "is_gold": False},
-    "S&P 500 (SPY)": {"ticker": "SPY", "type": "ETF", "is_gold": False},
-    "NVIDIA (NVDA)": {"ticker": "NVDA", "type": "Stock", "is_gold": False},
-    "BITCOIN (BTC)": {"ticker": "BTC-USD", "type": "Crypto", "is_gold": False}
-}
+"""
 
 # --- FUNGSI ENGINE ---
-@st.cache_data(ttl=300)
+MARKET_DATA_TTL = 60
+EXCHANGE_RATE_TTL = 300
+
+@st.cache_resource
+def get_fetch_layer():
+    """Fetch single-flight + stale-while-revalidate bersama untuk semua sesi di proses ini"""
+    return SingleFlightCache()
+
+def _fetch_exchange_rate():
+    with provider_limiter(YahooProvider.name), telemetry.upstream(YahooProvider.name, ticker="IDR=X"):
+        return fetch_usd_idr_rate(raise_errors=True)
+
 def get_exchange_rate():
-    """Mengambil kurs USD ke IDR hari ini"""
-    try:
-        ticker = yf.Ticker("IDR=X")
-        data = ticker.history(period="1d")
-        if not data.empty:
-            return data['Close'].iloc[-1]
-        return 16000.0
-    except:
-        return 16000.0
-
-@st.cache_data(ttl=60)
-def get_market_data(ticker, period="1y"):
-    """Mengambil data pasar dan menghitung indikator teknikal"""
+    """Mengambil kurs USD ke IDR hari ini -> Fetched (16000 jika belum pernah berhasil)"""
     try:
-        df = yf.download(ticker, period=period, interval="1d", progress=False)
-        
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-
-        if df.empty or 'Close' not in df.columns:
-            if 'Adj Close' in df.columns:
-                df['Close'] = df['Adj Close']
-            else:
-                return None
-
-        # --- INDIKATOR TEKNIKAL (di basis USD) ---
-        df['EMA_20'] = ta.ema(df['Close'], length=20)
-        df['EMA_50'] = ta.ema(df['Close'], length=50)
-        df['EMA_200'] = ta.ema(df['Close'], length=200)
-        df['RSI'] = ta.rsi(df['Close'], length=14)
-
-        macd = ta.macd(df['Close'], fast=12, slow=26, signal=9)
-        if macd is not None:
-            df['MACD'] = macd.iloc[:, 0]
-            df['MACD_SIGNAL'] = macd.iloc[:, 2]
-
-        # --- INOVASI SEBELUMNYA: Indikator Baru ---
-        bb = ta.bbands(df['Close'], length=20, std=2)
-        if bb is not None:
-            df['BB_UPPER'] = bb.iloc[:, 0]
-            df['BB_MIDDLE'] = bb.iloc[:, 1]
-            df['BB_LOWER'] = bb.iloc[:, 2]
-
-        adx = ta.adx(df['High'], df['Low'], df['Close'], length=14)
-        if adx is not None:
-            df['ADX'] = adx['ADX_14']
-
-        df['VOLATILITY_30D'] = df['Close'].rolling(window=30).std()
-
-        # --- INOVASI: Average True Range (ATR) ---
-        atr = ta.atr(df['High'], df['Low'], df['Close'], length=14)
-        if atr is not None:
-            df['ATR'] = atr
-        else:
-            df['True_Range'] = df['High'] - df['Low']
-            df['True_Range'] = df['True_Range'].combine(df['High'] - df['Close'].shift(), lambda x, y: max(x, abs(y)), fill_value=0)
-            df['True_Range'] = df['True_Range'].combine(df['Close'].shift() - df['Low'], lambda x, y: max(x, abs(y)), fill_value=0)
-            df['ATR'] = df['True_Range'].rolling(window=14).mean()
+        return get_fetch_layer().get(('usd_idr',), _fetch_exchange_rate, ttl=EXCHANGE_RATE_TTL)
+    except Exception as e:
+        return Fetched(FALLBACK_USD_IDR, STALE, 0.0, str(e))
 
-        return df
+def get_usd_idr_history():
+    """Seri kurs harian USD/IDR (IDR=X) untuk konversi historis -> Fetched, atau None jika gagal"""
+    store = get_ohlcv_store()
+    try:
+        return get_fetch_layer().get(('usd_idr_history',), lambda: load_usd_idr_history(store), ttl=EXCHANGE_RATE_TTL)
+    except Exception:
+        return None
 
+@st.cache_resource
+def get_ohlcv_store():
+    """Store OHLCV lokal (Parquet) yang diperbarui inkremental dari Yahoo Finance"""
+    return OHLCVStore(ThrottledProvider(YahooProvider()))
+
+@st.cache_resource
+def get_frame_cache():
+    """Cache DataFrame Arrow di memori bersama; satu salinan untuk semua sesi dan proses worker"""
+    return SharedFrameCache()
+
+def _market_data_loader(store, frame_cache, ticker, period="1y", interval="1d", max_age=MARKET_DATA_TTL):
+    """Loader untuk fetch layer; `max_age` membatasi umur entri cache bersama yang boleh dipakai ulang"""
+    key = ('market_data', ticker, period, interval)
+    # --- INDIKATOR TEKNIKAL (di basis USD) ---
+    # Riwayat penuh + state indikator disimpan di disk; hanya bar baru yang diunduh dan dihitung
+    # View zero-copy dari cache bersama; fetch layer menggantinya saat refresh sehingga lease lama terlepas
+    return lambda: frame_cache.get_or_compute(key, lambda: load_market_data(store, ticker, period, interval), max_age=max_age)
+
+def get_market_data(ticker, period="1y", interval="1d"):
+    """Mengambil data pasar dan menghitung indikator teknikal -> Fetched (DataFrame read-only), atau None jika gagal"""
+    # Objek Streamlit diambil di thread skrip; loader berjalan di thread latar
+    load = _market_data_loader(get_ohlcv_store(), get_frame_cache(), ticker, period, interval)
+    try:
+        return get_fetch_layer().get(('market_data', ticker, period, interval), load, ttl=MARKET_DATA_TTL)
     except Exception as e:
         st.error(f"Error saat mengambil data: {e}")
         return None
 
-def convert_price_to_idr(price_usd, is_gold, usd_idr_rate):
-    """Fungsi utilitas untuk konversi harga USD ke IDR."""
-    if is_gold:
-        # 1 Troy Ounce = 31.1035 Gram
-        return (price_usd / 31.1035) * usd_idr_rate
-    else:
-        return price_usd * usd_idr_rate
+def get_timeframes(ticker):
+    """OHLCV + indikator 4h / 1d / 1w dari seri dasar 1h dan 1d (sisanya resample) -> Fetched, atau None jika gagal"""
+    store = get_ohlcv_store()
+    try:
+        return get_fetch_layer().get(('timeframes', ticker), lambda: load_timeframes(store, ticker), ttl=MARKET_DATA_TTL)
+    except Exception as e:
+        st.error(f"Error saat mengambil data multi-timeframe: {e}")
+        return None
 
-def analyze_signal(df, asset_is_gold, usd_idr_rate):
-    """Analisis Sinyal Dinamis dengan integrasi nilai IDR dan Confidence Level."""
-    if df is None: return 50, ["Data tidak tersedia"], 0.0, 0.0, 0
+@st.cache_resource
+def get_prefetcher():
+    """Penjadwal latar yang menjaga cache semua aset (dan $GSS_PREFETCH_WATCHLIST) tetap hangat"""
+    store, frame_cache, fetch_layer = get_ohlcv_store(), get_frame_cache(), get_fetch_layer()
+
+    def refresh(ticker):
+        # Entri bersama yang berumur < separuh TTL (mis. dari proses worker lain) dipakai ulang
+        load = _market_data_loader(store, frame_cache, ticker, max_age=MARKET_DATA_TTL / 2)
+        fetch_layer.refresh(('market_data', ticker, "1y", "1d"), load)
+
+    assets = {info['ticker']: info['type'] for info in ASSETS.values()}
+    scheduler = PrefetchScheduler(refresh, assets, interval=MARKET_DATA_TTL * 0.75)
+    for ticker in parse_watchlist(os.environ.get("GSS_PREFETCH_WATCHLIST", "")):
+        scheduler.add(ticker)
+    return scheduler.start()
+
+@st.cache_resource
+def get_telemetry():
+    """Aktifkan endpoint metrik / profiler sesuai $GSS_TELEMETRY, $GSS_METRICS_PORT, $GSS_PROFILE (sekali per proses)"""
+    return telemetry.configure_from_env()
+
+def telemetry_panel():
+    """Ringkasan kinerja di sidebar (hanya saat telemetri aktif)"""
+    with st.sidebar.expander("⏱️ Telemetri Kinerja"):
+        stages = pd.DataFrame(telemetry.stage_summary())
+        if not stages.empty:
+            st.dataframe(stages.round(1), hide_index=True, use_container_width=True)
+        for cache, stats in telemetry.cache_hit_rates().items():
+            st.caption(f"Cache {cache}: {stats['hit_rate']:.0%} hit dari {stats['requests']:,} permintaan")
+        upstream = telemetry.stage_summary(telemetry.UPSTREAM_SECONDS, 'provider')
+        for row in upstream:
+            st.caption(f"Provider {row['provider']}: rata-rata {row['mean_ms']:,.0f} ms ({row['count']:,} permintaan)")
+        profiling = st.toggle("Profiler sampling", value=telemetry.PROFILER.running)
+        if profiling and not telemetry.PROFILER.running:
+            telemetry.PROFILER.start()
+        elif not profiling and telemetry.PROFILER.running:
+            telemetry.PROFILER.stop()
+        if telemetry.PROFILER.samples:
+            top = pd.DataFrame(telemetry.PROFILER.top(10), columns=['fungsi', 'porsi'])
+            st.dataframe(top, hide_index=True, use_container_width=True)
+
+
+RISK_PATHS = {"10 ribu": 10_000, "100 ribu": 100_000, "1 juta": 1_000_000}
+
+@st.fragment
+def risk_section(asset_info, usd_idr, usd_idr_hist):
+    """Simulasi Monte Carlo VaR / Expected Shortfall / peluang kena stop-loss ATR (USD & IDR)"""
+    st.markdown("### 🎲 Simulasi Risiko Monte Carlo")
+    # Cakupan dan bobot di luar form: input bobot langsung tampil saat cakupan diganti
+    scope = st.radio("Cakupan", ["Aset ini", "Portofolio aset GSS"], horizontal=True)
+    weights = {asset_info['ticker']: 1.0}
+    if scope != "Aset ini":
+        st.caption("Bobot portofolio (dinormalisasi otomatis):")
+        columns = st.columns(len(ASSETS))
+        weights = {info['ticker']: col.number_input(name, min_value=0.0, value=1.0, step=0.5) for col, (name, info) in zip(columns, ASSETS.items())}
+    with st.form("risk_form"):
+        c1, c2, c3 = st.columns(3)
+        model = c1.selectbox("Model", MODELS, help="bootstrap: riwayat diambil ulang; gbm: normal multivariat; garch: volatilitas bersyarat")
+        horizon = c2.slider("Horizon (hari bursa)", 5, 250, 20)
+        paths = RISK_PATHS[c3.selectbox("Jumlah jalur", list(RISK_PATHS), index=1)]
+        value_idr = st.number_input("Nilai posisi / portofolio (Rp)", min_value=1_000_000.0, value=100_000_000.0, step=1_000_000.0, format="%.0f")
+        run = st.form_submit_button("Jalankan Simulasi", type="primary")
+
+    if run:
+        total = sum(weights.values())
+        frames = {t: get_market_data(t) for t, w in weights.items() if w > 0}
+        frames = {t: f.value for t, f in frames.items() if f is not None and f.value is not None}
+        if not frames or total <= 0:
+            st.error("Data tidak tersedia untuk simulasi.")
+            return
+        closes = {t: df['Close'] for t, df in frames.items()}
+        if isinstance(usd_idr_hist, pd.Series):
+            closes[FX_TICKER] = usd_idr_hist
+        positions = {t: value_idr / usd_idr * weights[t] / total for t in frames}
+        with st.spinner(f"Mensimulasikan {paths:,} jalur x {horizon} hari..."):
+            started = datetime.now()
+            try:
+                st.session_state['risk_result'] = portfolio_risk(
+                    aligned_returns(closes), positions, usd_idr,
+                    prices_usd={t: df['Close'].iloc[-1] for t, df in frames.items()},
+                    atr_usd={t: df['ATR'].iloc[-1] for t, df in frames.items()},
+                    gold_tickers=GOLD_TICKERS, model=model, horizon=horizon, paths=paths,
+                )
+            except ValueError as e:
+                st.error(f"Simulasi gagal: {e}")
+                return
+            st.session_state['risk_seconds'] = (datetime.now() - started).total_seconds()
+
+    result = st.session_state.get('risk_result')
+    if result is None:
+        return
+    st.caption(f"{result['model']} - {result['paths']:,} jalur x {result['horizon']} hari untuk {', '.join(result['tickers'])} "
+               f"({st.session_state.get('risk_seconds', 0):.1f} detik); kurs {'disimulasikan' if result['fx_simulated'] else 'tetap'}.")
+    cols = st.columns(len(result['risk']) * 2)
+    for i, row in enumerate(result['risk']):
+        level = f"{row['confidence']:.0%}"
+        cols[2 * i].metric(f"VaR {level}", f"Rp {row['var_idr']:,.0f}", f"-{row['var_pct']:.1f}% / ${row['var_usd']:,.0f}", delta_color="off")
+        cols[2 * i + 1].metric(f"Expected Shortfall {level}", f"Rp {row['es_idr']:,.0f}", f"-{row['es_pct']:.1f}% / ${row['es_usd']:,.0f}", delta_color="off")
+    if result['stops']:
+        stops = pd.DataFrame(result['stops'])
+        st.dataframe(stops, hide_index=True, use_container_width=True, column_config={
+            'ticker': st.column_config.TextColumn("Ticker"),
+            'price_usd': st.column_config.NumberColumn("Harga USD", format="$%.2f"),
+            'stop_usd': st.column_config.NumberColumn("Stop-Loss USD (2x ATR)", format="$%.2f"),
+            'stop_idr': st.column_config.NumberColumn("Stop-Loss IDR", format="Rp %.0f"),
+            'hit_probability': st.column_config.ProgressColumn("Peluang Kena Stop", min_value=0.0, max_value=1.0, format="%.2f"),
+        })
+
+
+# --- MEMO HASIL ANALISIS ---
+# Hasil analisis, grafik dan tabel dipakai bersama semua sesi selama kuncinya sama:
+# (ticker, bar terakhir, kurs, parameter). Argumen berawalan _ tidak di-hash oleh
+# Streamlit; isinya sudah terwakili oleh kunci. Objek hasil bersifat read-only.
+MEMO_TTL = 600
+MEMO_ENTRIES = 64
+
+def _bar_key(df):
+    """Kunci data pasar: waktu bar terakhir, jumlah bar dan Close terakhir (bar berjalan yang direvisi ikut terdeteksi)"""
+    return (df.index[-1].isoformat(), len(df), float(df['Close'].iloc[-1]))
+
+def _fx_key(usd_idr):
+    """Kunci kurs: nilai skalar, atau (tanggal, nilai, panjang) seri kurs historis"""
+    if isinstance(usd_idr, pd.Series):
+        return (usd_idr.index[-1].isoformat(), float(usd_idr.iloc[-1]), len(usd_idr))
+    return float(usd_idr)
+
+@st.cache_resource(ttl=MEMO_TTL, max_entries=MEMO_ENTRIES, show_spinner=False)
+def memo_signal(ticker, bar_key, fx_key, params, is_gold, _df, _usd_idr):
+    """analyze_signal + gauge untuk bar terakhir"""
+    with telemetry.span('analyze_signal'):
+        score, reasons, volatility_idr, atr_idr, confidence_level = analyze_signal(_df, is_gold, _usd_idr, params)
+    return {
+        'score': score, 'reasons': reasons, 'volatility_idr': volatility_idr, 'atr_idr': atr_idr,
+        'confidence_level': confidence_level, 'gauge': gauge_figure(score),
+    }
 
-    last = df.iloc[-1]
-    prev = df.iloc[-2]
+@st.cache_resource(ttl=MEMO_TTL, max_entries=MEMO_ENTRIES, show_spinner=False)
+def memo_price_figure(ticker, bar_key, asset_name, start, end, _df):
+    """Candlestick + overlay untuk rentang [start, end] (None = seluruh riwayat)"""
+    chart_df = _df if start is None else slice_range(_df, start, end)
+    with telemetry.span('price_figure', bars=len(chart_df)):
+        return price_figure(chart_df, asset_name)
+
+@st.cache_resource(ttl=MEMO_TTL, max_entries=MEMO_ENTRIES, show_spinner=False)
+def memo_score_figure(ticker, bar_key, fx_key, params, is_gold, _df, _usd_idr):
+    """Riwayat Quantum Score semua bar sebagai grafik"""
+    with telemetry.span('score_history', bars=len(_df)):
+        score_hist = score_history(_df, is_gold, _usd_idr, params)
+    with telemetry.span('score_figure'):
+        return score_figure(score_hist, params)
+
+@st.cache_resource(ttl=MEMO_TTL, max_entries=MEMO_ENTRIES, show_spinner=False)
+def memo_latest_table(ticker, bar_key, fx_key, is_gold, _df, _usd_idr):
+    """Tabel data terbaru USD & IDR yang sudah diformat"""
+    with telemetry.span('latest_data_table'):
+        return latest_data_table(_df, is_gold, _usd_idr)
+
+
+# --- PANEL ---
+# Setiap panel adalah fragment: widget di dalamnya hanya menjalankan ulang panel itu.
+# Rerun fragment memakai argumen dari rerun penuh terakhir.
+
+@st.fragment
+def price_panel(df, is_gold, usd_idr_hist):
+    """Harga terakhir USD & IDR dan perubahan 24 jam"""
+    last_close_usd = df['Close'].iloc[-1]
+    prev_close_usd = df['Close'].iloc[-2]
+    change_pct = ((last_close_usd - prev_close_usd) / prev_close_usd) * 100
+
+    # --- KONVERSI HARGA GLOBAL UNTUK UI ---
+    prev_rate, last_rate = usd_idr_at(df.index[-2:], usd_idr_hist)
+    last_close_idr = convert_price_to_idr(last_close_usd, is_gold, last_rate)
+    prev_close_idr = convert_price_to_idr(prev_close_usd, is_gold, prev_rate)
+    change_idr = last_close_idr - prev_close_idr
+
+    # --- TAMPILAN HARGA DUAL VERSION (IDR di depan untuk kejelasan) ---
+    st.markdown("### 💰 Harga Terkini (Real-Time - USD & IDR)")
+    c1, c2, c3 = st.columns([1.5, 1.5, 2])
+
+    with c1:
+        st.markdown(f"<div class='price-box'><div class='small-font'>Harga Rupiah (Estimasi)</div><div class='big-font' style='color:#00ff00'>Rp {last_close_idr:,.0f}</div><div class='small-font'>/ unit</div></div>", unsafe_allow_html=True)
+
+    with c2:
+        st.markdown(f"<div class='price-box'><div class='small-font'>Harga Global (USD)</div><div class='big-font' style='color:#FFD700'>${last_close_usd:.2f}</div><div class='small-font'>/ unit</div></div>", unsafe_allow_html=True)
+
+    with c3:
+        color = "green" if change_pct >= 0 else "red"
+        color_idr = "green" if change_idr >= 0 else "red"
+        st.markdown(f"<div class='price-box'><div class='small-font'>Perubahan 24 Jam</div><div class='big-font' style='color:{color}'>{change_pct:+.2f}%</div><div class='small-font' style='color:{color_idr}'>Rp {change_idr:,.0f}</div></div>", unsafe_allow_html=True)
+
+@st.fragment
+def signal_panel(ticker, df, is_gold, usd_idr_hist):
+    """Gauge, label sinyal + alasan, dan kartu risiko / ADX / ATR"""
+    # 2. ANALISIS QUANTUM SCORE, VOLATILITAS, ATR, dan CONFIDENCE LEVEL
+    signal = memo_signal(ticker, _bar_key(df), _fx_key(usd_idr_hist), DEFAULT_PARAMS, is_gold, df, usd_idr_hist)
+    score, reasons, confidence_level = signal['score'], signal['reasons'], signal['confidence_level']
+    volatility_idr, atr_idr = signal['volatility_idr'], signal['atr_idr']
+    last_close_usd = df['Close'].iloc[-1]
+
+    st.markdown("### 🔮 Quantum Signal & Risk Analysis")
+    cols_sig1, cols_sig2, cols_risk = st.columns([1, 2, 1])
+
+    with cols_sig1:
+        st.plotly_chart(signal['gauge'], use_container_width=True)
+
+    with cols_sig2:
+        if score >= DEFAULT_PARAMS.strong_buy:
+            st.markdown(f"<div class='signal-box buy-signal'>STRONG BUY 🚀<br><span style='font-size:1rem'>Momentum Sangat Kuat</span></div>", unsafe_allow_html=True)
+        elif score >= DEFAULT_PARAMS.buy:
+            st.markdown(f"<div class='signal-box buy-signal' style='background-color:#003300'>BUY (ACCUMULATE) 🛒<br><span style='font-size:1rem'>Mulai Cicil Masuk</span></div>", unsafe_allow_html=True)
+        elif score <= DEFAULT_PARAMS.strong_sell:
+            st.markdown(f"<div class='signal-box sell-signal'>STRONG SELL 🛑<br><span style='font-size:1rem'>Pasar Sedang Jatuh</span></div>", unsafe_allow_html=True)
+        else:
+            st.markdown(f"<div class='signal-box neutral-signal'>NEUTRAL / WAIT ✋<br><span style='font-size:1rem'>Tunggu Konfirmasi</span></div>", unsafe_allow_html=True)
 
-    score = 0
-    reasons = []
-    confidence_points = 0 # Tambahkan variabel untuk menghitung kepercayaan
+        # --- INOVASI: Tampilkan Tingkat Kepercayaan ---
+        if confidence_level == 3:
+            conf_text = "Tingkat Kepercayaan: Sangat Tinggi (✅✅✅)"
+        elif confidence_level == 2:
+            conf_text = "Tingkat Kepercayaan: Sedang (✅✅)"
+        else:
+            conf_text = "Tingkat Kepercayaan: Rendah (✅)"
+
+        st.markdown(f"<div class='confidence-box {'' if confidence_level == 3 else ('' if confidence_level == 2 else '')}'>{conf_text}</div>", unsafe_allow_html=True)
+
+        st.write(" ")
+        st.caption("🔍 **Alasan Logis (Berdasarkan Data Live - USD & IDR):**")
+        for reason in reasons:
+             hl_class = ""
+             if "Oversold" in reason or "bounce" in reason.lower():
+                 hl_class = "hl-oversold"
+             elif "Overbought" in reason or "koreksi" in reason.lower() or "menembus band atas" in reason.lower():
+                 hl_class = "hl-overbought"
+             elif "tren sangat kuat" in reason.lower():
+                 hl_class = "hl-strong-trend"
+             elif "ATR" in reason:
+                 hl_class = "hl-volatility-info"
+             # --- Gunakan st.markdown dengan kelas CSS ---
+             st.markdown(f"<p class='signal-reason'>• <span class='{hl_class}'>{reason}</span></p>", unsafe_allow_html=True)
+
+
+    with cols_risk:
+         # --- Informasi Risiko & ATR (dengan nilai IDR) ---
+         risk_level_str = "N/A"
+         risk_style = "risk-medium"
+         volatility_raw = df['VOLATILITY_30D'].iloc[-1] if pd.notna(df['VOLATILITY_30D'].iloc[-1]) else 0.0
+         if volatility_raw != 0:
+             if volatility_raw < (last_close_usd * 0.02):
+                 risk_level_str = "Rendah"
+                 risk_style = "risk-low"
+             elif volatility_raw < (last_close_usd * 0.05):
+                 risk_level_str = "Sedang"
+                 risk_style = "risk-medium"
+             else:
+                 risk_level_str = "Tinggi"
+                 risk_style = "risk-high"
+
+         st.markdown(f"<div class='info-card'><h4>📊 Risiko (Volatilitas 30D)</h4><p class='medium-font'>{risk_level_str}</p><p class='small-font'>Std Dev: ${volatility_raw:.2f} / Rp {volatility_idr:,.0f}</p></div>", unsafe_allow_html=True)
+         
+         adx_val = df['ADX'].iloc[-1] if pd.notna(df['ADX'].iloc[-1]) else 0.0
+         adx_status = "Lemah" if adx_val < 25 else ("Sedang" if adx_val < 50 else "Kuat")
+         st.markdown(f"<div class='info-card'><h4>🧭 Kekuatan Tren (ADX)</h4><p class='medium-font'>{adx_val:.1f}</p><p class='small-font'>{adx_status} ({'<25' if adx_val < 25 else ('25-50' if adx_val < 50 else '>50')})</p></div>", unsafe_allow_html=True)
+
+         # --- INOVASI: Tampilkan ATR ---
+         atr_raw = df['ATR'].iloc[-1] if pd.notna(df['ATR'].iloc[-1]) else 0.0
+         if atr_raw > 0:
+             st.markdown(f"<div class='info-card'><h4>🌪️ Volatilitas (ATR 14D)</h4><p class='medium-font'>${atr_raw:.2f} / Rp {atr_idr:,.0f}</p><p class='small-font'>Rentang rata-rata pergerakan.</p></div>", unsafe_allow_html=True)
+         else:
+             st.markdown(f"<div class='info-card'><h4>🌪️ Volatilitas (ATR 14D)</h4><p class='medium-font'>N/A</p><p class='small-font'>Data tidak tersedia.</p></div>", unsafe_allow_html=True)
+
+@st.fragment
+def chart_panel(ticker, asset_name, df):
+    """Grafik teknikal USD; slider rentang hanya menjalankan ulang panel ini"""
+    # 3. CHART UTAMA (tetap dalam USD)
+    st.markdown("### 📉 Grafik Teknikal Lanjutan (USD)")
+    start = end = None
+    if len(df) > CHART_MAX_CANDLES:
+        # Grafik didecimasi; mempersempit rentang menggambar ulang dengan detail lebih halus
+        dates = df.index.tz_localize(None) if df.index.tz is not None else df.index
+        first, last = dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+        start, end = st.slider("Rentang grafik (persempit untuk detail lebih halus)", min_value=first, max_value=last, value=(first, last), format="YYYY-MM-DD")
+        if (start, end) == (first, last):
+            start = end = None
+    fig = memo_price_figure(ticker, _bar_key(df), asset_name, start, end, df)
+    with telemetry.span('render_chart'):
+        st.plotly_chart(fig, use_container_width=True)
 
-    volatility = last['VOLATILITY_30D'] if pd.notna(last['VOLATILITY_30D']) else 0.0
-    adx_value = last['ADX'] if pd.notna(last['ADX']) else 0.0
-    atr_value = last['ATR'] if pd.notna(last['ATR']) else 0.0
+@st.fragment
+def score_panel(ticker, df, is_gold, usd_idr_hist):
+    """Riwayat Quantum Score (dihitung tervektorisasi untuk semua bar)"""
+    st.markdown("### 📈 Riwayat Quantum Score")
+    fig_score = memo_score_figure(ticker, _bar_key(df), _fx_key(usd_idr_hist), DEFAULT_PARAMS, is_gold, df, usd_idr_hist)
+    with telemetry.span('render_chart'):
+        st.plotly_chart(fig_score, use_container_width=True)
+
+@st.fragment
+def table_panel(ticker, df, is_gold, usd_idr_hist):
+    """Tabel data terbaru (kolom unik USD & estimasi IDR)"""
+    st.markdown("### 🧮 Data Terbaru (USD & Estimasi IDR)")
+    latest_data_combined = memo_latest_table(ticker, _bar_key(df), _fx_key(usd_idr_hist), is_gold, df, usd_idr_hist)
+    with telemetry.span('render_table'):
+        st.dataframe(latest_data_combined, use_container_width=True)
 
-    # Konversi harga dan indikator ke IDR untuk digunakan dalam logika dan alasan
-    price_now_idr = convert_price_to_idr(last['Close'], asset_is_gold, usd_idr_rate)
-    ema200_idr = convert_price_to_idr(last['EMA_200'], asset_is_gold, usd_idr_rate)
-    bb_upper_idr = convert_price_to_idr(last['BB_UPPER'], asset_is_gold, usd_idr_rate) if pd.notna(last['BB_UPPER']) else 0
-    bb_lower_idr = convert_price_to_idr(last['BB_LOWER'], asset_is_gold, usd_idr_rate) if pd.notna(last['BB_LOWER']) else 0
-    atr_value_idr = convert_price_to_idr(atr_value, asset_is_gold, usd_idr_rate)
-    volatility_idr = convert_price_to_idr(volatility, asset_is_gold, usd_idr_rate)
+@st.fragment
+def timeframe_panel(ticker, is_gold, usd_idr_hist):
+    """Konfluensi multi-timeframe (seri dasar 1h dan 1d, sisanya hasil resample); toggle hanya menjalankan ulang panel ini"""
+    if not st.toggle("🕐 Konfluensi multi-timeframe (4h / 1d / 1w)"):
+        return
+    st.markdown("### 🕐 Konfluensi Multi-Timeframe")
+    timeframes = get_timeframes(ticker)
+    if timeframes is not None and timeframes.value:
+        result = confluence(timeframes.value, is_gold, usd_idr_hist)
+        c1, c2 = st.columns([1, 2])
+        with c1:
+            st.metric("Skor Konfluensi", result['score'], help="Rata-rata tertimbang skor 4h / 1d / 1w")
+            st.markdown(f"**{result['signal']}** - {result['agreement']:.0%} bobot timeframe searah")
+            if result['incomplete']:
+                st.caption(f"Riwayat belum cukup untuk EMA 200 di {', '.join(result['incomplete'])}; tidak ikut dibobot.")
+            st.caption(timeframes.describe())
+        with c2:
+            st.dataframe(confluence_table(result), hide_index=True, use_container_width=True)
+    elif timeframes is not None:
+        st.warning("Data belum cukup untuk analisis multi-timeframe.")
 
-    # 1. ANALISIS TREN (EMA)
-    price_now = last['Close']
-    ema200 = last['EMA_200']
 
-    if pd.isna(ema200):
-        reasons.append("Data EMA 200 belum cukup.")
-    else:
-        if price_now > ema200:
-            gap = ((price_now - ema200) / ema200) * 100
-            score += 25
-            reasons.append(f"Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}) berada {gap:.1f}% DI ATAS garis tren jangka panjang (EMA 200: ${ema200:.2f} / Rp {ema200_idr:,.0f}). Pasar Bullish.")
-            if last['EMA_50'] > ema200: # Konfirmasi tren menengah
-                confidence_points += 1
-                reasons.append("  -> EMA 50 > EMA 200, konfirmasi tren menengah naik.")
-        else:
-            gap = ((ema200 - price_now) / ema200) * 100
-            score -= 25
-            reasons.append(f"Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}) berada {gap:.1f}% DI BAWAH garis tren jangka panjang (EMA 200: ${ema200:.2f} / Rp {ema200_idr:,.0f}). Pasar Bearish.")
-            if last['EMA_50'] < ema200: # Konfirmasi tren menengah
-                confidence_points += 1
-                reasons.append("  -> EMA 50 < EMA 200, konfirmasi tren menengah turun.")
-
-    # Golden Cross / Death Cross (telah dihitung dalam EMA)
-    if pd.notna(last['EMA_50']) and pd.notna(last['EMA_200']):
-        if last['EMA_50'] > last['EMA_200']:
-            score += 15
-        elif last['EMA_50'] < last['EMA_200']:
-            score -= 10
-
-    # 2. ANALISIS MOMENTUM (RSI)
-    rsi = last['RSI']
-    if pd.isna(rsi):
-        reasons.append("Data RSI tidak tersedia.")
-    else:
-        if rsi < 30:
-            score += 35
-            reasons.append(f"RSI Sangat Murah (Oversold) di level {rsi:.1f}. Potensi pantulan harga tinggi! Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
-            confidence_points += 1 # Oversold adalah sinyal kuat
-        elif rsi > 70:
-            score -= 25
-            reasons.append(f"RSI Sangat Mahal (Overbought) di level {rsi:.1f}. Hati-hati koreksi. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
-            confidence_points += 1 # Overbought adalah sinyal kuat
-        elif 30 <= rsi <= 50:
-            score += 10
-            reasons.append(f"RSI di level {rsi:.1f} (Zona Akumulasi). Masih aman untuk masuk. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
-        else: # 50-70
-            score += 5
-            reasons.append(f"RSI di level {rsi:.1f} (Zona Pertumbuhan). Momentum positif. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
-
-    # 3. MACD Dynamic
-    macd_val = last['MACD']
-    macd_sig = last['MACD_SIGNAL']
-    if pd.isna(macd_val) or pd.isna(macd_sig):
-         reasons.append("Data MACD tidak tersedia.")
-    else:
-        if macd_val > macd_sig:
-            score += 20
-            reasons.append(f"MACD Line ({macd_val:.2f}) di atas Signal ({macd_sig:.2f}). Momentum beli aktif. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
-            confidence_points += 1 # MACD crossover adalah sinyal kuat
-        else:
-            score -= 20
-            reasons.append(f"MACD Line ({macd_val:.2f}) di bawah Signal ({macd_sig:.2f}). Tekanan jual masih ada. Harga (${price_now:.2f} / Rp {price_now_idr:,.0f}).")
-            confidence_points += 1 # MACD crossover adalah sinyal kuat
-
-    # --- INOVASI SEBELUMNYA: Logika dari Indikator Baru ---
-    # 4. Bollinger Bands
-    if pd.notna(last['BB_UPPER']) and pd.notna(last['BB_LOWER']):
-        if price_now > last['BB_UPPER']:
-            score -= 30
-            reasons.append(f"Harga MENEMBUS Band Atas (${last['BB_UPPER']:.2f} / Rp {bb_upper_idr:,.0f}). Potensi overbought, koreksi mungkin terjadi.")
-            confidence_points += 1 # Breakout atas adalah sinyal kuat
-        elif price_now < last['BB_LOWER']:
-            score += 30
-            reasons.append(f"Harga MENEMBUS Band Bawah (${last['BB_LOWER']:.2f} / Rp {bb_lower_idr:,.0f}). Potensi oversold, bounce mungkin terjadi.")
-            confidence_points += 1 # Breakout bawah adalah sinyal kuat
-        else:
-            reasons.append(f"Harga berada di dalam Bollinger Bands. Rentang normal (${last['BB_LOWER']:.2f} - ${last['BB_UPPER']:.2f} / Rp {bb_lower_idr:,.0f} - Rp {bb_upper_idr:,.0f}).")
-
-    # 5. ADX (Kekuatan Tren)
-    if adx_value > 25:
-        if abs(score) > 20: # Jika skor sudah menunjukkan arah jelas
-            score = int(max(0, min(100, (50 + score) * 1.1))) # Perkuat sinyal karena tren kuat
-            reasons.append(f"ADX menunjukkan tren sangat kuat (>{adx_value:.1f}). Sinyal dipertegas.")
-            confidence_points += 1 # Tren kuat meningkatkan kepercayaan
-        else:
-            reasons.append(f"ADX menunjukkan tren sedang ({adx_value:.1f}). Harap konfirmasi sinyal lain.")
-    else:
-        reasons.append(f"ADX menunjukkan tren lemah ({adx_value:.1f}). Sinyal bisa jadi tidak akurat.")
-        # Tidak menambah confidence_points karena tren lemah
-
-
-    # --- INOVASI: Logika berdasarkan ATR ---
-    # 6. ATR (Average True Range / Volatilitas)
-    if atr_value > 0:
-        prev_close_idr = convert_price_to_idr(prev['Close'], asset_is_gold, usd_idr_rate)
-        price_change_abs = abs(price_now - prev['Close'])
-        price_change_abs_idr = abs(price_now_idr - prev_close_idr)
-        if price_change_abs > atr_value:
-            reasons.append(f"Pergerakan harga (${price_change_abs:.2f} / Rp {price_change_abs_idr:,.0f}) MELEBIHI ATR (${atr_value:.2f} / Rp {atr_value_idr:.0f}), menunjukkan aktivitas tinggi.")
-        elif price_change_abs < atr_value * 0.5:
-            reasons.append(f"Pergerakan harga (${price_change_abs:.2f} / Rp {price_change_abs_idr:,.0f}) di bawah separuh ATR, menunjukkan konsolidasi.")
-        reasons.append(f"Level volatilitas saat ini (ATR 14d): ${atr_value:.2f} / Rp {atr_value_idr:.0f}. Ini penting untuk manajemen risiko (Stop-Loss).")
-
-
-    # Normalisasi Score 0-100 (akhir setelah semua modifikasi)
-    final_score = max(0, min(100, 50 + score))
-
-    # --- INOVASI: Hitung Tingkat Kepercayaan ---
-    # Misalnya, 0-2 poin = Rendah, 3-4 = Sedang, 5+ = Tinggi
-    if confidence_points >= 5:
-        confidence_level = 3 # Tinggi
-        confidence_text = "Tinggi"
-        confidence_style = "confidence-high"
-    elif confidence_points >= 3:
-        confidence_level = 2 # Sedang
-        confidence_text = "Sedang"
-        confidence_style = "confidence-medium"
-    else:
-        confidence_level = 1 # Rendah
-        confidence_text = "Rendah"
-        confidence_style = "confidence-low"
+# --- UI VISUALIZATION ---
+def main():
+    with telemetry.span('page'):
+        render_page()
+    if get_telemetry():
+        telemetry_panel()
 
-    return final_score, reasons, volatility_idr, atr_value_idr, confidence_level
 
+def render_page():
+    setup_page()
 
-# --- UI VISUALIZATION ---
-def main():
     # Header
     st.markdown("<h1 class='main-header'>🦅 GSS QUANTUM ANALYTICS v9</h1>", unsafe_allow_html=True)
     st.markdown("<p class='sub-header'>Gold Standard Society - Enhanced Analysis with Confidence</p>", unsafe_allow_html=True)
@@ -367,184 +552,35 @@ def main():
     st.sidebar.header("🎛️ Kontrol Panel")
     selected_asset_name = st.sidebar.selectbox("Pilih Aset:", list(ASSETS.keys()))
     asset_info = ASSETS[selected_asset_name]
+    ticker, is_gold = asset_info['ticker'], asset_info["is_gold"]
+    get_prefetcher().touch(ticker)
 
     st.sidebar.markdown("---")
 
     # Process Data
     with st.spinner("Menghubungkan ke satelit data global..."):
-        usd_idr = get_exchange_rate()
+        exchange_rate = get_exchange_rate()
+        usd_idr = exchange_rate.value
         st.sidebar.metric("Kurs USD/IDR Hari Ini", f"Rp {usd_idr:,.0f}")
-        df = get_market_data(asset_info['ticker'])
+        st.sidebar.caption(f"Kurs: {exchange_rate.describe()}")
+        # Harga historis dikonversi dengan kurs pada tanggalnya; tanpa riwayat kurs, kurs hari ini
+        fx_history = get_usd_idr_history()
+        usd_idr_hist = fx_history.value if fx_history is not None and not fx_history.value.empty else usd_idr
+        with telemetry.span('market_data', ticker=ticker):
+            market_data = get_market_data(ticker)
+        df = market_data.value if market_data is not None else None
+        if market_data is not None:
+            st.sidebar.caption(f"Data pasar: {market_data.describe()}")
 
     if df is not None and not df.empty:
-        last_close_usd = df['Close'].iloc[-1]
-        prev_close_usd = df['Close'].iloc[-2]
-        change_pct = ((last_close_usd - prev_close_usd) / prev_close_usd) * 100
-
-        # --- KONVERSI HARGA GLOBAL UNTUK UI ---
-        last_close_idr = convert_price_to_idr(last_close_usd, asset_info["is_gold"], usd_idr)
-        prev_close_idr = convert_price_to_idr(prev_close_usd, asset_info["is_gold"], usd_idr)
-        change_idr = last_close_idr - prev_close_idr
-
-        # --- TAMPILAN HARGA DUAL VERSION (IDR di depan untuk kejelasan) ---
-        st.markdown("### 💰 Harga Terkini (Real-Time - USD & IDR)")
-        c1, c2, c3 = st.columns([1.5, 1.5, 2])
-
-        with c1:
-            st.markdown(f"<div class='price-box'><div class='small-font'>Harga Rupiah (Estimasi)</div><div class='big-font' style='color:#00ff00'>Rp {last_close_idr:,.0f}</div><div class='small-font'>/ unit</div></div>", unsafe_allow_html=True)
-
-        with c2:
-            st.markdown(f"<div class='price-box'><div class='small-font'>Harga Global (USD)</div><div class='big-font' style='color:#FFD700'>${last_close_usd:.2f}</div><div class='small-font'>/ unit</div></div>", unsafe_allow_html=True)
-
-        with c3:
-            color = "green" if change_pct >= 0 else "red"
-            color_idr = "green" if change_idr >= 0 else "red"
-            st.markdown(f"<div class='price-box'><div class='small-font'>Perubahan 24 Jam</div><div class='big-font' style='color:{color}'>{change_pct:+.2f}%</div><div class='small-font' style='color:{color_idr}'>Rp {change_idr:,.0f}</div></div>", unsafe_allow_html=True)
-
+        price_panel(df, is_gold, usd_idr_hist)
         st.markdown("---")
-
-        # 2. ANALISIS QUANTUM SCORE, VOLATILITAS, ATR, dan CONFIDENCE LEVEL
-        score, reasons, volatility_idr, atr_idr, confidence_level = analyze_signal(df, asset_info["is_gold"], usd_idr)
-
-        st.markdown("### 🔮 Quantum Signal & Risk Analysis")
-        cols_sig1, cols_sig2, cols_risk = st.columns([1, 2, 1])
-
-        with cols_sig1:
-            fig_gauge = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=score,
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "Kekuatan Sinyal"},
-                gauge={
-                    'axis': {'range': [0, 100]},
-                    'bar': {'color': "white"},
-                    'steps': [
-                        {'range': [0, 40], 'color': "#ff4b4b"},
-                        {'range': [40, 60], 'color': "#ffff00"},
-                        {'range': [60, 100], 'color': "#00ff00"}],
-                }
-            ))
-            fig_gauge.update_layout(height=300, margin=dict(l=20, r=20, t=30, b=20), paper_bgcolor="#0e1117")
-            st.plotly_chart(fig_gauge, use_container_width=True)
-
-        with cols_sig2:
-            if score >= 75:
-                st.markdown(f"<div class='signal-box buy-signal'>STRONG BUY 🚀<br><span style='font-size:1rem'>Momentum Sangat Kuat</span></div>", unsafe_allow_html=True)
-            elif score >= 55:
-                st.markdown(f"<div class='signal-box buy-signal' style='background-color:#003300'>BUY (ACCUMULATE) 🛒<br><span style='font-size:1rem'>Mulai Cicil Masuk</span></div>", unsafe_allow_html=True)
-            elif score <= 25:
-                st.markdown(f"<div class='signal-box sell-signal'>STRONG SELL 🛑<br><span style='font-size:1rem'>Pasar Sedang Jatuh</span></div>", unsafe_allow_html=True)
-            else:
-                st.markdown(f"<div class='signal-box neutral-signal'>NEUTRAL / WAIT ✋<br><span style='font-size:1rem'>Tunggu Konfirmasi</span></div>", unsafe_allow_html=True)
-
-            # --- INOVASI: Tampilkan Tingkat Kepercayaan ---
-            if confidence_level == 3:
-                conf_text = "Tingkat Kepercayaan: Sangat Tinggi (✅✅✅)"
-            elif confidence_level == 2:
-                conf_text = "Tingkat Kepercayaan: Sedang (✅✅)"
-            else:
-                conf_text = "Tingkat Kepercayaan: Rendah (✅)"
-
-            st.markdown(f"<div class='confidence-box {'' if confidence_level == 3 else ('' if confidence_level == 2 else '')}'>{conf_text}</div>", unsafe_allow_html=True)
-
-            st.write(" ")
-            st.caption("🔍 **Alasan Logis (Berdasarkan Data Live - USD & IDR):**")
-            for reason in reasons:
-                 hl_class = ""
-                 if "Oversold" in reason or "bounce" in reason.lower():
-                     hl_class = "hl-oversold"
-                 elif "Overbought" in reason or "koreksi" in reason.lower() or "menembus band atas" in reason.lower():
-                     hl_class = "hl-overbought"
-                 elif "tren sangat kuat" in reason.lower():
-                     hl_class = "hl-strong-trend"
-                 elif "ATR" in reason:
-                     hl_class = "hl-volatility-info"
-                 # --- Gunakan st.markdown dengan kelas CSS ---
-                 st.markdown(f"<p class='signal-reason'>• <span class='{hl_class}'>{reason}</span></p>", unsafe_allow_html=True)
-
-
-        with cols_risk:
-             # --- Informasi Risiko & ATR (dengan nilai IDR) ---
-             risk_level_str = "N/A"
-             risk_style = "risk-medium"
-             volatility_raw = df['VOLATILITY_30D'].iloc[-1] if pd.notna(df['VOLATILITY_30D'].iloc[-1]) else 0.0
-             if volatility_raw != 0:
-                 if volatility_raw < (last_close_usd * 0.02):
-                     risk_level_str = "Rendah"
-                     risk_style = "risk-low"
-                 elif volatility_raw < (last_close_usd * 0.05):
-                     risk_level_str = "Sedang"
-                     risk_style = "risk-medium"
-                 else:
-                     risk_level_str = "Tinggi"
-                     risk_style = "risk-high"
-
-             st.markdown(f"<div class='info-card'><h4>📊 Risiko (Volatilitas 30D)</h4><p class='medium-font'>{risk_level_str}</p><p class='small-font'>Std Dev: ${volatility_raw:.2f} / Rp {volatility_idr:,.0f}</p></div>", unsafe_allow_html=True)
-             
-             adx_val = df['ADX'].iloc[-1] if pd.notna(df['ADX'].iloc[-1]) else 0.0
-             adx_status = "Lemah" if adx_val < 25 else ("Sedang" if adx_val < 50 else "Kuat")
-             st.markdown(f"<div class='info-card'><h4>🧭 Kekuatan Tren (ADX)</h4><p class='medium-font'>{adx_val:.1f}</p><p class='small-font'>{adx_status} ({'<25' if adx_val < 25 else ('25-50' if adx_val < 50 else '>50')})</p></div>", unsafe_allow_html=True)
-
-             # --- INOVASI: Tampilkan ATR ---
-             atr_raw = df['ATR'].iloc[-1] if pd.notna(df['ATR'].iloc[-1]) else 0.0
-             if atr_raw > 0:
-                 st.markdown(f"<div class='info-card'><h4>🌪️ Volatilitas (ATR 14D)</h4><p class='medium-font'>${atr_raw:.2f} / Rp {atr_idr:,.0f}</p><p class='small-font'>Rentang rata-rata pergerakan.</p></div>", unsafe_allow_html=True)
-             else:
-                 st.markdown(f"<div class='info-card'><h4>🌪️ Volatilitas (ATR 14D)</h4><p class='medium-font'>N/A</p><p class='small-font'>Data tidak tersedia.</p></div>", unsafe_allow_html=True)
-
-
-        # 3. CHART UTAMA (tetap dalam USD)
-        st.markdown("### 📉 Grafik Teknikal Lanjutan (USD)")
-        fig = go.Figure()
-        fig.add_trace(go.Candlestick(x=df.index, open=df['Open'], high=df['High'], low=df['Low'], close=df['Close'], name='Price (USD)', opacity=0.8))
-        fig.add_trace(go.Scatter(x=df.index, y=df['EMA_50'], line=dict(color='orange', width=1.5), name='EMA 50 (USD)', visible='legendonly'))
-        fig.add_trace(go.Scatter(x=df.index, y=df['EMA_200'], line=dict(color='blue', width=2), name='EMA 200 (USD)', visible='legendonly'))
-        fig.add_trace(go.Scatter(x=df.index, y=df['BB_UPPER'], line=dict(color='rgba(255, 0, 0, 0.3)', width=1), name='BB Upper (USD)', fill=None, visible='legendonly'))
-        fig.add_trace(go.Scatter(x=df.index, y=df['BB_LOWER'], line=dict(color='rgba(0, 255, 0, 0.3)', width=1), name='BB Lower (USD)', fill='tonexty', visible='legendonly'))
-
-        fig.update_layout(
-            xaxis_rangeslider_visible=False,
-            height=600,
-            template="plotly_dark",
-            title=f"Pergerakan Global {selected_asset_name} (Basis USD)",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-        # --- INOVASI: Tabel Data Terbaru (FIXED - Kolom Unik) ---
-        st.markdown("### 🧮 Data Terbaru (USD & Estimasi IDR)")
-        latest_data_usd = df[['Close', 'EMA_20', 'EMA_50', 'EMA_200', 'RSI', 'MACD', 'BB_UPPER', 'BB_LOWER', 'ADX', 'ATR']].tail(1).round(2)
-        latest_data_usd.index = [latest_data_usd.index[-1].strftime('%Y-%m-%d')]
-
-        # Buat DataFrame estimasi IDR dengan nama kolom yang unik
-        idr_cols = {}
-        # Kolom yang perlu dikonversi ke IDR
-        for col in ['Close', 'EMA_20', 'EMA_50', 'EMA_200', 'BB_UPPER', 'BB_LOWER', 'ATR']:
-            if col in latest_data_usd.columns:
-                original_val = latest_data_usd[col].iloc[0]
-                converted_val = convert_price_to_idr(original_val, asset_info["is_gold"], usd_idr)
-                idr_cols[f"{col}_Rp"] = converted_val # Simpan sebagai float untuk formatting nanti
-        # Kolom yang nilainya tetap (RSI, MACD, ADX), tambahkan akhiran _Rp untuk membedakan
-        for col in ['RSI', 'MACD', 'ADX']:
-             if col in latest_data_usd.columns:
-                idr_cols[f"{col}_Rp"] = latest_data_usd[col].iloc[0]
-
-        latest_data_idr_df = pd.DataFrame([idr_cols], index=latest_data_usd.index)
-
-        # Gabungkan USD dan Estimasi IDR
-        latest_data_combined = pd.concat([latest_data_usd.add_suffix('_Usd'), latest_data_idr_df], axis=1)
-        # Format ulang kolom Rupiah untuk tampilan (dengan koma)
-        cols_to_format = [col for col in latest_data_combined.columns if col.endswith('_Rp')]
-        for col in cols_to_format:
-            if pd.api.types.is_numeric_dtype(latest_data_combined[col]):
-                 if col.startswith('RSI') or col.startswith('MACD') or col.startswith('ADX'):
-                     # Format sebagai angka desimal untuk RSI, MACD, ADX
-                     latest_data_combined[col] = latest_data_combined[col].round(2)
-                 else:
-                     # Format sebagai Rupiah untuk harga
-                     latest_data_combined[col] = latest_data_combined[col].apply(lambda x: f"Rp {x:,.0f}")
-
-        st.dataframe(latest_data_combined, use_container_width=True)
+        signal_panel(ticker, df, is_gold, usd_idr_hist)
+        chart_panel(ticker, selected_asset_name, df)
+        score_panel(ticker, df, is_gold, usd_idr_hist)
+        table_panel(ticker, df, is_gold, usd_idr_hist)
+        timeframe_panel(ticker, is_gold, usd_idr_hist)
+        risk_section(asset_info, usd_idr, usd_idr_hist)
 
         # --- INOVASI: Penjelasan Tingkat Kepercayaan ---
         st.markdown("### ℹ️ Panduan Tingkat Kepercayaan")
@@ -558,6 +594,5 @@ def main():
     else:
         st.error("Gagal mengambil data atau data kosong. Silakan refresh halaman atau pilih aset lain.")
 
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,43 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant.indicators import add_indicators
+from gss_quant.synthetic import synthetic_ohlcv
+
+NAN = np.nan
+
+
+@pytest.fixture(scope="session")
+def enriched():
+    """700 bar OHLCV sintetis + indikator, termasuk bar warm-up (NaN) di awal."""
+    return add_indicators(synthetic_ohlcv(700, seed=7))
+
+
+@pytest.fixture(scope="session")
+def edge_frame():
+    """Kombinasi nilai indikator di sekitar setiap ambang aturan skor (Close = 100).
+
+    Mencakup NaN, nilai tepat di ambang (RSI 30/50/70, ADX 25, harga = EMA 200,
+    MACD = sinyal) dan skor besar yang dipertegas ADX lalu di-clip.
+    """
+    grid = itertools.product(
+        [NAN, 90.0, 100.0, 110.0],                                   # EMA_200
+        [NAN, 95.0, 105.0],                                          # EMA_50
+        [NAN, 20.0, 30.0, 50.0, 60.0, 70.0, 80.0],                   # RSI
+        [(NAN, NAN), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)],            # MACD, MACD_SIGNAL
+        [(NAN, NAN), (99.0, 90.0), (110.0, 101.0), (110.0, 90.0)],   # BB_UPPER, BB_LOWER
+        [NAN, 25.0, 25.5, 60.0],                                     # ADX
+    )
+    rows = [
+        {'EMA_200': ema200, 'EMA_50': ema50, 'RSI': rsi, 'MACD': macd, 'MACD_SIGNAL': signal,
+         'BB_UPPER': upper, 'BB_LOWER': lower, 'ADX': adx}
+        for ema200, ema50, rsi, (macd, signal), (upper, lower), adx in grid
+    ]
+    df = pd.DataFrame(rows, index=pd.date_range("2020-01-01", periods=len(rows), freq="D", name="Date"))
+    df['Close'] = 100.0
+    df['ATR'] = 2.0
+    df['VOLATILITY_30D'] = 3.0
+    return df
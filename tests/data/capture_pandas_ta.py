@@ -0,0 +1,43 @@
+"""Tangkap nilai acuan indikator dari pandas_ta untuk `tests/test_kernels.py` (dijalankan sekali, manual).
+
+    python tests/data/capture_pandas_ta.py
+
+Memerlukan pandas_ta 0.4 (Python >= 3.12). Panggilannya sama dengan
+dashboard versi awal; Bollinger Bands diambil menurut nama kolom (pandas_ta
+mengembalikan BBL, BBM, BBU).
+"""
+from pathlib import Path
+
+import pandas_ta as ta
+
+from gss_quant.synthetic import synthetic_ohlcv
+
+N_BARS = 300
+SEED = 5
+OUTPUT = Path(__file__).with_name("pandas_ta_reference.csv")
+
+
+def main():
+    df = synthetic_ohlcv(N_BARS, seed=SEED)[['High', 'Low', 'Close']]
+    macd = ta.macd(df['Close'], fast=12, slow=26, signal=9)
+    bb = ta.bbands(df['Close'], length=20, std=2)
+    out = df.assign(
+        EMA_20=ta.ema(df['Close'], length=20),
+        EMA_50=ta.ema(df['Close'], length=50),
+        EMA_200=ta.ema(df['Close'], length=200),
+        RSI=ta.rsi(df['Close'], length=14),
+        MACD=macd['MACD_12_26_9'],
+        MACD_SIGNAL=macd['MACDs_12_26_9'],
+        BB_UPPER=bb['BBU_20_2.0_2.0'],
+        BB_MIDDLE=bb['BBM_20_2.0_2.0'],
+        BB_LOWER=bb['BBL_20_2.0_2.0'],
+        ADX=ta.adx(df['High'], df['Low'], df['Close'], length=14)['ADX_14'],
+        VOLATILITY_30D=df['Close'].rolling(window=30).std(),
+        ATR=ta.atr(df['High'], df['Low'], df['Close'], length=14),
+    )
+    out.to_csv(OUTPUT, float_format='%.17g')
+    print(f"pandas_ta {ta.version}: {len(out)} bar -> {OUTPUT}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from gss_quant.alerts import (
+    CONFIDENCE_CHANGE, SIGNAL_CHANGE, AlertDaemon, AlertSink, FileSink, StdoutSink, WebhookSink, build_sink,
+    detect_alerts,
+)
+from gss_quant.signal_db import SignalDatabase
+
+BAR = '2024-05-02T00:00:00'
+
+
+def _row(signal='BUY', score=70, confidence=2, bar_time=BAR, ticker='AAA', **extra):
+    return {'ticker': ticker, 'bar_time': bar_time, 'last_bar': bar_time, 'signal': signal, 'score': score,
+            'confidence': confidence, 'risk': 'Sedang', 'reasons': ['alasan'], **extra}
+
+
+class ScriptedDaemon(AlertDaemon):
+    """Daemon tanpa store/provider: setiap siklus memakai hasil scan berikutnya dari `script`."""
+
+    def __init__(self, db, script, sinks=()):
+        super().__init__(None, db, sorted({r['ticker'] for cycle in script for r in cycle}), sinks=sinks, workers=1)
+        self.script = iter(script)
+
+    def _usd_idr(self):
+        return 16000.0
+
+    def _due(self, known):
+        return self.tickers
+
+    def scan(self, tickers, usd_idr_rate, deadline):
+        return list(next(self.script)), {}
+
+
+class FailingSink(AlertSink):
+    name = "failing"
+
+    def __init__(self):
+        self.fail = True
+        self.received = []
+
+    def send(self, alerts):
+        if self.fail:
+            raise ConnectionError("sink mati")
+        self.received.extend(alerts)
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SignalDatabase(tmp_path / "signals.db")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def daemon(db):
+    """Pembuat `ScriptedDaemon` di atas `db`; pool dan koneksinya ditutup setelah tes."""
+    made = []
+
+    def make(script, sinks=()):
+        made.append(ScriptedDaemon(db, script, sinks))
+        return made[-1]
+
+    yield make
+    for d in made:
+        d.close()
+
+
+# --- detect_alerts ---
+
+def test_no_alert_without_history_or_change():
+    assert detect_alerts(None, _row()) == []
+    assert detect_alerts(_row(scanned_at='t0'), _row(score=75)) == []
+
+
+def test_signal_and_confidence_changes():
+    previous = _row('NEUTRAL', 50, 1, scanned_at='t0')
+    alerts = detect_alerts(previous, _row('BUY', 70, 3))
+
+    assert [(a['kind'], a['previous'], a['current']) for a in alerts] == [
+        (SIGNAL_CHANGE, 'NEUTRAL', 'BUY'), (CONFIDENCE_CHANGE, '1', '3'),
+    ]
+    assert all(a['previous_scan'] == 't0' and a['bar_time'] == BAR for a in alerts)
+    assert "NEUTRAL -> BUY" in alerts[0]['message'] and "Rendah -> Tinggi" in alerts[1]['message']
+
+
+# --- SignalDatabase ---
+
+def test_record_cycle_is_idempotent(db):
+    alerts = detect_alerts(_row('NEUTRAL', scanned_at='t0'), _row('BUY'))
+
+    assert db.record_cycle([_row('BUY')], alerts) == 1
+    assert db.record_cycle([_row('BUY')], alerts) == 0
+    assert len(db.history('AAA')) == 1
+    assert len(db.pending_alerts()) == 1
+    assert db.latest_signals()['AAA']['signal'] == 'BUY'
+
+
+def test_repeated_transition_within_forming_bar_alerts_each_time(db, daemon):
+    script = [[_row(s)] for s in ('BUY', 'NEUTRAL', 'BUY', 'BUY')]
+    scanner = daemon(script)
+    new_alerts = [scanner.run_cycle()['new_alerts'] for _ in script]
+
+    assert new_alerts == [0, 1, 1, 0]
+    assert [(a['previous'], a['current']) for a in db.pending_alerts()] == [('BUY', 'NEUTRAL'), ('NEUTRAL', 'BUY')]
+    assert len(db.history('AAA')) == 1
+
+
+def test_concurrent_scans_of_same_state_record_one_alert(db):
+    db.record_cycle([_row('NEUTRAL')], [])
+    known = db.latest_signals()['AAA']
+
+    for _ in range(2):
+        db.record_cycle([_row('BUY')], detect_alerts(known, _row('BUY')))
+    assert len(db.pending_alerts()) == 1
+
+
+# --- Pengiriman ---
+
+def test_failed_delivery_stays_pending_until_sink_recovers(db, daemon):
+    sink = FailingSink()
+    scanner = daemon([[_row('NEUTRAL')], [_row('BUY')], [_row('BUY')]], sinks=[sink])
+    scanner.run_cycle()
+    assert scanner.run_cycle()['delivered'] == 0
+    assert len(db.pending_alerts()) == 1
+
+    sink.fail = False
+    assert scanner.run_cycle()['delivered'] == 1
+
+    assert db.pending_alerts() == []
+    assert [a['current'] for a in sink.received] == ['BUY']
+    assert set(sink.received[0]) == {'ticker', 'bar_time', 'kind', 'previous', 'current', 'message'}
+
+
+def test_one_failing_sink_holds_back_delivery(db, daemon):
+    good, bad = FailingSink(), FailingSink()
+    good.fail = False
+    scanner = daemon([[_row('NEUTRAL')], [_row('BUY')]], sinks=[good, bad])
+    scanner.run_cycle()
+    assert scanner.run_cycle()['delivered'] == 0
+    assert len(db.pending_alerts()) == 1
+
+
+# --- Sink ---
+
+ALERT = {'ticker': 'AAA', 'bar_time': BAR, 'kind': SIGNAL_CHANGE, 'previous': 'NEUTRAL', 'current': 'BUY',
+         'message': 'AAA: sinyal NEUTRAL -> BUY'}
+
+
+def test_stdout_and_file_sinks(tmp_path):
+    stream = io.StringIO()
+    StdoutSink(stream).send([ALERT])
+    assert stream.getvalue() == f"[{BAR}] AAA: sinyal NEUTRAL -> BUY\n"
+
+    path = tmp_path / "out" / "alerts.jsonl"
+    FileSink(path).send([ALERT])
+    FileSink(path).send([ALERT])
+    assert [json.loads(line) for line in path.read_text().splitlines()] == [ALERT, ALERT]
+
+
+def test_webhook_sink_posts_json():
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append(json.loads(self.rfile.read(int(self.headers['Content-Length']))))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        WebhookSink(f"http://127.0.0.1:{server.server_port}/hook").send([ALERT])
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert received == [{'alerts': [ALERT]}]
+
+
+def test_build_sink():
+    assert isinstance(build_sink('stdout'), StdoutSink)
+    assert build_sink('file:/tmp/x.jsonl').path.name == 'x.jsonl'
+    assert build_sink('https://example.invalid/hook').url == 'https://example.invalid/hook'
+    with pytest.raises(ValueError):
+        build_sink('smtp://x')
@@ -0,0 +1,166 @@
+import asyncio
+import json
+
+import pytest
+
+from gss_quant.analysis import signal_snapshot
+from gss_quant.api import MAX_BATCH, MAX_HEADER_BYTES, SignalServer, SnapshotBook
+
+
+@pytest.fixture(scope="module")
+def snapshots(enriched):
+    return [
+        signal_snapshot(enriched.iloc[:n], ticker, 16000.0, history_bars=50)
+        for ticker, n in (('AAA', 700), ('BBB', 650), ('CCC', 600))
+    ]
+
+
+@pytest.fixture
+def server(snapshots):
+    book = SnapshotBook()
+    book.publish(snapshots)
+    return SignalServer(book)
+
+
+def _json(body):
+    return json.loads(body.decode('utf-8'))
+
+
+# --- Snapshot ---
+
+def test_not_ready_before_first_publish():
+    server = SignalServer(SnapshotBook())
+
+    assert server.route('/signal/AAA')[0] == 503
+    assert server.route('/history/AAA')[0] == 503
+    status, _, body, _ = server.route('/health')
+    assert (status, _json(body)) == (200, {'tickers': 0, 'updated_at': None})
+    assert _json(server.route('/screener')[2])['signals'] == []
+
+
+def test_publish_counts_only_changed_tickers(snapshots):
+    book = SnapshotBook()
+    assert book.publish(snapshots) == 3
+    state = book.state
+    assert book.publish(snapshots) == 0
+    assert book.state is state
+
+    changed = {**snapshots[0], 'score': snapshots[0]['score'] + 1}
+    assert book.publish([changed]) == 1
+    assert book.state.signals['BBB'] is state.signals['BBB']
+
+
+def test_screener_ranked_by_score(server, snapshots):
+    body = _json(server.route('/screener')[2])
+    expected = sorted(snapshots, key=lambda s: (-s['score'], s['ticker']))
+    assert [row['ticker'] for row in body['signals']] == [s['ticker'] for s in expected]
+    assert 'history' not in body['signals'][0] and 'reasons' not in body['signals'][0]
+
+
+# --- Rute ---
+
+def test_signal_etag_and_conditional_get(server):
+    status, body, etag = server.respond('GET', '/signal/AAA')
+    assert status == 200 and _json(body)['ticker'] == 'AAA' and 'history' not in _json(body)
+
+    for header in (etag, f'W/{etag}', f'"other", {etag}', '*'):
+        assert server.respond('GET', '/signal/AAA', header)[:2] == (304, b'')
+    assert server.respond('GET', '/signal/AAA', '"other"')[0] == 200
+    assert server.respond('POST', '/signal/AAA')[0] == 405
+
+
+def test_unknown_ticker_and_route(server):
+    assert server.route('/signal/ZZZ')[0] == 404
+    assert server.route('/history/ZZZ')[0] == 404
+    assert server.route('/nope')[0] == 404
+
+
+def test_batch_reports_missing_and_dedupes(server):
+    status, _, body, etag = server.route('/signal?tickers=AAA,zzz,aaa,%20BBB%20')
+    payload = _json(body)
+
+    assert status == 200
+    assert [s['ticker'] for s in payload['signals']] == ['AAA', 'BBB']
+    assert payload['missing'] == ['zzz']
+    assert etag != server.route('/signal?tickers=AAA,BBB')[3]
+    assert server.route('/signal')[0] == 400
+    tickers = ','.join(f'T{i}' for i in range(MAX_BATCH + 1))
+    assert server.route(f'/signal?tickers={tickers}')[0] == 400
+
+
+def test_history_limit_and_canonical_ticker(server, snapshots):
+    status, _, body, etag = server.route('/history/aaa?limit=5')
+    payload = _json(body)
+
+    assert status == 200 and payload['ticker'] == 'AAA'
+    assert payload['history'] == snapshots[0]['history'][:5]
+    assert payload['history'][0]['bar_time'] > payload['history'][-1]['bar_time']
+    assert etag != server.route('/history/AAA?limit=6')[3]
+    assert etag == server.route('/history/AAA?limit=5')[3]
+    assert len(_json(server.route('/history/AAA?limit=0')[2])['history']) == 1
+    assert len(_json(server.route('/history/AAA')[2])['history']) == 50
+    assert server.route('/history/AAA?limit=abc')[0] == 400
+
+
+# --- HTTP ---
+
+def _exchange(server, payload):
+    """Kirim byte mentah ke `server._handle` lewat socket lokal; kembalikan semua byte balasan."""
+    async def run():
+        listener = await asyncio.start_server(server._handle, '127.0.0.1', 0, limit=MAX_HEADER_BYTES)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(payload)
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+            return data
+
+    return asyncio.run(run())
+
+
+def _responses(data, head_only=()):
+    """Daftar (status, headers, body) dari aliran respons HTTP/1.1; respons ke-i di `head_only` tanpa body (HEAD)."""
+    out = []
+    while data:
+        head, _, rest = data.partition(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        headers = dict(line.split(': ', 1) for line in lines[1:])
+        length = 0 if len(out) in head_only else int(headers['Content-Length'])
+        body, data = rest[:length], rest[length:]
+        out.append((int(lines[0].split(' ')[1]), headers, body))
+    return out
+
+
+def test_pipelined_requests_on_one_connection(server):
+    etag = server.respond('GET', '/signal/AAA')[2]
+    data = _exchange(server, (
+        b'GET /signal/AAA HTTP/1.1\r\nHost: x\r\n\r\n'
+        b'GET /signal/AAA HTTP/1.1\r\nIf-None-Match: ' + etag.encode() + b'\r\n\r\n'
+        b'HEAD /screener HTTP/1.1\r\n\r\n'
+        b'GET /health HTTP/1.1\r\nConnection: close\r\n\r\n'
+    ))
+    full, not_modified, head, health = _responses(data, head_only={2})
+
+    assert (full[0], full[1]['ETag'], full[1]['Connection']) == (200, etag, 'keep-alive')
+    assert (not_modified[0], not_modified[2]) == (304, b'')
+    assert (head[0], head[2]) == (200, b'')
+    assert int(head[1]['Content-Length']) == len(server.route('/screener')[2])
+    assert (health[0], health[1]['Connection'], _json(health[2])['tickers']) == (200, 'close', 3)
+
+
+def test_http10_closes_without_keep_alive(server):
+    (status, headers, _), = _responses(_exchange(server, b'GET /health HTTP/1.0\r\n\r\n'))
+    assert (status, headers['Connection']) == (200, 'close')
+
+
+def test_oversized_headers_get_431(server):
+    payload = b'GET /health HTTP/1.1\r\nX-Big: ' + b'a' * (MAX_HEADER_BYTES + 10) + b'\r\n\r\n'
+    (status, headers, _), = _responses(_exchange(server, payload))
+    assert (status, headers['Connection']) == (431, 'close')
+
+
+def test_malformed_request_line_gets_400(server):
+    (status, _, _), = _responses(_exchange(server, b'NONSENSE\r\n\r\n'))
+    assert status == 400
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant import backtest
+from gss_quant.backtest import grid_params, run_backtest, run_sweep, signal_positions
+from gss_quant.synthetic import synthetic_universe
+
+# Skor BUY di bar 1, STRONG SELL di bar 3, BUY lagi di bar 5 (posisi terakhir masih terbuka)
+SCORES = np.array([50, 60, 50, 20, 50, 80, 50])
+CLOSE = [100.0, 100.0, 110.0, 121.0, 90.0, 100.0, 120.0]
+
+
+@pytest.fixture
+def scripted(monkeypatch):
+    monkeypatch.setattr(backtest, 'quantum_score', lambda df, params: (SCORES, np.ones_like(SCORES)))
+    index = pd.date_range("2024-01-01", periods=len(CLOSE), freq="D", name="Date")
+    return pd.DataFrame({'Close': CLOSE}, index=index)
+
+
+def test_signal_positions_hold_until_strong_sell():
+    assert signal_positions(SCORES).tolist() == [0, 1, 1, 0, 0, 1, 1]
+
+
+def test_known_trades_and_pnl(scripted):
+    result = run_backtest(scripted, 16000.0)
+    trades = result.trades
+
+    assert trades['entry_time'].tolist() == [scripted.index[1], scripted.index[5]]
+    assert trades['exit_time'].tolist() == [scripted.index[3], scripted.index[6]]
+    assert trades['open'].tolist() == [False, True]
+    np.testing.assert_allclose(trades['return_pct'], [21.0, 20.0])
+    # Trade kedua memakai seluruh modal setelah trade pertama (12.100 USD)
+    np.testing.assert_allclose(trades['pnl_usd'], [2100.0, 2420.0])
+    np.testing.assert_allclose(trades['pnl_idr'], [2100.0 * 16000, 2420.0 * 16000])
+    np.testing.assert_allclose(result.equity, [10000, 10000, 11000, 12100, 12100, 12100, 14520])
+
+    summary = result.summary
+    assert summary['trades'] == 2 and summary['hit_rate'] == 1.0
+    assert summary['pnl_usd'] == pytest.approx(4520.0)
+    assert summary['pnl_idr'] == pytest.approx(4520.0 * 16000)
+    assert summary['total_return_pct'] == pytest.approx(45.2)
+    assert summary['max_drawdown_pct'] == 0.0
+    assert summary['exposure_pct'] == pytest.approx(300 / 7)
+
+
+def test_fees_and_historical_rate(scripted):
+    rate = pd.Series(np.arange(15000.0, 15000.0 + 7 * 100, 100), index=scripted.index)
+    result = run_backtest(scripted, rate, fee_bps=10)
+    fee = 0.001
+
+    # Trade tertutup membayar biaya masuk dan keluar, trade terbuka baru biaya masuk
+    first = 1.21 * (1 - fee) ** 2 - 1
+    second = 1.2 * (1 - fee) - 1
+    np.testing.assert_allclose(result.trades['return_pct'], [first * 100, second * 100])
+    np.testing.assert_allclose(result.trades['pnl_idr'], result.trades['pnl_usd'] * [15300.0, 15600.0])
+    assert result.equity.iloc[-1] == pytest.approx(10000 * (1 + first) * (1 + second))
+    expected_idr = np.sum(np.diff(np.r_[10000.0, result.equity.to_numpy()]) * rate.to_numpy())
+    assert result.summary['pnl_idr'] == pytest.approx(expected_idr)
+
+
+def test_sweep_independent_of_worker_count():
+    frames = synthetic_universe(2, 500, seed=4)
+    space = {'ema_mid': [20, 50], 'rsi_length': [9, 14], 'buy': [50, 55, 60]}
+    param_sets = grid_params(space)
+
+    serial = run_sweep(frames, param_sets, 16000.0, max_workers=1)
+    parallel = run_sweep(frames, param_sets, 16000.0, max_workers=3)
+
+    assert len(serial) == 2 * len(param_sets)
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert serial['pnl_usd'].is_monotonic_decreasing
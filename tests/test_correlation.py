@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant.correlation import RollingCorrelation, aligned_returns, cluster_order, rolling_pair
+
+WINDOW = 60
+MIN_PERIODS = 20
+
+
+@pytest.fixture(scope="module")
+def returns():
+    """Return harian 4 aset berkorelasi; A dan B tanpa akhir pekan, C dengan bar hilang."""
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2023-01-01", periods=400, freq="D")
+    cov = np.full((4, 4), 5e-5) + np.eye(4) * 1e-4
+    df = pd.DataFrame(rng.multivariate_normal(np.zeros(4), cov, size=400), index=index, columns=list("ABCD"))
+    df.loc[df.index.dayofweek >= 5, ['A', 'B']] = np.nan
+    df.iloc[::7, 2] = np.nan
+    return df
+
+
+def _assert_matches_pandas(state, returns):
+    tail = returns.tail(WINDOW)
+    np.testing.assert_allclose(state.correlation(), tail.corr(min_periods=MIN_PERIODS), rtol=0, atol=1e-14)
+    np.testing.assert_allclose(state.covariance(), tail.cov(min_periods=MIN_PERIODS), rtol=0, atol=1e-14)
+
+
+def test_incremental_sync_matches_pandas(returns):
+    state = RollingCorrelation.from_returns(returns.iloc[:100], WINDOW, MIN_PERIODS)
+    _assert_matches_pandas(state, returns.iloc[:100])
+
+    # Satu bar per sync, lalu beberapa bar sekaligus; jendela berputar berkali-kali
+    for end in [*range(101, 250), *range(255, 401, 5)]:
+        state.sync(returns.iloc[:end])
+        _assert_matches_pandas(state, returns.iloc[:end])
+    assert state.last_timestamp == returns.index[-1]
+
+
+def test_beta_uses_shared_bars(returns):
+    state = RollingCorrelation.from_returns(returns, WINDOW, MIN_PERIODS)
+    tail = returns.tail(WINDOW)
+
+    for asset in tail.columns:
+        for benchmark in tail.columns.drop(asset):
+            shared = tail[[asset, benchmark]].dropna()
+            expected = shared[asset].cov(shared[benchmark]) / shared[benchmark].var()
+            assert state.beta().loc[asset, benchmark] == pytest.approx(expected, rel=1e-12)
+    np.testing.assert_allclose(np.diag(state.beta()), 1.0, rtol=1e-12)
+
+
+def test_revision_inside_window_rebuilds(returns):
+    state = RollingCorrelation.from_returns(returns.iloc[:300], WINDOW, MIN_PERIODS)
+    revised = returns.iloc[:310].copy()
+    revised.iloc[280, 3] *= -3.0              # bar lama yang masih di dalam jendela
+    revised.iloc[290, 0] = np.nan             # bar yang sebelumnya ada menjadi hilang
+
+    state.sync(revised)
+
+    _assert_matches_pandas(state, revised)
+
+
+def test_last_bar_revision_and_order_checks(returns):
+    state = RollingCorrelation.from_returns(returns.iloc[:200], WINDOW, MIN_PERIODS)
+    revised = returns.iloc[:200].copy()
+    revised.iloc[-1] = [0.01, -0.02, 0.03, np.nan]
+
+    state.update(revised.index[-1], revised.iloc[-1].to_numpy())
+    _assert_matches_pandas(state, revised)
+    state.sync(revised)
+    _assert_matches_pandas(state, revised)
+
+    with pytest.raises(ValueError):
+        state.update(revised.index[-2], revised.iloc[-2].to_numpy())
+    with pytest.raises(ValueError):
+        state.sync(revised[['B', 'A', 'C', 'D']])
+
+
+def test_min_periods_gate(returns):
+    state = RollingCorrelation.from_returns(returns.iloc[:30], WINDOW, MIN_PERIODS)
+    correlation = state.correlation()
+
+    # 30 baris: setiap pasangan (A/B hanya hari kerja, C dengan bar hilang) masih punya >= 20 bar bersama
+    assert correlation.notna().to_numpy().all()
+    assert RollingCorrelation.from_returns(returns.iloc[:15], WINDOW, MIN_PERIODS).correlation().isna().to_numpy().all()
+
+
+def test_rolling_pair_and_cluster_order(returns):
+    pair = rolling_pair(returns, 'A', 'B', WINDOW, MIN_PERIODS)
+    state = RollingCorrelation.from_returns(returns[['A', 'B']].dropna(), WINDOW, MIN_PERIODS)
+
+    assert pair['CORRELATION'].iloc[-1] == pytest.approx(state.correlation().loc['A', 'B'], rel=1e-12)
+    assert pair['BETA'].iloc[-1] == pytest.approx(state.beta().loc['A', 'B'], rel=1e-12)
+
+    correlation = pd.DataFrame([[1.0, 0.1, 0.9], [0.1, 1.0, 0.0], [0.9, 0.0, 1.0]],
+                               index=list("XYZ"), columns=list("XYZ"))
+    order = cluster_order(correlation)
+    assert sorted(order) == ['X', 'Y', 'Z'] and abs(order.index('X') - order.index('Z')) == 1
+
+
+def test_aligned_returns_uses_each_assets_own_bars():
+    weekdays = pd.date_range("2024-01-05", periods=4, freq="B", tz="America/New_York")
+    daily = pd.date_range("2024-01-05", periods=6, freq="D")
+    returns = aligned_returns({
+        'SPY': pd.Series([100.0, 101.0, 0.0, 102.0], index=weekdays),
+        'BTC': pd.Series(np.exp(np.arange(6.0)), index=daily),
+    })
+
+    # Return Senin SPY mencakup akhir pekan; harga tidak positif dibuang
+    assert returns.loc['2024-01-08', 'SPY'] == pytest.approx(np.log(101.0 / 100.0))
+    assert np.isnan(returns.loc['2024-01-09', 'SPY'])
+    assert returns.loc['2024-01-10', 'SPY'] == pytest.approx(np.log(102.0 / 101.0))
+    np.testing.assert_allclose(returns['BTC'].dropna(), 1.0)
+    assert np.isnan(returns.loc['2024-01-06', 'SPY'])
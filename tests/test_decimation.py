@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant.decimation import lttb_decimate, lttb_indices, ohlc_decimate, slice_range
+from gss_quant.synthetic import synthetic_ohlcv
+
+
+@pytest.fixture(scope="module")
+def ohlcv():
+    return synthetic_ohlcv(5_003, seed=9, freq="h")
+
+
+@pytest.mark.parametrize("max_bars", [7, 600, 2_500])
+def test_ohlc_buckets_keep_extremes(ohlcv, max_bars):
+    candles = ohlc_decimate(ohlcv, max_bars)
+
+    assert len(candles) == max_bars
+    assert candles.index[0] == ohlcv.index[0]
+    assert candles['Open'].iloc[0] == ohlcv['Open'].iloc[0]
+    assert candles['Close'].iloc[-1] == ohlcv['Close'].iloc[-1]
+    # Ember = bar sejak timestamp candle sampai sebelum candle berikutnya; semua bar tercakup tepat sekali
+    bounds = np.append(ohlcv.index.searchsorted(candles.index), len(ohlcv))
+    assert bounds[0] == 0 and (np.diff(bounds) > 0).all()
+    for i, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])):
+        bucket = ohlcv.iloc[lo:hi]
+        assert candles['Open'].iloc[i] == bucket['Open'].iloc[0]
+        assert candles['High'].iloc[i] == bucket['High'].max()
+        assert candles['Low'].iloc[i] == bucket['Low'].min()
+        assert candles['Close'].iloc[i] == bucket['Close'].iloc[-1]
+
+
+def test_short_history_is_not_decimated(ohlcv):
+    short = ohlcv.iloc[:250]
+    pd.testing.assert_frame_equal(ohlc_decimate(short, 600), short[['Open', 'High', 'Low', 'Close']])
+
+
+@pytest.mark.parametrize("max_points", [3, 100, 1_500])
+def test_lttb_keeps_endpoints_and_budget(ohlcv, max_points):
+    y = ohlcv['Close'].to_numpy()
+    x = np.arange(len(y), dtype=float)
+
+    idx = lttb_indices(x, y, max_points)
+
+    assert len(idx) == max_points
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    assert (np.diff(idx) > 0).all()
+
+
+def test_lttb_keeps_spike_and_skips_nan():
+    y = np.sin(np.linspace(0, 20, 2_000))
+    y[:50] = np.nan
+    y[1_234] = 50.0
+    y[-10:] = np.nan
+    x = np.arange(len(y), dtype=float)
+
+    idx = lttb_indices(x, y, 100)
+
+    assert len(idx) == 100
+    assert idx[0] == 50 and idx[-1] == len(y) - 11
+    assert 1_234 in idx
+    assert not np.isnan(y[idx]).any()
+
+
+def test_lttb_short_input_and_invalid_budget():
+    y = np.array([1.0, np.nan, 3.0, 2.0])
+    x = np.arange(4, dtype=float)
+    assert lttb_indices(x, y, 3).tolist() == [0, 2, 3]
+    with pytest.raises(ValueError):
+        lttb_indices(x, y, 2)
+
+
+def test_lttb_decimate_uses_time_index(ohlcv):
+    series = ohlcv['Close']
+    line = lttb_decimate(series, 500)
+
+    assert len(line) == 500
+    assert line.index[0] == series.index[0] and line.index[-1] == series.index[-1]
+    pd.testing.assert_series_equal(line, series.loc[line.index])
+
+
+def test_slice_range_accepts_naive_bounds_on_tz_index(ohlcv):
+    df = ohlcv.tz_localize("UTC")
+    sliced = slice_range(df, "2000-01-05", "2000-01-06 23:00")
+
+    assert sliced.index[0] == pd.Timestamp("2000-01-05", tz="UTC")
+    assert sliced.index[-1] == pd.Timestamp("2000-01-06 23:00", tz="UTC")
+    assert len(slice_range(df)) == len(df)
@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+
+from gss_quant.fetch import FRESH, REFRESHING, STALE, ProviderLimiter, SingleFlightCache, ThrottledProvider
+from gss_quant.providers import MarketDataProvider
+
+
+class FakeProvider(MarketDataProvider):
+    """Provider lokal dengan latensi dan kegagalan yang bisa diatur; mencatat panggilan dan konkurensi."""
+    name = "fake"
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.fail = False
+        self.gate = None
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.starts = []
+        self._lock = threading.Lock()
+
+    def fetch(self, ticker, interval="1d", start=None, period="max"):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.starts.append(time.monotonic())
+            call = self.calls
+        try:
+            if self.gate is not None:
+                assert self.gate.wait(5), "gate tidak pernah dibuka"
+            time.sleep(self.latency)
+            if self.fail:
+                raise ConnectionError("upstream down")
+            return f"{ticker}#{call}"
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _together(n, fn):
+    """Jalankan `fn` di `n` thread yang dimulai bersamaan; kembalikan hasilnya."""
+    barrier = threading.Barrier(n)
+    results = [None] * n
+
+    def run(i):
+        barrier.wait()
+        results[i] = fn()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    return results
+
+
+def test_concurrent_misses_share_one_upstream_call():
+    provider = FakeProvider(latency=0.2)
+    cache = SingleFlightCache()
+
+    results = _together(8, lambda: cache.get(('ohlcv', 'AAPL'), lambda: provider.fetch('AAPL'), ttl=60))
+
+    assert provider.calls == 1
+    assert {r.value for r in results} == {'AAPL#1'}
+    assert {r.state for r in results} == {FRESH}
+
+
+def test_stale_value_served_while_refresh_runs():
+    provider = FakeProvider()
+    cache = SingleFlightCache()
+    load = lambda: provider.fetch('AAPL')  # noqa: E731
+    assert cache.get('k', load, ttl=60).value == 'AAPL#1'
+
+    provider.gate = threading.Event()
+    started = time.monotonic()
+    served = cache.get('k', load, ttl=0)
+    assert time.monotonic() - started < 1.0
+    assert (served.value, served.state) == ('AAPL#1', REFRESHING)
+    # Pembaruan yang sedang berjalan tidak digandakan oleh pemanggil berikutnya
+    assert cache.get('k', load, ttl=0).value == 'AAPL#1'
+
+    provider.gate.set()
+    assert cache.refresh('k', load) == 'AAPL#2'
+    assert provider.calls == 2
+    fresh = cache.get('k', load, ttl=60)
+    assert (fresh.value, fresh.state) == ('AAPL#2', FRESH)
+
+
+def test_failed_refresh_backs_off_then_retries():
+    provider = FakeProvider()
+    cache = SingleFlightCache(error_backoff=0.3)
+    load = lambda: provider.fetch('AAPL')  # noqa: E731
+    cache.get('k', load, ttl=60)
+
+    provider.fail = True
+    with pytest.raises(ConnectionError):
+        cache.refresh('k', load)
+    assert provider.calls == 2
+
+    # Selama backoff nilai lama dikembalikan tanpa memanggil hulu lagi
+    stale = cache.get('k', load, ttl=0)
+    assert (stale.value, stale.state, stale.error) == ('AAPL#1', STALE, 'upstream down')
+    assert provider.calls == 2
+
+    time.sleep(0.35)
+    provider.fail = False
+    assert cache.get('k', load, ttl=0).state == REFRESHING
+    assert cache.refresh('k', load) == 'AAPL#3'
+    assert cache.get('k', load, ttl=60).state == FRESH
+
+
+def test_miss_without_value_raises_to_every_waiter():
+    provider = FakeProvider(latency=0.1)
+    provider.fail = True
+    cache = SingleFlightCache()
+
+    def attempt():
+        try:
+            cache.get('k', lambda: provider.fetch('AAPL'), ttl=60)
+        except ConnectionError as e:
+            return e
+
+    results = _together(4, attempt)
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert provider.calls == 1
+
+
+def test_limiter_caps_concurrency_and_paces_starts():
+    provider = FakeProvider(latency=0.1)
+    throttled = ThrottledProvider(provider, ProviderLimiter(max_concurrent=2, min_interval=0.02))
+
+    results = _together(6, lambda: throttled.fetch('AAPL'))
+
+    assert sorted(results) == sorted(f"AAPL#{i}" for i in range(1, 7))
+    assert provider.peak == 2
+    starts = sorted(provider.starts)
+    assert all(b - a >= 0.015 for a, b in zip(starts, starts[1:]))
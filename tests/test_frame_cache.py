@@ -0,0 +1,87 @@
+import gc
+import os
+
+import pandas as pd
+import pytest
+
+from gss_quant import frame_cache
+from gss_quant.fetch import SingleFlightCache
+from gss_quant.frame_cache import SharedFrameCache
+from gss_quant.synthetic import synthetic_ohlcv
+
+KEY = ('market_data', 'TEST', '1y', '1d')
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SharedFrameCache(tmp_path, budget_bytes=64 * 1024 * 1024)
+
+
+@pytest.fixture
+def frames():
+    return synthetic_ohlcv(300, seed=1), synthetic_ohlcv(300, seed=2)
+
+
+def test_view_holds_lease_until_released(cache, frames):
+    cache.put(KEY, frames[0])
+    df = cache.get(KEY)
+
+    pd.testing.assert_frame_equal(df, frames[0], check_freq=False)
+    assert not df['Close'].to_numpy().flags.writeable
+    assert cache.stats()['leases'] == 1
+    assert cache.clear() == 0
+
+    del df
+    gc.collect()
+    assert cache.stats()['leases'] == 0
+    assert cache.clear() == 1
+
+
+def test_fetch_layer_refresh_releases_previous_view(cache, frames):
+    fetch_layer = SingleFlightCache()
+    versions = iter(frames)
+
+    def load():
+        cache.put(KEY, next(versions))
+        return cache.get(KEY)
+
+    fetch_layer.refresh(KEY, load)
+    assert cache.stats()['leases'] == 1
+
+    # Nilai lama diganti: hanya view terbaru yang masih menahan lease
+    fetch_layer.refresh(KEY, load)
+    gc.collect()
+    assert cache.stats()['leases'] == 1
+    pd.testing.assert_frame_equal(fetch_layer.get(KEY, load, ttl=60).value, frames[1], check_freq=False)
+
+
+def test_failed_lock_closes_descriptor(cache, frames, monkeypatch):
+    cache.put(KEY, frames[0])
+    before = set(os.listdir('/proc/self/fd'))
+
+    def interrupted(fd, op):
+        raise InterruptedError("flock terputus")
+
+    monkeypatch.setattr(frame_cache.fcntl, 'flock', interrupted)
+    with pytest.raises(InterruptedError):
+        cache.get(KEY)
+    assert set(os.listdir('/proc/self/fd')) <= before
+    assert cache.stats()['leases'] == 0
+
+
+def test_maps_the_file_it_locked_when_replaced_concurrently(cache, frames, monkeypatch):
+    cache.put(KEY, frames[0])
+
+    class RacingLease(frame_cache._Lease):
+        def __init__(self, owner, path):
+            super().__init__(owner, path)
+            # `put` dari proses lain mengganti file tepat setelah lease diambil
+            monkeypatch.setattr(frame_cache, '_Lease', original)
+            owner.put(KEY, frames[1])
+
+    original = frame_cache._Lease
+    monkeypatch.setattr(frame_cache, '_Lease', RacingLease)
+
+    df = cache.get(KEY)
+    pd.testing.assert_frame_equal(df, frames[0], check_freq=False)
+    pd.testing.assert_frame_equal(cache.get(KEY), frames[1], check_freq=False)
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant.incremental import IndicatorState, refresh_indicators
+from gss_quant.kernels import INDICATOR_COLUMNS, indicator_frame
+from gss_quant.providers import LocalFileProvider, normalize_ohlcv
+from gss_quant.store import OHLCVStore
+from gss_quant.synthetic import synthetic_ohlcv
+
+TICKER = "TEST"
+
+
+@pytest.fixture(scope="module")
+def ohlcv():
+    return normalize_ohlcv(synthetic_ohlcv(600, seed=11))
+
+
+def _bar(row):
+    return {'High': row['High'], 'Low': row['Low'], 'Close': row['Close']}
+
+
+def test_state_round_trip_matches_indicator_frame(ohlcv, tmp_path):
+    split = 400
+    state, _ = IndicatorState.from_history(ohlcv.iloc[:split])
+    state.save(tmp_path / "state.json")
+    state = IndicatorState.load(tmp_path / "state.json")
+
+    # Revisi bar terakhir setelah dimuat ulang (bar belum ditutup), lalu kembali ke nilai akhirnya
+    last = ohlcv.iloc[split - 1]
+    state.update(ohlcv.index[split - 1], {**_bar(last), 'Close': last['Close'] * 1.05})
+    rows = [state.update(ohlcv.index[split - 1], _bar(last))]
+    for ts, row in ohlcv.iloc[split:].iterrows():
+        rows.append(state.update(ts, _bar(row)))
+
+    streamed = pd.DataFrame(rows, index=ohlcv.index[split - 1:], columns=INDICATOR_COLUMNS)
+    expected = indicator_frame(ohlcv).iloc[split - 1:]
+    np.testing.assert_allclose(streamed.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9)
+
+
+@pytest.fixture
+def store(tmp_path):
+    provider = LocalFileProvider(tmp_path / "source")
+    provider.root.mkdir()
+    return OHLCVStore(provider, root=tmp_path / "store")
+
+
+def _publish(store, df):
+    df.to_parquet(store.provider.root / f"{TICKER}_1d.parquet")
+
+
+def _inodes(store):
+    return [store.sidecar_path(TICKER, "1d", suffix).stat().st_ino for suffix in ('state.json', 'indicators.parquet')]
+
+
+def test_refresh_skips_write_when_last_bar_unchanged(store, ohlcv):
+    _publish(store, ohlcv.iloc[:500])
+    first = refresh_indicators(store, TICKER)
+    written = _inodes(store)
+
+    again = refresh_indicators(store, TICKER)
+    assert _inodes(store) == written
+    pd.testing.assert_frame_equal(again, first, check_freq=False)
+
+    revised = ohlcv.iloc[:500].copy()
+    revised.iloc[-1, revised.columns.get_loc('Close')] *= 1.02
+    _publish(store, revised)
+    result = refresh_indicators(store, TICKER)
+    assert _inodes(store) != written
+    np.testing.assert_allclose(result[INDICATOR_COLUMNS].to_numpy(), indicator_frame(revised).to_numpy(),
+                               rtol=1e-9, atol=1e-9)
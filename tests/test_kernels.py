@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant.incremental import IndicatorState
+from gss_quant.kernels import INDICATOR_COLUMNS, indicator_frame
+
+# Ditangkap sekali dari pandas_ta 0.4.71b0 dengan tests/data/capture_pandas_ta.py
+REFERENCE = Path(__file__).parent / "data" / "pandas_ta_reference.csv"
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return pd.read_csv(REFERENCE, index_col='Date', parse_dates=True)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+def test_kernels_match_pandas_ta(reference, backend):
+    if backend == "numba":
+        pytest.importorskip("numba")
+    computed = indicator_frame(reference[['High', 'Low', 'Close']], backend=backend)
+    for column in INDICATOR_COLUMNS:
+        np.testing.assert_allclose(computed[column].to_numpy(), reference[column].to_numpy(),
+                                   rtol=1e-10, atol=1e-10, err_msg=column)
+
+
+def test_incremental_state_matches_pandas_ta(reference):
+    _, computed = IndicatorState.from_history(reference)
+    for column in INDICATOR_COLUMNS:
+        np.testing.assert_allclose(computed[column].to_numpy(), reference[column].to_numpy(),
+                                   rtol=1e-10, atol=1e-10, err_msg=column)
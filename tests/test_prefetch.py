@@ -0,0 +1,149 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from gss_quant import prefetch
+from gss_quant.market_hours import NEW_YORK, infer_asset_type, is_market_open
+from gss_quant.prefetch import PrefetchScheduler
+
+
+def ny(*args):
+    """Datetime waktu New York (2024-01-08 adalah Senin)."""
+    return datetime(*args, tzinfo=NEW_YORK)
+
+
+# --- Jam pasar ---
+
+@pytest.mark.parametrize("when, expected", [
+    (ny(2024, 1, 8, 9, 29), False),
+    (ny(2024, 1, 8, 9, 30), True),
+    (ny(2024, 1, 8, 15, 59), True),
+    (ny(2024, 1, 8, 16, 0), False),
+    (ny(2024, 1, 13, 12, 0), False),                                    # Sabtu
+    (datetime(2024, 1, 8, 14, 30, tzinfo=timezone.utc), True),           # 09:30 EST
+    (datetime(2024, 7, 8, 13, 30, tzinfo=timezone.utc), True),           # 09:30 EDT
+    (datetime(2024, 1, 8, 13, 30, tzinfo=timezone.utc), False),          # 08:30 EST
+])
+def test_us_equity_session(when, expected):
+    assert is_market_open('Stock', when) is expected
+    assert is_market_open('ETF', when) is expected
+
+
+@pytest.mark.parametrize("when, expected", [
+    (ny(2024, 1, 7, 17, 59), False),     # Minggu sebelum pembukaan
+    (ny(2024, 1, 7, 18, 0), True),
+    (ny(2024, 1, 9, 17, 30), False),     # jeda harian
+    (ny(2024, 1, 9, 18, 0), True),
+    (ny(2024, 1, 10, 3, 0), True),
+    (ny(2024, 1, 12, 16, 59), True),     # Jumat
+    (ny(2024, 1, 12, 17, 0), False),
+    (ny(2024, 1, 13, 12, 0), False),     # Sabtu
+])
+def test_cme_globex_session(when, expected):
+    assert is_market_open('Commodity', when) is expected
+
+
+def test_grace_after_close_and_always_open_types():
+    grace = timedelta(minutes=20)
+    assert is_market_open('Stock', ny(2024, 1, 8, 16, 10), grace)
+    assert not is_market_open('Stock', ny(2024, 1, 8, 16, 25), grace)
+    assert not is_market_open('Stock', ny(2024, 1, 8, 9, 20), grace)
+    assert is_market_open('Crypto', ny(2024, 1, 13, 3, 0))
+    assert is_market_open('Unknown', ny(2024, 1, 13, 3, 0))
+
+
+def test_infer_asset_type():
+    assert [infer_asset_type(t) for t in ('BTC-USD', 'GC=F', 'NVDA')] == ['Crypto', 'Commodity', 'Stock']
+
+
+# --- Penjadwal ---
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(prefetch, 'time', SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+SATURDAY = ny(2024, 1, 13, 12, 0)
+MONDAY_OPEN = ny(2024, 1, 8, 11, 0)
+
+
+def test_closed_markets_warm_once_then_skip(clock):
+    scheduler = PrefetchScheduler(lambda t: None, {'NVDA': 'Stock', 'GC=F': 'Commodity', 'BTC-USD': 'Crypto'},
+                                  interval=30, idle_interval=300)
+
+    # Pemanasan: ticker yang belum pernah diperbarui selalu jatuh tempo, pasar buka atau tidak
+    warm = scheduler.due(wall=SATURDAY)
+    assert sorted(warm) == ['BTC-USD', 'GC=F', 'NVDA']
+    scheduler._last_refresh.update(dict.fromkeys(warm, clock.now))
+
+    clock.now += 301
+    assert scheduler.due(wall=SATURDAY) == ['BTC-USD']
+    assert sorted(scheduler.due(wall=MONDAY_OPEN)) == ['BTC-USD', 'GC=F', 'NVDA']
+
+
+def test_viewed_tickers_are_hot_and_first(clock):
+    scheduler = PrefetchScheduler(lambda t: None, {'A-USD': 'Crypto', 'B-USD': 'Crypto', 'C-USD': 'Crypto'},
+                                  interval=30, idle_interval=300, hot_window=900)
+    assert scheduler.run_once() == ['A-USD', 'B-USD', 'C-USD']
+
+    clock.now += 10
+    scheduler.touch('C-USD')
+    clock.now += 5
+    scheduler.touch('B-USD')
+    clock.now += 30
+    # Hanya ticker panas yang jatuh tempo setelah `interval`; yang terakhir dilihat lebih dulu
+    assert scheduler.due() == ['B-USD', 'C-USD']
+
+    clock.now += 300
+    assert scheduler.due() == ['B-USD', 'C-USD', 'A-USD']
+    clock.now += 900
+    scheduler.run_once()
+    clock.now += 31
+    assert scheduler.due() == []
+
+
+def test_touch_and_add_register_new_tickers(clock):
+    scheduler = PrefetchScheduler(lambda t: None, {})
+    scheduler.add('GC=F')
+    scheduler.add('SPY', 'ETF')
+    scheduler.add('SPY', 'Stock')
+    scheduler.touch('ETH-USD')
+
+    assert scheduler._assets == {'GC=F': 'Commodity', 'SPY': 'ETF', 'ETH-USD': 'Crypto'}
+    assert scheduler.due(wall=SATURDAY)[0] == 'ETH-USD'
+
+
+def test_failed_refresh_is_not_retried_immediately(clock):
+    calls = []
+
+    def refresh(ticker):
+        calls.append(ticker)
+        raise ConnectionError("provider down")
+
+    scheduler = PrefetchScheduler(refresh, {'BTC-USD': 'Crypto'}, idle_interval=300)
+    assert scheduler.run_once() == ['BTC-USD']
+    assert scheduler.run_once() == []
+    assert calls == ['BTC-USD']
+
+
+def test_background_thread_refreshes_and_stops():
+    refreshed = threading.Event()
+    scheduler = PrefetchScheduler(lambda t: refreshed.set(), {'BTC-USD': 'Crypto'}, tick=0.01).start()
+    try:
+        assert refreshed.wait(5)
+        assert scheduler.start()._thread.is_alive()
+    finally:
+        scheduler.stop(timeout=5)
+    assert not scheduler._thread.is_alive()
@@ -0,0 +1,93 @@
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant.fx import FX_TICKER
+from gss_quant.risk import MODELS, calibrate, portfolio_risk, simulate, simulate_terminal
+
+
+@pytest.fixture(scope="module")
+def returns():
+    """Return log harian normal untuk dua aset dan kurs, 600 hari."""
+    rng = np.random.default_rng(42)
+    cov = np.array([[1.0e-4, 4.0e-5, 0.0], [4.0e-5, 2.25e-4, 0.0], [0.0, 0.0, 1.0e-5]])
+    data = rng.multivariate_normal([5e-4, 2e-4, 1e-4], cov, size=600)
+    index = pd.date_range("2022-01-03", periods=600, freq="B")
+    return pd.DataFrame(data, index=index, columns=['AAA', 'BBB', FX_TICKER])
+
+
+def test_calibrate_rejects_unknown_model_and_short_history(returns):
+    with pytest.raises(ValueError):
+        calibrate(returns, 'heston')
+    with pytest.raises(ValueError):
+        calibrate(returns.head(20))
+
+
+def test_garch_fit_is_stationary(returns):
+    model = calibrate(returns[['AAA', 'BBB']], 'garch')
+    assert np.all(model.alpha + model.beta < 0.999)
+    assert np.all(model.omega > 0) and np.all(model.sigma2 > 0)
+    assert model.sample.shape == (500, 2)
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_results_independent_of_chunk_bytes(returns, model):
+    fitted = calibrate(returns[['AAA', 'BBB']], model)
+    stops = np.log([0.97, 0.95])
+    whole = simulate_terminal(fitted, 10_000, 25, stops, seed=3)
+    chunked = simulate_terminal(fitted, 10_000, 25, stops, seed=3, chunk_bytes=1)
+
+    np.testing.assert_array_equal(whole[0], chunked[0])
+    np.testing.assert_array_equal(whole[1], chunked[1])
+
+
+def test_seed_and_workers_are_deterministic(returns):
+    fitted = calibrate(returns[['AAA', 'BBB']], 'bootstrap')
+    first = simulate(fitted, 6_000, 10, seed=11, workers=2)
+    second = simulate(fitted, 6_000, 10, seed=11, workers=2)
+
+    np.testing.assert_array_equal(first[0], second[0])
+    np.testing.assert_array_equal(first[1], second[1])
+    # Benih yang sama dipakai ulang sebagai SeedSequence tetap memberi hasil yang sama
+    seed = np.random.SeedSequence(5)
+    np.testing.assert_array_equal(simulate_terminal(fitted, 500, 5, seed=seed)[0],
+                                  simulate_terminal(fitted, 500, 5, seed=seed)[0])
+
+
+def test_gbm_var_matches_normal_quantile(returns):
+    horizon, value = 20, 1_000_000.0
+    result = portfolio_risk(returns[['AAA']], {'AAA': value}, 16000.0, model='gbm', horizon=horizon,
+                            paths=200_000, seed=1, workers=1)
+
+    fitted = calibrate(returns[['AAA']], 'gbm')
+    mu, sigma = fitted.mu[0] * horizon, fitted.chol[0, 0] * np.sqrt(horizon)
+    for row in result['risk']:
+        z = NormalDist().inv_cdf(1 - row['confidence'])
+        expected = value * (1 - np.exp(mu + sigma * z))
+        assert row['var_usd'] == pytest.approx(expected, rel=0.02)
+        assert row['es_usd'] > row['var_usd']
+    assert result['fx_simulated'] is False
+    assert result['risk'][0]['var_idr'] == pytest.approx(result['risk'][0]['var_usd'] * 16000.0)
+
+
+def test_no_atr_means_no_stop_hits(returns):
+    fitted = calibrate(returns[['AAA', 'BBB']], 'bootstrap')
+    assert simulate_terminal(fitted, 2_000, 20, seed=0)[1].tolist() == [0, 0]
+
+    result = portfolio_risk(returns[['AAA', 'BBB']], {'AAA': 1000.0, 'BBB': 500.0}, 16000.0,
+                            prices_usd={'AAA': 100.0, 'BBB': 50.0}, atr_usd={'AAA': 2.0, 'BBB': 0.0},
+                            paths=5_000, seed=0, workers=1)
+    assert [s['ticker'] for s in result['stops']] == ['AAA']
+    assert 0.0 < result['stops'][0]['hit_probability'] < 1.0
+    assert result['stops'][0]['stop_usd'] == pytest.approx(96.0)
+
+
+def test_fx_column_is_simulated(returns):
+    result = portfolio_risk(returns, {'AAA': 1000.0}, 16000.0, paths=5_000, seed=0, workers=1)
+
+    assert result['fx_simulated'] is True
+    assert result['tickers'] == ['AAA']
+    usd, idr = result['risk'][0]['var_usd'], result['risk'][0]['var_idr']
+    assert idr != pytest.approx(usd * 16000.0, rel=1e-6)
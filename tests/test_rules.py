@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from gss_quant.analysis import analyze_signal
+from gss_quant.params import DEFAULT_PARAMS, StrategyParams
+from gss_quant.rules import (
+    DEFAULT_RULES, Profile, RuleSet, col, notna, parse_expr, score_profiles, score_universe,
+)
+from gss_quant.scoring import quantum_score
+
+PARAMS = [DEFAULT_PARAMS, StrategyParams(rsi_oversold=25, rsi_overbought=75, adx_trend=20)]
+
+
+def _reference(df, params):
+    """Skor dan kepercayaan `analyze_signal` (implementasi skalar) untuk setiap bar."""
+    pairs = [analyze_signal(df.iloc[[max(i - 1, 0), i]], False, 16000.0, params) for i in range(len(df))]
+    return np.array([p[0] for p in pairs]), np.array([p[4] for p in pairs])
+
+
+@pytest.mark.parametrize("params", PARAMS)
+@pytest.mark.parametrize("frame", ["enriched", "edge_frame"])
+def test_default_rules_match_analyze_signal(request, frame, params):
+    df = request.getfixturevalue(frame)
+    expected_score, expected_confidence = _reference(df, params)
+
+    score, confidence = quantum_score(df, params)
+    np.testing.assert_array_equal(score, expected_score)
+    np.testing.assert_array_equal(confidence, expected_confidence)
+
+    profiled = score_profiles(df, (Profile('p', params=params),))
+    np.testing.assert_array_equal(profiled[('p', 'SCORE')].to_numpy(), expected_score)
+    np.testing.assert_array_equal(profiled[('p', 'CONFIDENCE')].to_numpy(), expected_confidence)
+
+
+def test_profiles_evaluated_together_match_separately(enriched):
+    profiles = (
+        Profile('default'),
+        Profile('rsi_heavy', DEFAULT_RULES.with_points('rsi_heavy', rsi__oversold=45)),
+        Profile('tight', params=PARAMS[1]),
+    )
+    together = score_profiles(enriched, profiles)
+    for profile in profiles:
+        alone = score_profiles(enriched, (profile,))
+        np.testing.assert_array_equal(together[profile.name].to_numpy(), alone[profile.name].to_numpy())
+
+
+def test_score_universe_matches_per_ticker(enriched, edge_frame):
+    frames = {'A': enriched, 'B': edge_frame}
+    universe = score_universe(frames)
+    for ticker, df in frames.items():
+        np.testing.assert_array_equal(universe.loc[ticker].to_numpy(), score_profiles(df).to_numpy())
+
+
+def test_reflected_operators_build_same_nodes_as_text():
+    assert (1 + col('RSI')).node == parse_expr("1 + RSI")
+    assert (100 - col('RSI')).node == parse_expr("100 - RSI")
+    assert (2 * col('ATR')).node == parse_expr("2 * ATR")
+    assert (1 / col('ATR')).node == parse_expr("1 / ATR")
+    assert (True & notna('RSI')).node == ('op', 'and', ('const', True), ('op', 'notna', ('col', 'RSI')))
+
+
+def test_parse_rejects_unknown_syntax():
+    for text in ["__import__('os')", "Close.real", "RSI in (1, 2)", "unknown_fn(RSI)"]:
+        with pytest.raises(ValueError):
+            parse_expr(text)
+
+
+def test_ruleset_round_trips_through_dict():
+    assert RuleSet.from_dict(DEFAULT_RULES.to_dict()) == DEFAULT_RULES
+    with pytest.raises(ValueError):
+        DEFAULT_RULES.with_points(rsi__missing=10)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant.analysis import analyze_signal
+from gss_quant.scoring import score_history
+
+NAN = np.nan
+
+
+def _rates(df):
+    """Kurs historis yang berubah tiap 5 bar dan tercatat di tengah bar, untuk menguji join as-of."""
+    index = df.index[::5] + pd.Timedelta(hours=12)
+    return pd.Series(np.linspace(15000.0, 16500.0, len(index)), index=index)
+
+
+@pytest.mark.parametrize("is_gold", [False, True])
+@pytest.mark.parametrize("frame", ["enriched", "edge_frame"])
+def test_score_history_matches_analyze_signal_on_every_prefix(request, frame, is_gold):
+    df = request.getfixturevalue(frame)
+    rates = _rates(df)
+    history = score_history(df, is_gold, rates)
+
+    for i in range(1, len(df)):
+        score, _, volatility_idr, atr_idr, confidence = analyze_signal(df.iloc[:i + 1], is_gold, rates)
+        row = history.iloc[i]
+        assert (row['SCORE'], row['CONFIDENCE']) == (score, confidence), df.index[i]
+        assert row['VOLATILITY_IDR'] == pytest.approx(volatility_idr, rel=1e-12), df.index[i]
+        assert row['ATR_IDR'] == pytest.approx(atr_idr, rel=1e-12), df.index[i]
+
+
+def _row(**values):
+    base = {'Close': 80.0, 'EMA_200': 105.0, 'EMA_50': NAN, 'RSI': NAN, 'MACD': NAN, 'MACD_SIGNAL': NAN,
+            'BB_UPPER': NAN, 'BB_LOWER': NAN, 'ADX': 60.0, 'ATR': 1.0, 'VOLATILITY_30D': 1.0}
+    return pd.DataFrame([{**base, **values}] * 2, index=pd.date_range("2024-01-01", periods=2, freq="D"))
+
+
+@pytest.mark.parametrize("values, expected", [
+    ({}, 77),                                   # -25 -> int((50 - 25) * 1.1) = 27, lalu +50 lagi
+    ({'MACD': 0.0, 'MACD_SIGNAL': 1.0}, 55),    # -45 -> int(5.5) = 5 (dipotong, bukan dibulatkan) -> 55
+    ({'ADX': 25.0}, 25),                        # ADX tepat di ambang: tidak dipertegas
+    ({'Close': 110.0, 'BB_UPPER': 120.0, 'BB_LOWER': 111.0}, 100),  # +55 -> di-clip 100 dua kali
+])
+def test_adx_boost_adds_50_twice_and_truncates(values, expected):
+    df = _row(**values)
+    assert analyze_signal(df, False, 16000.0)[0] == expected
+    assert score_history(df, False, 16000.0)['SCORE'].iloc[-1] == expected
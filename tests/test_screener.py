@@ -0,0 +1,100 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from gss_quant import retry
+from gss_quant.providers import MarketDataProvider, normalize_ohlcv
+from gss_quant.screener import parse_watchlist, score_ticker, screen_universe
+from gss_quant.synthetic import synthetic_universe
+
+
+class MemoryProvider(MarketDataProvider):
+    """Provider dari dict ticker -> DataFrame; mencatat setiap batch `fetch_many`."""
+    name = "memory"
+
+    def __init__(self, frames, fail_batches=0):
+        self.frames = frames
+        self.fail_batches = fail_batches
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def fetch(self, ticker, interval="1d", start=None, period="max"):
+        return self.frames.get(ticker, normalize_ohlcv(pd.DataFrame()))
+
+    def fetch_many(self, tickers, interval="1d", period="1y"):
+        with self._lock:
+            self.batches.append(list(tickers))
+            if self.fail_batches:
+                self.fail_batches -= 1
+                raise ConnectionError("rate limit")
+        return super().fetch_many(tickers, interval, period)
+
+
+@pytest.fixture(scope="module")
+def frames():
+    return {ticker: normalize_ohlcv(df) for ticker, df in synthetic_universe(7, 300, seed=2).items()}
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(retry.time, 'sleep', lambda seconds: None)
+
+
+def _screen(provider, tickers, **kwargs):
+    return list(screen_universe(tickers, provider, 16000.0, batch_size=3, fetch_workers=2, compute_workers=2, **kwargs))
+
+
+def test_parse_watchlist_dedupes_in_order():
+    assert parse_watchlist("nvda, spy\nNVDA  btc-usd,,") == ['NVDA', 'SPY', 'BTC-USD']
+
+
+def test_batches_and_results_match_single_ticker_scoring(frames):
+    provider = MemoryProvider(frames)
+    tickers = list(frames)
+
+    rows = _screen(provider, tickers, gold_tickers=frozenset({tickers[0]}))
+
+    assert [len(b) for b in provider.batches] == [3, 3, 1]
+    assert sorted(t for b in provider.batches for t in b) == sorted(tickers)
+    by_ticker = {row['ticker']: row for row in rows}
+    assert len(rows) == len(by_ticker) == len(tickers)
+    for ticker in tickers:
+        expected = score_ticker(ticker, frames[ticker], ticker == tickers[0], 16000.0)
+        assert by_ticker[ticker] == expected
+    assert by_ticker[tickers[0]]['close_idr'] < by_ticker[tickers[0]]['close_usd'] * 16000.0
+
+
+def test_missing_and_unscorable_tickers_become_error_rows(frames):
+    broken = frames['SYN0001'][['Close']]
+    provider = MemoryProvider({'SYN0000': frames['SYN0000'], 'BROKEN': broken,
+                               'SHORT': frames['SYN0002'].iloc[:1]})
+
+    rows = {row['ticker']: row for row in _screen(provider, ['SYN0000', 'NOPE', 'BROKEN', 'SHORT'])}
+
+    assert rows['SYN0000']['error'] is None
+    assert rows['NOPE']['error'] == rows['SHORT']['error'] == "Data kosong"
+    assert rows['BROKEN']['error'].startswith("Gagal menghitung")
+
+
+def test_failed_batch_is_retried_then_reported(frames):
+    provider = MemoryProvider(frames, fail_batches=1)
+    rows = _screen(provider, ['SYN0000', 'SYN0001'])
+    assert all(row['error'] is None for row in rows) and len(provider.batches) == 2
+
+    # Batch tanpa data sama sekali dianggap gagal dan dicoba ulang sampai habis
+    provider = MemoryProvider({})
+    rows = _screen(provider, ['A', 'B', 'C', 'D'])
+    assert len(provider.batches) == 2 * 3
+    assert sorted(row['ticker'] for row in rows) == ['A', 'B', 'C', 'D']
+    assert all(row['error'].startswith("Gagal mengambil data") for row in rows)
+
+
+def test_closing_early_stops_the_generator(frames):
+    results = screen_universe(list(frames), MemoryProvider(frames), 16000.0, batch_size=2, compute_workers=1)
+    first = next(results)
+    results.close()
+
+    assert first['ticker'] in frames
+    with pytest.raises(StopIteration):
+        next(results)
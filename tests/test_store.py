@@ -0,0 +1,131 @@
+import pandas as pd
+import pytest
+
+from gss_quant.providers import LocalFileProvider, normalize_ohlcv
+from gss_quant.store import OHLCVStore
+from gss_quant.synthetic import synthetic_ohlcv
+
+TICKER = "TEST"
+
+
+class RecordingProvider(LocalFileProvider):
+    """`LocalFileProvider` yang mencatat argumen setiap fetch."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.calls = []
+
+    def fetch(self, ticker, interval="1d", start=None, period="max"):
+        self.calls.append({'start': start, 'period': period})
+        return super().fetch(ticker, interval, start=start, period=period)
+
+
+@pytest.fixture
+def source():
+    return normalize_ohlcv(synthetic_ohlcv(320, seed=3))
+
+
+@pytest.fixture
+def setup(tmp_path, source):
+    """(store, provider, fungsi untuk menulis file sumber) dengan direktori sumber dan store terpisah."""
+    provider = RecordingProvider(tmp_path / "source")
+    provider.root.mkdir()
+    store = OHLCVStore(provider, root=tmp_path / "store")
+
+    def publish(df):
+        df.to_parquet(provider.root / f"{TICKER}_1d.parquet")
+
+    return store, provider, publish
+
+
+def test_seed_fills_empty_store(setup, source):
+    store, provider, publish = setup
+    publish(source.iloc[:300])
+
+    history = store.refresh(TICKER, seed_period="max")
+
+    assert provider.calls == [{'start': None, 'period': 'max'}]
+    pd.testing.assert_frame_equal(history, source.iloc[:300], check_freq=False)
+    pd.testing.assert_frame_equal(store.load(TICKER), history)
+
+
+def test_refresh_fetches_from_last_bar_and_revises_it(setup, source):
+    store, provider, publish = setup
+    publish(source.iloc[:300])
+    store.refresh(TICKER)
+
+    # Bar terakhir yang tersimpan direvisi (bar yang belum ditutup) dan 20 bar baru muncul
+    updated = source.copy()
+    revised_at = source.index[299]
+    updated.loc[revised_at, ['High', 'Close']] = [999.0, 998.0]
+    publish(updated)
+
+    history = store.refresh(TICKER)
+
+    assert provider.calls[-1] == {'start': revised_at, 'period': 'max'}
+    assert len(history) == 320 and not history.index.has_duplicates
+    assert history.loc[revised_at, 'Close'] == 998.0
+    pd.testing.assert_frame_equal(history, updated, check_freq=False)
+    pd.testing.assert_frame_equal(store.load(TICKER), history)
+
+
+def test_refetched_unchanged_last_bar_does_not_rewrite(setup, source):
+    store, provider, publish = setup
+    publish(source.iloc[:300])
+    store.refresh(TICKER)
+    path = store.path(TICKER)
+    mtime = path.stat().st_mtime_ns
+
+    history = store.refresh(TICKER)
+
+    assert provider.calls[-1] == {'start': source.index[299], 'period': 'max'}
+    assert path.stat().st_mtime_ns == mtime
+    pd.testing.assert_frame_equal(history, source.iloc[:300], check_freq=False)
+
+
+def test_append_of_stored_bars_does_not_rewrite(setup, source):
+    store, _, _ = setup
+    store.append(TICKER, source.iloc[:300])
+    mtime = store.path(TICKER).stat().st_mtime_ns
+
+    history = store.append(TICKER, source.iloc[295:300])
+
+    assert store.path(TICKER).stat().st_mtime_ns == mtime
+    assert len(history) == 300
+
+
+def test_refresh_without_new_bars_does_not_rewrite(setup, source):
+    store, _, publish = setup
+    publish(source.iloc[:300])
+    store.refresh(TICKER)
+    path = store.path(TICKER)
+    mtime = path.stat().st_mtime_ns
+
+    (store.provider.root / f"{TICKER}_1d.parquet").unlink()
+    history = store.refresh(TICKER)
+
+    assert len(history) == 300
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_failed_save_keeps_previous_file(setup, source, monkeypatch):
+    store, _, publish = setup
+    publish(source.iloc[:300])
+    store.refresh(TICKER)
+    path = store.path(TICKER)
+    before = path.read_bytes()
+
+    def broken_to_parquet(self, target, *args, **kwargs):
+        with open(target, 'wb') as f:
+            f.write(b'PAR1 setengah jadi')
+        raise OSError("disk penuh")
+
+    publish(source)
+    monkeypatch.setattr(pd.DataFrame, 'to_parquet', broken_to_parquet)
+    with pytest.raises(OSError):
+        store.refresh(TICKER)
+    monkeypatch.undo()
+
+    assert path.read_bytes() == before
+    assert len(store.load(TICKER)) == 300
+    assert sorted(p.name for p in store.root.iterdir()) == [path.name]
@@ -0,0 +1,245 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant.incremental import IndicatorState
+from gss_quant.kernels import INDICATOR_COLUMNS
+from gss_quant.providers import normalize_ohlcv
+from gss_quant.scoring import score_history, signal_labels
+from gss_quant.streaming import BarBuilder, LiveSignalEngine, ReplaySource, StreamPipeline, Tick, TickSource
+from gss_quant.synthetic import synthetic_ohlcv
+
+
+@pytest.fixture(scope="module")
+def ohlcv():
+    return normalize_ohlcv(synthetic_ohlcv(400, seed=13))
+
+
+def _tick(ts, price, size=1.0):
+    return Tick(pd.Timestamp(ts), price, size)
+
+
+class ListSource(TickSource):
+    """Sumber tick dari daftar."""
+    name = "list"
+
+    def __init__(self, ticks):
+        super().__init__()
+        self._ticks = ticks
+
+    def ticks(self):
+        for tick in self._ticks:
+            if self.closed:
+                return
+            yield tick
+
+
+class EndlessSource(TickSource):
+    """Tick tanpa akhir sampai `close()`; dipakai untuk menguji shutdown."""
+    name = "endless"
+
+    def ticks(self):
+        ts = pd.Timestamp("2024-01-02 00:00:00")
+        while not self.closed:
+            ts += pd.Timedelta("1s")
+            yield _tick(ts, 100.0)
+
+
+class GatedEngine:
+    """Engine palsu yang menahan batch pertama sampai `release` diset."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.batches = []
+
+    def apply(self, ticks):
+        self.started.set()
+        self.release.wait(5)
+        self.batches.append([t.price for t in ticks])
+        return None
+
+
+def _wait(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timeout"
+        time.sleep(0.01)
+
+
+# --- BarBuilder ---
+
+def test_bar_builder_buckets_ticks():
+    builder = BarBuilder("1min")
+
+    assert builder.add(_tick("2024-01-02 09:30:05", 10.0, 2.0)) is None
+    assert builder.add(_tick("2024-01-02 09:30:20", 12.0, 1.0)) is None
+    assert builder.add(_tick("2024-01-02 09:30:59.999", 9.0, 3.0)) is None
+    closed = builder.add(_tick("2024-01-02 09:31:00", 11.0, 4.0))
+
+    assert closed == (pd.Timestamp("2024-01-02 09:30"),
+                      {'Open': 10.0, 'High': 12.0, 'Low': 9.0, 'Close': 9.0, 'Volume': 6.0})
+    assert builder.timestamp == pd.Timestamp("2024-01-02 09:31")
+    assert builder.bar == {'Open': 11.0, 'High': 11.0, 'Low': 11.0, 'Close': 11.0, 'Volume': 4.0}
+
+
+def test_bar_builder_ignores_late_ticks():
+    builder = BarBuilder("1min")
+    builder.add(_tick("2024-01-02 09:31:10", 10.0))
+    before = dict(builder.bar)
+
+    assert builder.add(_tick("2024-01-02 09:30:59", 50.0)) is None
+    assert builder.late_ticks == 1 and builder.bar == before
+    # Tick yang terlambat di dalam bar berjalan tetap masuk
+    builder.add(_tick("2024-01-02 09:31:01", 8.0))
+    assert builder.late_ticks == 1 and builder.bar['Low'] == 8.0
+
+
+def test_bar_builder_converts_time_zones():
+    builder = BarBuilder("1D", tz="America/New_York")
+    # 03:00 UTC masih tanggal sebelumnya di New York
+    builder.add(_tick(pd.Timestamp("2024-01-03 03:00", tz="UTC"), 10.0))
+    assert builder.timestamp == pd.Timestamp("2024-01-02", tz="America/New_York")
+    # Tick naive dianggap sudah di zona waktu builder
+    closed = builder.add(_tick("2024-01-03 09:30", 11.0))
+    assert closed[0] == pd.Timestamp("2024-01-02", tz="America/New_York")
+
+    naive = BarBuilder("1h")
+    naive.add(_tick(pd.Timestamp("2024-01-02 10:15", tz="Asia/Jakarta"), 10.0))
+    assert naive.timestamp == pd.Timestamp("2024-01-02 03:00")
+
+
+# --- LiveSignalEngine ---
+
+def _expected_last(df):
+    """Indikator dan skor batch untuk bar terakhir `df`."""
+    _, indicators = IndicatorState.from_history(df)
+    scored = score_history(df.join(indicators), False, 16000.0)
+    return indicators.iloc[-1], scored.iloc[-1]
+
+
+def test_engine_matches_batch_indicators_and_score(ohlcv):
+    history, live = ohlcv.iloc[:300], ohlcv.iloc[300:320]
+    engine = LiveSignalEngine(history, "1D", usd_idr_rate=16000.0)
+
+    for ts, row in live.iterrows():
+        # Bar berjalan direvisi beberapa kali sebelum nilai akhirnya
+        path = [row['Open'], row['High'], row['Low'], row['Close']]
+        update = engine.apply([_tick(ts + pd.Timedelta(hours=i), price) for i, price in enumerate(path)])
+
+    indicators, scored = _expected_last(ohlcv.iloc[:320])
+    assert update.timestamp == live.index[-1] and update.bars_closed == 1
+    assert update.indicators == pytest.approx(indicators[INDICATOR_COLUMNS].to_dict(), rel=1e-12, nan_ok=True)
+    assert (update.score, update.confidence, update.risk) == (scored['SCORE'], scored['CONFIDENCE'], scored['RISK'])
+    assert update.signal == signal_labels([scored['SCORE']])[0]
+
+
+def test_engine_continues_last_history_bar(ohlcv):
+    history = ohlcv.iloc[:300]
+    engine = LiveSignalEngine(history, "1D")
+    last = history.index[-1]
+
+    update = engine.apply([_tick(last + pd.Timedelta(hours=20), history['High'].iloc[-1] * 2)])
+
+    assert update.timestamp == last and update.bars_closed == 0
+    assert update.bar['Open'] == history['Open'].iloc[-1]
+    assert update.bar['High'] == history['High'].iloc[-1] * 2
+    assert engine.apply([]) is not None
+
+
+# --- Pipeline ---
+
+@pytest.mark.parametrize("max_batch", [1, 64])
+def test_replay_run_matches_from_history_and_score_history(ohlcv, max_batch):
+    history, replay = ohlcv.iloc[:250], ohlcv.iloc[250:]
+    engine = LiveSignalEngine(history, "1D", usd_idr_rate=16000.0)
+    updates = []
+    pipeline = StreamPipeline(ReplaySource(replay), engine, maxsize=32, max_batch=max_batch,
+                              on_update=updates.append).start()
+    _wait(lambda: not pipeline.running)
+
+    state, indicators = IndicatorState.from_history(ohlcv)
+    scored = score_history(ohlcv.join(indicators), False, 16000.0)
+    final = pipeline.latest
+    assert final.timestamp == ohlcv.index[-1]
+    assert final.indicators == indicators.iloc[-1][INDICATOR_COLUMNS].to_dict()
+    assert (final.score, final.confidence, final.risk) == (scored['SCORE'].iloc[-1], scored['CONFIDENCE'].iloc[-1],
+                                                           scored['RISK'].iloc[-1])
+    assert engine.state.last_timestamp == state.last_timestamp
+    assert {k: v for k, v in final.bar.items() if k != 'Volume'} == \
+        replay[['Open', 'High', 'Low', 'Close']].iloc[-1].to_dict()
+
+    assert sum(u.bars_closed for u in updates) == len(replay)
+    stats = pipeline.stats()
+    assert stats['ticks_in'] == stats['ticks_processed'] == 4 * len(replay)
+    assert stats['ticks_dropped'] == stats['errors'] == 0
+
+
+def _backpressure_run(policy):
+    """20 tick ke antrean berkapasitas 5 sementara engine menahan batch pertama."""
+    engine = GatedEngine()
+    ticks = [_tick(pd.Timestamp("2024-01-02") + pd.Timedelta(seconds=i), float(i)) for i in range(20)]
+    pipeline = StreamPipeline(ListSource(ticks), engine, maxsize=5, policy=policy, max_batch=1).start()
+    engine.started.wait(5)
+    if policy == 'block':
+        _wait(lambda: pipeline._queue.full())
+        assert pipeline.running and pipeline.metrics.ticks_in < len(ticks)
+    else:
+        _wait(lambda: pipeline.metrics.ticks_in == len(ticks))
+    engine.release.set()
+    _wait(lambda: not pipeline.running)
+    return pipeline, [p for batch in engine.batches for p in batch]
+
+
+def test_drop_oldest_discards_and_counts():
+    pipeline, processed = _backpressure_run('drop_oldest')
+    stats = pipeline.stats()
+
+    assert processed[-5:] == [15.0, 16.0, 17.0, 18.0, 19.0]
+    assert stats['ticks_dropped'] > 0
+    assert stats['ticks_processed'] == len(processed)
+    assert stats['ticks_processed'] + stats['ticks_dropped'] == stats['ticks_in'] == 20
+    assert stats['max_queue'] == 5
+
+
+def test_block_keeps_every_tick():
+    pipeline, processed = _backpressure_run('block')
+    stats = pipeline.stats()
+
+    assert processed == [float(i) for i in range(20)]
+    assert stats['ticks_dropped'] == 0
+    assert stats['ticks_processed'] == stats['ticks_in'] == 20
+    assert stats['max_queue'] == 5
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError):
+        StreamPipeline(ListSource([]), GatedEngine(), policy='drop_newest')
+
+
+def test_stop_shuts_down_threads(ohlcv):
+    engine = LiveSignalEngine(ohlcv.iloc[:0], "1min")
+    pipeline = StreamPipeline(EndlessSource(), engine, maxsize=100, policy='drop_oldest').start()
+    _wait(lambda: pipeline.latest is not None)
+
+    pipeline.stop()
+
+    assert not pipeline.running and pipeline.source.closed
+    ticks_in = pipeline.metrics.ticks_in
+    time.sleep(0.05)
+    assert pipeline.metrics.ticks_in == ticks_in
+
+
+def test_engine_errors_are_counted():
+    class Broken:
+        def apply(self, ticks):
+            raise RuntimeError("rusak")
+
+    pipeline = StreamPipeline(ListSource([_tick("2024-01-02", 1.0)]), Broken()).start()
+    _wait(lambda: not pipeline.running)
+
+    assert pipeline.latest is None
+    assert pipeline.stats()['errors'] == 1 and pipeline.stats()['ticks_processed'] == 1
@@ -0,0 +1,103 @@
+import pandas as pd
+import pytest
+
+from gss_quant import telemetry
+from gss_quant.telemetry import MetricsRegistry
+
+
+@pytest.fixture
+def global_registry():
+    """REGISTRY global yang bersih; status aktif/mati dikembalikan setelah tes."""
+    was_enabled = telemetry.enabled()
+    telemetry.REGISTRY.reset()
+    yield telemetry.REGISTRY
+    telemetry.REGISTRY.reset()
+    (telemetry.enable if was_enabled else telemetry.disable)()
+
+
+def _bucket_lines(text, name):
+    return [line for line in text.splitlines() if line.startswith(f"{name}_bucket")]
+
+
+def test_histogram_buckets_are_upper_inclusive():
+    registry = MetricsRegistry(buckets=(0.1, 1.0, 10.0))
+    for value in (0.0, 0.1, 0.10001, 1.0, 9.99, 10.0, 10.5, 1e9):
+        registry.observe('latency', value)
+
+    text = registry.render_prometheus()
+
+    # le="0.1" memuat 0 dan tepat 0.1; nilai di atas batas terakhir hanya masuk +Inf
+    assert _bucket_lines(text, 'latency') == [
+        'latency_bucket{le="0.1"} 2',
+        'latency_bucket{le="1.0"} 4',
+        'latency_bucket{le="10.0"} 6',
+        'latency_bucket{le="+Inf"} 8',
+    ]
+    assert 'latency_count 8' in text.splitlines()
+    hist, = registry.snapshot()['histograms']
+    assert hist['count'] == 8 and hist['max'] == 1e9
+    assert hist['sum'] == pytest.approx(sum((0.0, 0.1, 0.10001, 1.0, 9.99, 10.0, 10.5, 1e9)))
+
+
+def test_prometheus_escapes_label_values():
+    registry = MetricsRegistry()
+    registry.inc(telemetry.CACHE_REQUESTS, cache='a"b\\c\nd', result='hit')
+    registry.set(telemetry.FRAME_BYTES, 1024, ticker='GC=F')
+
+    lines = registry.render_prometheus().splitlines()
+
+    assert 'gss_cache_requests_total{cache="a\\"b\\\\c\\nd",result="hit"} 1' in lines
+    assert 'gss_frame_bytes{ticker="GC=F"} 1024' in lines
+    assert '# TYPE gss_cache_requests_total counter' in lines
+    assert '# TYPE gss_frame_bytes gauge' in lines
+    # Label diurutkan menurut nama sehingga urutan keyword tidak membuat seri ganda
+    registry.inc(telemetry.CACHE_REQUESTS, result='hit', cache='a"b\\c\nd')
+    assert 'gss_cache_requests_total{cache="a\\"b\\\\c\\nd",result="hit"} 2' in registry.render_prometheus().splitlines()
+
+
+def test_histogram_labels_include_le_after_own_labels():
+    registry = MetricsRegistry(buckets=(1.0,))
+    registry.observe(telemetry.STAGE_SECONDS, 0.5, stage='fetch')
+
+    lines = registry.render_prometheus().splitlines()
+
+    assert lines[:2] == ['# HELP gss_stage_seconds Durasi setiap tahap pipeline', '# TYPE gss_stage_seconds histogram']
+    assert 'gss_stage_seconds_bucket{stage="fetch",le="1.0"} 1' in lines
+    assert 'gss_stage_seconds_sum{stage="fetch"} 0.5' in lines
+
+
+def test_disabled_telemetry_is_a_no_op(global_registry):
+    telemetry.disable()
+
+    first, second = telemetry.span('fetch', ticker='X'), telemetry.upstream('yahoo')
+    assert first is second is telemetry._NOOP
+    with pytest.raises(KeyError), first:
+        raise KeyError('tidak ditelan')
+    telemetry.record_cache('market_data', 'hit')
+    telemetry.record_request('/signal', 200)
+    telemetry.record_frame_memory('X', pd.DataFrame({'a': [1.0]}))
+
+    assert global_registry.snapshot() == {'counters': [], 'gauges': [], 'histograms': []}
+
+
+def test_enabled_telemetry_records(global_registry):
+    telemetry.enable()
+
+    with telemetry.span('indicators', ticker='X'):
+        pass
+    with pytest.raises(ConnectionError), telemetry.upstream('yahoo', ticker='X'):
+        raise ConnectionError
+    for result in ('hit', 'stale', 'miss', 'miss'):
+        telemetry.record_cache('market_data', result)
+    telemetry.record_request('/signal', 304)
+    telemetry.record_frame_memory('X', pd.DataFrame({'a': [1.0, 2.0]}))
+
+    stages = telemetry.stage_summary()
+    assert [(row['stage'], row['count']) for row in stages] == [('indicators', 1)]
+    assert telemetry.stage_summary(telemetry.UPSTREAM_SECONDS, 'provider')[0]['provider'] == 'yahoo'
+    assert telemetry.cache_hit_rates() == {'market_data': {'requests': 4, 'hit_rate': 0.5}}
+    counters = {(c['name'], tuple(c['labels'].values())): c['value'] for c in telemetry.snapshot()['counters']}
+    assert counters[(telemetry.UPSTREAM_ERRORS, ('yahoo',))] == 1
+    assert counters[(telemetry.API_REQUESTS, ('/signal', '304'))] == 1
+    gauge, = telemetry.snapshot()['gauges']
+    assert gauge['labels'] == {'ticker': 'X'} and gauge['value'] > 0
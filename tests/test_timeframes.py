@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gss_quant.analysis import analyze_signal
+from gss_quant.indicators import add_indicators
+from gss_quant.providers import LocalFileProvider, normalize_ohlcv, slice_period
+from gss_quant.store import OHLCVStore
+from gss_quant.synthetic import synthetic_ohlcv
+from gss_quant.timeframes import DEFAULT_WEIGHTS, confluence, load_timeframes, resample_ohlcv
+
+TICKER = "TEST"
+
+
+class RecordingProvider(LocalFileProvider):
+    """`LocalFileProvider` yang mencatat interval setiap fetch."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.intervals = []
+
+    def fetch(self, ticker, interval="1d", start=None, period="max"):
+        self.intervals.append(interval)
+        return super().fetch(ticker, interval, start=start, period=period)
+
+
+def _publish(root, hourly, daily):
+    hourly.to_parquet(root / f"{TICKER}_1h.parquet")
+    daily.to_parquet(root / f"{TICKER}_1d.parquet")
+
+
+def _store(tmp_path, hourly, daily):
+    provider = RecordingProvider(tmp_path / "source")
+    provider.root.mkdir()
+    _publish(provider.root, hourly, daily)
+    return OHLCVStore(provider, root=tmp_path / "store")
+
+
+@pytest.fixture(scope="module")
+def hourly():
+    """~100 hari bar 1h: cukup untuk EMA 200 di 1h dan 4h, terlalu pendek untuk 1w."""
+    return normalize_ohlcv(synthetic_ohlcv(2400, seed=21, start="2023-01-02", freq="h"))
+
+
+@pytest.fixture(scope="module")
+def daily():
+    """~6 tahun bar harian (> 200 minggu)."""
+    return normalize_ohlcv(synthetic_ohlcv(1600, seed=22, start="2017-06-05"))
+
+
+def test_weekly_is_resampled_from_daily(tmp_path, hourly, daily):
+    store = _store(tmp_path, hourly, daily)
+
+    frames = load_timeframes(store, TICKER)
+
+    assert sorted(store.provider.intervals) == ['1d', '1h']
+    assert list(frames) == ['4h', '1d', '1w']
+    weekly = slice_period(resample_ohlcv(daily, '1w'), '1y')
+    pd.testing.assert_frame_equal(frames['1w'][weekly.columns], weekly, check_freq=False)
+    assert (frames['1w'].index.dayofweek == 0).all()
+    # Indikator 1w dihitung atas riwayat mingguan penuh, bukan hanya jendela 1 tahun
+    expected = add_indicators(resample_ohlcv(daily, '1w')).loc[weekly.index]
+    np.testing.assert_allclose(frames['1w']['EMA_200'], expected['EMA_200'], rtol=1e-9)
+    assert frames['4h'].index.min() >= hourly.index.min()
+    pd.testing.assert_frame_equal(frames['1d'][daily.columns], slice_period(daily, '1y'), check_freq=False)
+
+
+def test_second_load_only_refetches_bases(tmp_path, hourly, daily):
+    store = _store(tmp_path, hourly.iloc[:-40], daily.iloc[:-5])
+    load_timeframes(store, TICKER)
+    _publish(store.provider.root, hourly, daily)
+
+    frames = load_timeframes(store, TICKER)
+
+    assert sorted(store.provider.intervals) == ['1d', '1d', '1h', '1h']
+    weekly = slice_period(resample_ohlcv(daily, '1w'), '1y')
+    pd.testing.assert_frame_equal(frames['1w'][weekly.columns], weekly, check_freq=False)
+    four_hour = slice_period(resample_ohlcv(hourly, '4h'), '1y')
+    pd.testing.assert_frame_equal(frames['4h'][four_hour.columns], four_hour, check_freq=False)
+
+
+def test_timeframe_without_ema_200_gets_zero_weight(tmp_path, hourly, daily):
+    # ~120 minggu: EMA 200 mingguan belum terbentuk
+    frames = load_timeframes(_store(tmp_path, hourly, daily.iloc[-600:]), TICKER)
+    assert frames['1w']['EMA_200'].isna().all()
+
+    result = confluence(frames, False, 16000.0)
+
+    assert result['incomplete'] == ['1w']
+    weights = {r['timeframe']: r['weight'] for r in result['timeframes']}
+    assert weights == {'4h': DEFAULT_WEIGHTS['4h'], '1d': DEFAULT_WEIGHTS['1d'], '1w': 0.0}
+    scores = {tf: int(analyze_signal(df, False, 16000.0)[0]) for tf, df in frames.items()}
+    assert {r['timeframe']: r['score'] for r in result['timeframes']} == scores
+    assert result['score'] == round((scores['4h'] * weights['4h'] + scores['1d'] * weights['1d'])
+                                    / (weights['4h'] + weights['1d']))
+    assert 0.0 <= result['agreement'] <= 1.0
+
+
+def test_all_incomplete_keeps_default_weights(tmp_path, hourly, daily):
+    frames = load_timeframes(_store(tmp_path, hourly.iloc[-300:], daily.iloc[-150:]), TICKER, timeframes=('4h', '1d'))
+
+    result = confluence(frames, False, 16000.0)
+
+    assert result['incomplete'] == ['4h', '1d']
+    assert [r['weight'] for r in result['timeframes']] == [DEFAULT_WEIGHTS['4h'], DEFAULT_WEIGHTS['1d']]
+    with pytest.raises(ValueError):
+        confluence({}, False, 16000.0)